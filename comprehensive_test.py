@@ -47,7 +47,7 @@ class SQLiteTestPopulator(DatabasePopulator):
         used_emails = set()
         
         for i in range(num_employees):
-            employee_id = f"FISST{str(i+1).zfill(4)}"
+            employee_id = f"FISST{i + 1:04d}"
             name = self.fake.indian_name()
             
             # Generate unique email
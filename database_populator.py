@@ -13,6 +13,51 @@ import mysql.connector
 import psycopg2
 from psycopg2.extras import RealDictCursor
 
+# INSERT column order; generated row tuples must follow the same order
+EMPLOYEE_COLUMNS = (
+    'employee_id', 'first_name', 'last_name', 'gender', 'date_of_birth', 'age', 'blood_group',
+    'marital_status', 'email', 'phone_number', 'address', 'state', 'postal_code', 'country',
+    'designation', 'department', 'salary', 'work_experience_years', 'joining_date',
+    'emergency_contact_name', 'emergency_contact_phone', 'family_details', 'medical_conditions',
+    'simulation_type', 'work_email', 'personal_email', 'click_response_rate',
+    'phish_test_simulation_date', 'phish_testing_status', 'vishing_phone_number',
+    'vishing_alt_phone_number', 'voice_auth_test', 'vish_response_rate',
+    'vish_test_simulation_date', 'vish_testing_status', 'branch_location', 'branch_code',
+    'total_employees_at_branch', 'security_level', 'building_storeys', 'assessment_date',
+    'assessment_time_start', 'assessment_time_end', 'permission_granted', 'approving_official_name',
+    'approving_official_designation', 'identity_verification_required', 'identity_verified',
+    'security_guard_present', 'visitor_log_maintained', 'badge_issued', 'escort_required',
+    'restricted_areas_accessed', 'tailgating_possible', 'social_engineering_successful',
+    'physical_security_score', 'human_security_score', 'overall_assessment_score',
+    'vulnerabilities_found', 'recommendations', 'assessor_name', 'assessor_id', 'notes',
+    'red_team_testing_status',
+)
+
+PHISH_SMISH_COLUMNS = (
+    'employee_id', 'simulation_type', 'work_email', 'personal_email', 'click_response_rate',
+    'testing_status',
+)
+
+VISHING_COLUMNS = (
+    'employee_id', 'phone_number', 'alt_phone_number', 'vish_response_rate', 'testing_status',
+)
+
+QUISHING_COLUMNS = (
+    'employee_id', 'qr_code_type', 'qr_scan_rate', 'malicious_qr_clicked', 'device_type',
+    'testing_status', 'simulation_date',
+)
+
+RED_TEAM_COLUMNS = (
+    'employee_id', 'branch_code', 'local_employees_at_branch', 'security_level', 'building_storeys',
+    'assessment_date', 'assessment_time_start', 'assessment_time_end', 'permission_granted',
+    'approving_official_name', 'approving_official_designation', 'identity_verification_required',
+    'identity_verified', 'security_guard_present', 'visitor_log_maintained', 'badge_issued',
+    'escort_required', 'restricted_areas_accessed', 'tailgating_possible',
+    'social_engineering_successful', 'physical_security_score', 'human_security_score',
+    'overall_assessment_score', 'vulnerabilities_found', 'recommendations', 'assessor_name',
+    'assessor_id', 'notes', 'testing_status',
+)
+
 
 class IndianDataProvider(BaseProvider):
     """Custom Faker provider for Indian-specific data"""
@@ -52,6 +97,8 @@ class DatabasePopulator:
         self.connection = None
         self.cursor = None
         self.db_type = None
+        # Set while a caller wraps several generate_* calls in one transaction
+        self.in_bulk_load = False
         
     def get_database_config(self):
         """Get database connection details from user"""
@@ -720,6 +767,18 @@ class DatabasePopulator:
         
         return variations
     
+    def bulk_generate_names(self, n):
+        """Generate n Indian full names in one pass, matching fake.indian_name()"""
+        first_names = random.choices(IndianDataProvider.indian_first_names, k=n)
+        last_names = random.choices(IndianDataProvider.indian_last_names, k=n)
+        return [f"{first_name} {last_name}" for first_name, last_name in zip(first_names, last_names)]
+    
+    def bulk_generate_phones(self, n):
+        """Generate n Indian phone numbers in one pass, matching fake.indian_phone()"""
+        prefixes = random.choices(range(70000, 100000), k=n)
+        suffixes = random.choices(range(10000, 100000), k=n)
+        return [f"+91 {prefix}{suffix}" for prefix, suffix in zip(prefixes, suffixes)]
+    
     def generate_employees(self, num_employees):
         """Generate employee master data based on ER diagram"""
         # Get consistent statistics for this run
@@ -735,13 +794,22 @@ class DatabasePopulator:
         employees_data = []
         used_emails = set()
         
+        # Names and phone numbers for every employee drawn up front instead of through Faker per row
+        first_names = random.choices(IndianDataProvider.indian_first_names, k=num_employees)
+        last_names = random.choices(IndianDataProvider.indian_last_names, k=num_employees)
+        emergency_contact_names = self.bulk_generate_names(num_employees)
+        approving_official_names = self.bulk_generate_names(num_employees)
+        assessor_names = self.bulk_generate_names(num_employees)
+        phone_numbers = self.bulk_generate_phones(num_employees)
+        emergency_contact_phones = self.bulk_generate_phones(num_employees)
+        vishing_alt_phone_numbers = self.bulk_generate_phones(num_employees)
+        
         for i in range(num_employees):
             employee_id = i + 1  # Integer employee_id starting from 1
             
-            # Generate Indian name components
-            name_parts = self.fake.indian_name().split()
-            first_name = name_parts[0]
-            last_name = name_parts[1] if len(name_parts) > 1 else 'Kumar'
+            # Indian name components
+            first_name = first_names[i]
+            last_name = last_names[i]
             
             # Generate unique emails
             base_work_email = f"{first_name.lower()}.{last_name.lower()}"
@@ -761,7 +829,7 @@ class DatabasePopulator:
             age = 2024 - date_of_birth.year
             blood_group = random.choice(blood_groups)
             marital_status = random.choice(marital_statuses)
-            phone_number = self.fake.indian_phone()
+            phone_number = phone_numbers[i]
             city = self.fake.indian_city()
             address = f"{random.randint(1, 999)}, {self.fake.street_name()}, {city}"
             state = random.choice(indian_states)
@@ -774,8 +842,8 @@ class DatabasePopulator:
             joining_date = self.fake.date_between(start_date='-10y', end_date='today')
             
             # Emergency contact
-            emergency_contact_name = self.fake.indian_name()
-            emergency_contact_phone = self.fake.indian_phone()
+            emergency_contact_name = emergency_contact_names[i]
+            emergency_contact_phone = emergency_contact_phones[i]
             
             # Family and medical details
             family_details = f"Family of {random.randint(2, 6)} members"
@@ -790,7 +858,7 @@ class DatabasePopulator:
             
             # Vishing data with consistent stats
             vishing_phone_number = phone_number
-            vishing_alt_phone_number = self.fake.indian_phone()
+            vishing_alt_phone_number = vishing_alt_phone_numbers[i]
             voice_auth_test = random.choice([True, False])
             base_vish_rate = consistent_stats['vishing_response_rate']
             vish_response_rate = random.uniform(base_vish_rate - 1, base_vish_rate + 1)  # Small individual variation
@@ -810,7 +878,7 @@ class DatabasePopulator:
             assessment_time_start = self.fake.time()
             assessment_time_end = self.fake.time()
             permission_granted = random.choice([True, False])
-            approving_official_name = self.fake.indian_name()
+            approving_official_name = approving_official_names[i]
             approving_official_designation = random.choice(['Manager', 'Director', 'VP', 'Senior Manager'])
             
             # Security flags
@@ -841,7 +909,7 @@ class DatabasePopulator:
                 'Improve visitor access controls', 'Regular security assessments',
                 'Employee awareness programs', 'Continue current practices'
             ])
-            assessor_name = self.fake.indian_name()
+            assessor_name = assessor_names[i]
             assessor_id = f"ASST{random.randint(1, 20):02d}"
             notes = f"Assessment completed for {department} department employee"
             red_team_testing_status = 'Completed'
@@ -864,27 +932,8 @@ class DatabasePopulator:
             ))
         
         try:
-            sql = """
-            INSERT INTO employee_master (
-                employee_id, first_name, last_name, gender, date_of_birth, age, blood_group, marital_status,
-                email, phone_number, address, state, postal_code, country, designation, department,
-                salary, work_experience_years, joining_date, emergency_contact_name, emergency_contact_phone,
-                family_details, medical_conditions, simulation_type, work_email, personal_email,
-                click_response_rate, phish_test_simulation_date, phish_testing_status,
-                vishing_phone_number, vishing_alt_phone_number, voice_auth_test, vish_response_rate,
-                vish_test_simulation_date, vish_testing_status, branch_location, branch_code,
-                total_employees_at_branch, security_level, building_storeys, assessment_date,
-                assessment_time_start, assessment_time_end, permission_granted, approving_official_name,
-                approving_official_designation, identity_verification_required, identity_verified,
-                security_guard_present, visitor_log_maintained, badge_issued, escort_required,
-                restricted_areas_accessed, tailgating_possible, social_engineering_successful,
-                physical_security_score, human_security_score, overall_assessment_score,
-                vulnerabilities_found, recommendations, assessor_name, assessor_id, notes, red_team_testing_status
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            
-            self.cursor.executemany(sql, employees_data)
-            self.connection.commit()
+            self._bulk_insert('employee_master', EMPLOYEE_COLUMNS, employees_data)
+            self._commit()
             print(f"✓ Generated {num_employees} employees in employee_master table!")
             return True
             
@@ -923,13 +972,8 @@ class DatabasePopulator:
                 ))
         
         try:
-            sql = """
-            INSERT INTO employee_phish_smish_sim (employee_id, simulation_type, work_email, personal_email, click_response_rate, testing_status)
-            VALUES (%s, %s, %s, %s, %s, %s)
-            """
-            
-            self.cursor.executemany(sql, sim_data)
-            self.connection.commit()
+            self._bulk_insert('employee_phish_smish_sim', PHISH_SMISH_COLUMNS, sim_data)
+            self._commit()
             print(f"✓ Generated {len(sim_data)} phishing/smishing simulation entries!")
             return True
             
@@ -965,13 +1009,8 @@ class DatabasePopulator:
                 ))
         
         try:
-            sql = """
-            INSERT INTO employee_vishing_sim (employee_id, phone_number, alt_phone_number, vish_response_rate, testing_status)
-            VALUES (%s, %s, %s, %s, %s)
-            """
-            
-            self.cursor.executemany(sql, sim_data)
-            self.connection.commit()
+            self._bulk_insert('employee_vishing_sim', VISHING_COLUMNS, sim_data)
+            self._commit()
             print(f"✓ Generated {len(sim_data)} vishing simulation entries!")
             return True
             
@@ -1014,13 +1053,8 @@ class DatabasePopulator:
                 ))
         
         try:
-            sql = """
-            INSERT INTO employee_quishing_sim (employee_id, qr_code_type, qr_scan_rate, malicious_qr_clicked, device_type, testing_status, simulation_date)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """
-            
-            self.cursor.executemany(sql, sim_data)
-            self.connection.commit()
+            self._bulk_insert('employee_quishing_sim', QUISHING_COLUMNS, sim_data)
+            self._commit()
             print(f"✓ Generated {len(sim_data)} quishing simulation entries!")
             return True
             
@@ -1100,20 +1134,8 @@ class DatabasePopulator:
                 ))
         
         try:
-            sql = """
-            INSERT INTO red_team_assessment (
-                employee_id, branch_code, local_employees_at_branch, security_level, building_storeys,
-                assessment_date, assessment_time_start, assessment_time_end, permission_granted,
-                approving_official_name, approving_official_designation, identity_verification_required,
-                identity_verified, security_guard_present, visitor_log_maintained, badge_issued,
-                escort_required, restricted_areas_accessed, tailgating_possible, social_engineering_successful,
-                physical_security_score, human_security_score, overall_assessment_score,
-                vulnerabilities_found, recommendations, assessor_name, assessor_id, notes, testing_status
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            
-            self.cursor.executemany(sql, assessment_data)
-            self.connection.commit()
+            self._bulk_insert('red_team_assessment', RED_TEAM_COLUMNS, assessment_data)
+            self._commit()
             print(f"✓ Generated {len(assessment_data)} red team assessment entries!")
             return True
             
@@ -1122,6 +1144,16 @@ class DatabasePopulator:
             self.connection.rollback()
             return False
     
+    def _bulk_insert(self, table, columns, rows):
+        """Insert rows into table; columns gives the order of each row tuple"""
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+        self.cursor.executemany(sql, rows)
+    
+    def _commit(self):
+        """Commit unless a bulk load owns the transaction"""
+        if not self.in_bulk_load:
+            self.connection.commit()
+    
     def display_existing_data(self):
         """Display summary of existing data"""
         print("\n=== Existing Data Summary ===")
@@ -19,7 +19,7 @@ def demo_indian_data_generation():
     
     print("Sample Indian Employee Data:")
     for i in range(5):
-        employee_id = f"FISST{str(i+1).zfill(4)}"
+        employee_id = f"FISST{i + 1:04d}"
         name = fake.indian_name()
         email = f"{name.lower().replace(' ', '.')}@fisst.edu"
         phone = fake.indian_phone()
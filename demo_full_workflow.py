@@ -83,7 +83,7 @@ class SQLiteDemoPopulator(DatabasePopulator):
         used_emails = set()
         
         for i in range(num_employees):
-            employee_id = f"FISST{str(i+1).zfill(4)}"
+            employee_id = f"FISST{i + 1:04d}"
             
             # Generate Indian name components
             name_parts = self.fake.indian_name().split()
@@ -6,11 +6,17 @@ Validates that generated data matches the FISST Academy case study percentages.
 """
 
 import sys
+import argparse
 import os
 import sqlite3
-import statistics
 import random
-from contextlib import contextmanager
+import math
+import itertools
+import io
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager, redirect_stdout
+from dataclasses import dataclass
 from decimal import Decimal
 
 # Add the current directory to Python path
@@ -19,6 +25,106 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from database_populator import DatabasePopulator, IndianDataProvider
 from faker import Faker
 
+# INSERT statements are kept as module constants so every call binds the
+# exact same SQL text and hits sqlite3's statement cache
+_EMPLOYEE_COLUMNS = """
+        employee_id, first_name, last_name, gender, date_of_birth, age, blood_group, marital_status,
+        email, phone_number, address, state, postal_code, country, designation, department,
+        salary, work_experience_years, joining_date, emergency_contact_name, emergency_contact_phone,
+        family_details, medical_conditions, simulation_type, work_email, personal_email,
+        click_response_rate, phish_test_simulation_date, phish_testing_status,
+        vishing_phone_number, vishing_alt_phone_number, voice_auth_test, vish_response_rate,
+        vish_test_simulation_date, vish_testing_status, branch_location, branch_code,
+        total_employees_at_branch, security_level, building_storeys, assessment_date,
+        assessment_time_start, assessment_time_end, permission_granted, approving_official_name,
+        approving_official_designation, identity_verification_required, identity_verified,
+        security_guard_present, visitor_log_maintained, badge_issued, escort_required,
+        restricted_areas_accessed, tailgating_possible, social_engineering_successful,
+        physical_security_score, human_security_score, overall_assessment_score,
+        vulnerabilities_found, recommendations, assessor_name, assessor_id, notes, red_team_testing_status
+"""
+
+_EMPLOYEE_INSERT_SQL = (
+    f"INSERT INTO employee_master ({_EMPLOYEE_COLUMNS}) "
+    f"VALUES ({', '.join(['?'] * 64)})"
+)
+
+_PHISH_INSERT_SQL = """
+    INSERT INTO employee_phish_smish_sim (employee_id, simulation_type, work_email, personal_email, click_response_rate, testing_status)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_VISH_INSERT_SQL = """
+    INSERT INTO employee_vishing_sim (employee_id, phone_number, alt_phone_number, vish_response_rate, testing_status)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_QUISH_INSERT_SQL = """
+    INSERT INTO employee_quishing_sim (employee_id, qr_code_type, qr_scan_rate, malicious_qr_clicked, device_type, testing_status, simulation_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_RT_INSERT_SQL = """
+    INSERT INTO red_team_assessment (
+        employee_id, branch_code, local_employees_at_branch, security_level, building_storeys,
+        assessment_date, assessment_time_start, assessment_time_end, permission_granted,
+        approving_official_name, approving_official_designation, identity_verification_required,
+        identity_verified, security_guard_present, visitor_log_maintained, badge_issued,
+        escort_required, restricted_areas_accessed, tailgating_possible, social_engineering_successful,
+        physical_security_score, human_security_score, overall_assessment_score,
+        vulnerabilities_found, recommendations, assessor_name, assessor_id, notes, testing_status
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# run_metrics statements run for every generator and every test; sqlite3 prepares
+# each once per connection and reuses the cached statement for identical SQL text
+_RUN_METRICS_INSERT_SQL = "INSERT OR REPLACE INTO run_metrics (metric_name, total, row_count) VALUES (?, ?, ?)"
+_RUN_METRICS_SELECT_SQL = "SELECT metric_name, total, row_count FROM run_metrics"
+
+# The same metrics aggregated from the stored rows, one scan per table; only
+# test_recorded_metrics_match_stored_rows runs this, to check the recorded totals
+_ER_METRICS_SQL = """
+    SELECT
+        em.click_total, em.employees, ps.click_total, ps.sims, vs.vish_total, vs.sims,
+        qs.scan_total, qs.malicious_clicks, qs.total_qr_sims,
+        rt.physical_total, rt.human_total, rt.overall_total, rt.total_assessments
+    FROM
+        (SELECT SUM(click_response_rate) as click_total, COUNT(*) as employees FROM employee_master) em,
+        (SELECT SUM(click_response_rate) as click_total, COUNT(*) as sims FROM employee_phish_smish_sim) ps,
+        (SELECT SUM(vish_response_rate) as vish_total, COUNT(*) as sims FROM employee_vishing_sim) vs,
+        (SELECT
+            SUM(qr_scan_rate) as scan_total,
+            SUM(CASE WHEN malicious_qr_clicked = 1 THEN 1 ELSE 0 END) as malicious_clicks,
+            COUNT(*) as total_qr_sims
+         FROM employee_quishing_sim) qs,
+        (SELECT
+            SUM(physical_security_score) as physical_total,
+            SUM(human_security_score) as human_total,
+            SUM(overall_assessment_score) as overall_total,
+            COUNT(*) as total_assessments
+         FROM red_team_assessment) rt
+"""
+
+
+# Bound parameters per statement on SQLite builds older than 3.32
+SQLITE_MAX_VARIABLES = 999
+
+
+def _multi_row_sql(sql):
+    """Expand a single-row VALUES insert into (multi-row SQL, rows per chunk) under SQLite's parameter limit"""
+    head, values = sql.rsplit('VALUES', 1)
+    rows = SQLITE_MAX_VARIABLES // sql.count('?')
+    return head + 'VALUES ' + ', '.join([values.strip()] * rows), rows
+
+
+# Employee and simulation rows are written a chunk at a time through one wide multi-row
+# VALUES statement per table, built once here from the single-row SQL
+_EMPLOYEE_CHUNK_INSERT = _multi_row_sql(_EMPLOYEE_INSERT_SQL)
+_PHISH_CHUNK_INSERT = _multi_row_sql(_PHISH_INSERT_SQL)
+_VISH_CHUNK_INSERT = _multi_row_sql(_VISH_INSERT_SQL)
+_QUISH_CHUNK_INSERT = _multi_row_sql(_QUISH_INSERT_SQL)
+_RT_CHUNK_INSERT = _multi_row_sql(_RT_INSERT_SQL)
+
 
 class SQLiteERTestPopulator(DatabasePopulator):
     """Modified DatabasePopulator for ER diagram schema testing with SQLite"""
@@ -33,12 +139,39 @@ class SQLiteERTestPopulator(DatabasePopulator):
             self.connection = sqlite3.connect(':memory:')
             self.connection.row_factory = sqlite3.Row
             self.cursor = self.connection.cursor()
+            self.cursor.execute("""
+                CREATE TABLE IF NOT EXISTS run_metrics (
+                    metric_name VARCHAR(50) PRIMARY KEY,
+                    total REAL,
+                    row_count INTEGER
+                )
+            """)
             print("✓ Connected to in-memory SQLite database for testing")
             return True
         except Exception as e:
             print(f"✗ Failed to connect to test database: {e}")
             return False
     
+    def _insert_rows(self, sql, chunk_insert, rows):
+        """Insert rows in full multi-row chunks, finishing the remainder row by row"""
+        chunk_sql, chunk_rows = chunk_insert
+        full = len(rows) - len(rows) % chunk_rows
+        for start in range(0, full, chunk_rows):
+            chunk = rows[start:start + chunk_rows]
+            self.cursor.execute(chunk_sql, list(itertools.chain.from_iterable(chunk)))
+        self.cursor.executemany(sql, rows[full:])
+    
+    def delete_all_data(self):
+        """Delete all generated data, including the recorded run metrics"""
+        self.cursor.execute("DELETE FROM run_metrics")
+        return super().delete_all_data()
+    
+    def _record_metric(self, metric_name, total, row_count):
+        """Store a running total gathered during generation in run_metrics"""
+        self.cursor.execute(
+            _RUN_METRICS_INSERT_SQL, (metric_name, total, row_count)
+        )
+    
     def _get_employee_master_table_sql(self):
         """SQLite version of employee_master table"""
         return """
@@ -205,11 +338,15 @@ class SQLiteERTestPopulator(DatabasePopulator):
         branch_codes = ['MUM01', 'DEL02', 'BLR03', 'HYD04', 'CHN05', 'KOL06', 'PUN07', 'AHM08']
         branch_locations = ['Mumbai', 'Delhi', 'Bangalore', 'Hyderabad', 'Chennai', 'Kolkata', 'Pune', 'Ahmedabad']
         
-        employees_data = []
+        employee_ids = [f"FISST{n:04d}" for n in range(1, num_employees + 1)]
+        assessor_ids = [f"ASST{n:02d}" for n in range(1, 21)]
+        
+        employees_data = [None] * num_employees
         used_emails = set()
+        click_total = 0.0
         
         for i in range(num_employees):
-            employee_id = f"FISST{str(i+1).zfill(4)}"
+            employee_id = employee_ids[i]
             
             # Generate Indian name components
             name_parts = self.fake.indian_name().split()
@@ -257,6 +394,7 @@ class SQLiteERTestPopulator(DatabasePopulator):
             # Simulation data - baseline values
             simulation_type = 'Baseline Assessment'
             click_response_rate = random.uniform(21, 25)  # Updated: 21-25% for phishing baseline
+            click_total += click_response_rate
             phish_test_simulation_date = self.fake.date_between(start_date='-6m', end_date='-3m')
             phish_testing_status = 'Completed'
             
@@ -311,48 +449,30 @@ class SQLiteERTestPopulator(DatabasePopulator):
                 'Employee awareness programs', 'Continue current practices'
             ])
             assessor_name = self.fake.indian_name()
-            assessor_id = f"ASST{random.randint(1, 20):02d}"
+            assessor_id = random.choice(assessor_ids)
             notes = f"Assessment completed for {department} department employee"
             red_team_testing_status = 'Completed'
             
-            employees_data.append((
-                employee_id, first_name, last_name, gender, str(date_of_birth), age, blood_group, marital_status,
+            employees_data[i] = (
+                employee_id, first_name, last_name, gender, date_of_birth.isoformat(), age, blood_group, marital_status,
                 email, phone_number, address, state, postal_code, country, designation, department,
-                salary, work_experience_years, str(joining_date), emergency_contact_name, emergency_contact_phone,
+                salary, work_experience_years, joining_date.isoformat(), emergency_contact_name, emergency_contact_phone,
                 family_details, medical_conditions, simulation_type, work_email, personal_email,
-                click_response_rate, str(phish_test_simulation_date), phish_testing_status,
+                click_response_rate, phish_test_simulation_date.isoformat(), phish_testing_status,
                 vishing_phone_number, vishing_alt_phone_number, voice_auth_test, vish_response_rate,
-                str(vish_test_simulation_date), vish_testing_status, branch_location, branch_code,
-                total_employees_at_branch, security_level, building_storeys, str(assessment_date),
-                str(assessment_time_start), str(assessment_time_end), permission_granted, approving_official_name,
+                vish_test_simulation_date.isoformat(), vish_testing_status, branch_location, branch_code,
+                total_employees_at_branch, security_level, building_storeys, assessment_date.isoformat(),
+                assessment_time_start, assessment_time_end, permission_granted, approving_official_name,
                 approving_official_designation, identity_verification_required, identity_verified,
                 security_guard_present, visitor_log_maintained, badge_issued, escort_required,
                 restricted_areas_accessed, tailgating_possible, social_engineering_successful,
                 physical_security_score, human_security_score, overall_assessment_score,
                 vulnerabilities_found, recommendations, assessor_name, assessor_id, notes, red_team_testing_status
-            ))
+            )
         
         try:
-            sql = """
-            INSERT INTO employee_master (
-                employee_id, first_name, last_name, gender, date_of_birth, age, blood_group, marital_status,
-                email, phone_number, address, state, postal_code, country, designation, department,
-                salary, work_experience_years, joining_date, emergency_contact_name, emergency_contact_phone,
-                family_details, medical_conditions, simulation_type, work_email, personal_email,
-                click_response_rate, phish_test_simulation_date, phish_testing_status,
-                vishing_phone_number, vishing_alt_phone_number, voice_auth_test, vish_response_rate,
-                vish_test_simulation_date, vish_testing_status, branch_location, branch_code,
-                total_employees_at_branch, security_level, building_storeys, assessment_date,
-                assessment_time_start, assessment_time_end, permission_granted, approving_official_name,
-                approving_official_designation, identity_verification_required, identity_verified,
-                security_guard_present, visitor_log_maintained, badge_issued, escort_required,
-                restricted_areas_accessed, tailgating_possible, social_engineering_successful,
-                physical_security_score, human_security_score, overall_assessment_score,
-                vulnerabilities_found, recommendations, assessor_name, assessor_id, notes, red_team_testing_status
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            
-            self.cursor.executemany(sql, employees_data)
+            self._insert_rows(_EMPLOYEE_INSERT_SQL, _EMPLOYEE_CHUNK_INSERT, employees_data)
+            self._record_metric('baseline_click_rate', click_total, num_employees)
             self.connection.commit()
             print(f"✓ Generated {num_employees} employees in employee_master table!")
             return True
@@ -364,34 +484,37 @@ class SQLiteERTestPopulator(DatabasePopulator):
     
     def generate_phish_smish_simulations(self, employee_ids):
         """Generate phishing/smishing simulation data - SQLite version"""
-        sim_data = []
         simulation_types = ['Email Phishing', 'SMS Phishing', 'Social Media Phishing']
         testing_statuses = ['Completed', 'Pending', 'Failed', 'Passed']
         
-        for employee_id in employee_ids:
-            for _ in range(random.randint(2, 4)):
+        # Draw every employee's simulation count up front so the buffer is sized once
+        counts = random.choices(range(2, 5), k=len(employee_ids))
+        sim_data = [None] * sum(counts)
+        idx = 0
+        click_total = 0.0
+        
+        for employee_id, count in zip(employee_ids, counts):
+            for _ in range(count):
                 work_email = f"{employee_id.lower().replace('fisst', 'emp')}@fisst.edu"
                 personal_email = f"{employee_id.lower().replace('fisst', 'emp')}@gmail.com"
                 
                 # Updated failure rates: 21-25% for phishing/smishing simulations
                 click_response_rate = random.uniform(21, 25)
+                click_total += click_response_rate
                 
-                sim_data.append((
+                sim_data[idx] = (
                     employee_id,
                     random.choice(simulation_types),
                     work_email,
                     personal_email,
                     click_response_rate,
                     random.choice(testing_statuses)
-                ))
+                )
+                idx += 1
         
         try:
-            sql = """
-            INSERT INTO employee_phish_smish_sim (employee_id, simulation_type, work_email, personal_email, click_response_rate, testing_status)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """
-            
-            self.cursor.executemany(sql, sim_data)
+            self._insert_rows(_PHISH_INSERT_SQL, _PHISH_CHUNK_INSERT, sim_data)
+            self._record_metric('simulation_click_rate', click_total, len(sim_data))
             self.connection.commit()
             print(f"✓ Generated {len(sim_data)} phishing/smishing simulation entries!")
             return True
@@ -403,30 +526,32 @@ class SQLiteERTestPopulator(DatabasePopulator):
     
     def generate_vishing_simulations(self, employee_ids):
         """Generate vishing simulation data - SQLite version"""
-        sim_data = []
         testing_statuses = ['Completed', 'Pending', 'Failed', 'Passed']
         
-        for employee_id in employee_ids:
-            for _ in range(random.randint(1, 3)):
+        counts = random.choices(range(1, 4), k=len(employee_ids))
+        sim_data = [None] * sum(counts)
+        idx = 0
+        vish_total = 0.0
+        
+        for employee_id, count in zip(employee_ids, counts):
+            for _ in range(count):
                 phone_number = self.fake.indian_phone()
                 alt_phone_number = self.fake.indian_phone()
                 vish_response_rate = random.uniform(26, 30)  # Updated: 26-30% for vishing simulations
+                vish_total += vish_response_rate
                 
-                sim_data.append((
+                sim_data[idx] = (
                     employee_id,
                     phone_number,
                     alt_phone_number,
                     vish_response_rate,
                     random.choice(testing_statuses)
-                ))
+                )
+                idx += 1
         
         try:
-            sql = """
-            INSERT INTO employee_vishing_sim (employee_id, phone_number, alt_phone_number, vish_response_rate, testing_status)
-            VALUES (?, ?, ?, ?, ?)
-            """
-            
-            self.cursor.executemany(sql, sim_data)
+            self._insert_rows(_VISH_INSERT_SQL, _VISH_CHUNK_INSERT, sim_data)
+            self._record_metric('vishing_response_rate', vish_total, len(sim_data))
             self.connection.commit()
             print(f"✓ Generated {len(sim_data)} vishing simulation entries!")
             return True
@@ -438,37 +563,42 @@ class SQLiteERTestPopulator(DatabasePopulator):
     
     def generate_quishing_simulations(self, employee_ids):
         """Generate quishing simulation data - SQLite version"""
-        sim_data = []
         qr_code_types = ['Payment QR', 'WiFi QR', 'App Download QR', 'Survey QR', 'Menu QR', 'Contact QR']
         device_types = ['Mobile Phone', 'Tablet', 'Laptop', 'Desktop']
         testing_statuses = ['Completed', 'Pending', 'Failed', 'Passed']
         
-        for employee_id in employee_ids:
-            for _ in range(random.randint(1, 2)):
+        counts = random.choices(range(1, 3), k=len(employee_ids))
+        sim_data = [None] * sum(counts)
+        idx = 0
+        scan_total = 0.0
+        malicious_clicks = 0
+        
+        for employee_id, count in zip(employee_ids, counts):
+            for _ in range(count):
                 qr_code_type = random.choice(qr_code_types)
                 qr_scan_rate = random.uniform(22, 27)  # Updated: 22-27% for quishing simulations
                 malicious_qr_clicked = random.choice([True, False])
+                scan_total += qr_scan_rate
+                malicious_clicks += malicious_qr_clicked
                 device_type = random.choice(device_types)
                 testing_status = random.choice(testing_statuses)
                 simulation_date = self.fake.date_between(start_date='-6m', end_date='today')
                 
-                sim_data.append((
+                sim_data[idx] = (
                     employee_id,
                     qr_code_type,
                     qr_scan_rate,
                     malicious_qr_clicked,
                     device_type,
                     testing_status,
-                    str(simulation_date)
-                ))
+                    simulation_date.isoformat()
+                )
+                idx += 1
         
         try:
-            sql = """
-            INSERT INTO employee_quishing_sim (employee_id, qr_code_type, qr_scan_rate, malicious_qr_clicked, device_type, testing_status, simulation_date)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """
-            
-            self.cursor.executemany(sql, sim_data)
+            self._insert_rows(_QUISH_INSERT_SQL, _QUISH_CHUNK_INSERT, sim_data)
+            self._record_metric('qr_scan_rate', scan_total, len(sim_data))
+            self._record_metric('malicious_qr_clicks', malicious_clicks, len(sim_data))
             self.connection.commit()
             print(f"✓ Generated {len(sim_data)} quishing simulation entries!")
             return True
@@ -480,87 +610,85 @@ class SQLiteERTestPopulator(DatabasePopulator):
     
     def generate_red_team_assessments(self, employee_ids):
         """Generate red team assessment data - SQLite version"""
-        assessment_data = []
         security_levels = ['Low', 'Medium', 'High', 'Critical']
         testing_statuses = ['Completed', 'In Progress', 'Scheduled', 'Cancelled']
         branch_codes = ['MUM01', 'DEL02', 'BLR03', 'HYD04', 'CHN05', 'KOL06', 'PUN07', 'AHM08']
+        assessor_ids = [f"ASST{n:02d}" for n in range(1, 21)]
         
-        for employee_id in employee_ids:
-            if random.random() < 0.7:  # 70% of employees get assessed
-                branch_code = random.choice(branch_codes)
-                local_employees_at_branch = random.randint(15, 50)
-                security_level = random.choice(security_levels)
-                building_storeys = random.randint(1, 10)
-                assessment_date = self.fake.date_between(start_date='-3m', end_date='today')
-                assessment_time_start = self.fake.time()
-                assessment_time_end = self.fake.time()
-                permission_granted = random.choice([True, False])
-                approving_official_name = self.fake.indian_name()
-                approving_official_designation = random.choice(['Manager', 'Director', 'VP', 'Senior Manager'])
-                
-                # Security measures
-                identity_verification_required = True
-                identity_verified = random.choice([True, False])
-                security_guard_present = random.choice([True, False])
-                visitor_log_maintained = True
-                badge_issued = random.choice([True, False])
-                escort_required = random.choice([True, False])
-                restricted_areas_accessed = random.choice([True, False])
-                tailgating_possible = random.choice([True, False])
-                social_engineering_successful = random.choice([True, False])
-                
-                # Assessment scores
-                physical_security_score = random.uniform(6.0, 9.5)
-                human_security_score = random.uniform(7.0, 9.0)
-                overall_assessment_score = (physical_security_score + human_security_score) / 2
-                
-                vulnerabilities_found = random.choice([
-                    'Weak access controls, tailgating possible',
-                    'Social engineering susceptibility',
-                    'Inadequate visitor management',
-                    'Poor workstation security',
-                    'None significant',
-                    'Badge verification issues'
-                ])
-                
-                recommendations = random.choice([
-                    'Implement stricter access controls',
-                    'Enhanced security awareness training',
-                    'Improve visitor management system',
-                    'Regular security audits',
-                    'Deploy additional security measures',
-                    'Continue monitoring'
-                ])
-                
-                assessor_name = self.fake.indian_name()
-                assessor_id = f"ASST{random.randint(1, 20):02d}"
-                notes = f"Red team assessment completed - {security_level} security level facility"
-                testing_status = random.choice(testing_statuses)
-                
-                assessment_data.append((
-                    employee_id, branch_code, local_employees_at_branch, security_level, building_storeys,
-                    str(assessment_date), str(assessment_time_start), str(assessment_time_end), permission_granted,
-                    approving_official_name, approving_official_designation, identity_verification_required,
-                    identity_verified, security_guard_present, visitor_log_maintained, badge_issued,
-                    escort_required, restricted_areas_accessed, tailgating_possible, social_engineering_successful,
-                    physical_security_score, human_security_score, overall_assessment_score,
-                    vulnerabilities_found, recommendations, assessor_name, assessor_id, notes, testing_status
-                ))
+        # 70% of employees get assessed - pick them all in one pass
+        assessed_ids = [employee_id for employee_id in employee_ids if random.random() < 0.7]
+        assessment_data = [None] * len(assessed_ids)
+        physical_total = human_total = overall_total = 0.0
         
-        try:
-            sql = """
-            INSERT INTO red_team_assessment (
+        for idx, employee_id in enumerate(assessed_ids):
+            branch_code = random.choice(branch_codes)
+            local_employees_at_branch = random.randint(15, 50)
+            security_level = random.choice(security_levels)
+            building_storeys = random.randint(1, 10)
+            assessment_date = self.fake.date_between(start_date='-3m', end_date='today')
+            assessment_time_start = self.fake.time()
+            assessment_time_end = self.fake.time()
+            permission_granted = random.choice([True, False])
+            approving_official_name = self.fake.indian_name()
+            approving_official_designation = random.choice(['Manager', 'Director', 'VP', 'Senior Manager'])
+            
+            # Security measures
+            identity_verification_required = True
+            identity_verified = random.choice([True, False])
+            security_guard_present = random.choice([True, False])
+            visitor_log_maintained = True
+            badge_issued = random.choice([True, False])
+            escort_required = random.choice([True, False])
+            restricted_areas_accessed = random.choice([True, False])
+            tailgating_possible = random.choice([True, False])
+            social_engineering_successful = random.choice([True, False])
+            
+            # Assessment scores
+            physical_security_score = random.uniform(6.0, 9.5)
+            human_security_score = random.uniform(7.0, 9.0)
+            overall_assessment_score = (physical_security_score + human_security_score) / 2
+            physical_total += physical_security_score
+            human_total += human_security_score
+            overall_total += overall_assessment_score
+            
+            vulnerabilities_found = random.choice([
+                'Weak access controls, tailgating possible',
+                'Social engineering susceptibility',
+                'Inadequate visitor management',
+                'Poor workstation security',
+                'None significant',
+                'Badge verification issues'
+            ])
+            
+            recommendations = random.choice([
+                'Implement stricter access controls',
+                'Enhanced security awareness training',
+                'Improve visitor management system',
+                'Regular security audits',
+                'Deploy additional security measures',
+                'Continue monitoring'
+            ])
+            
+            assessor_name = self.fake.indian_name()
+            assessor_id = random.choice(assessor_ids)
+            notes = f"Red team assessment completed - {security_level} security level facility"
+            testing_status = random.choice(testing_statuses)
+            
+            assessment_data[idx] = (
                 employee_id, branch_code, local_employees_at_branch, security_level, building_storeys,
-                assessment_date, assessment_time_start, assessment_time_end, permission_granted,
+                assessment_date.isoformat(), assessment_time_start, assessment_time_end, permission_granted,
                 approving_official_name, approving_official_designation, identity_verification_required,
                 identity_verified, security_guard_present, visitor_log_maintained, badge_issued,
                 escort_required, restricted_areas_accessed, tailgating_possible, social_engineering_successful,
                 physical_security_score, human_security_score, overall_assessment_score,
                 vulnerabilities_found, recommendations, assessor_name, assessor_id, notes, testing_status
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            
-            self.cursor.executemany(sql, assessment_data)
+            )
+        
+        try:
+            self._insert_rows(_RT_INSERT_SQL, _RT_CHUNK_INSERT, assessment_data)
+            self._record_metric('physical_security_score', physical_total, len(assessment_data))
+            self._record_metric('human_security_score', human_total, len(assessment_data))
+            self._record_metric('overall_security_score', overall_total, len(assessment_data))
             self.connection.commit()
             print(f"✓ Generated {len(assessment_data)} red team assessment entries!")
             return True
@@ -571,6 +699,23 @@ class SQLiteERTestPopulator(DatabasePopulator):
             return False
 
 
+@dataclass
+class ErMetrics:
+    """Metrics collected from one ER schema test run"""
+    baseline_click_rate: float
+    simulation_click_rate: float
+    vishing_response_rate: float
+    qr_scan_rate: float
+    malicious_qr_clicks: int
+    total_qr_simulations: int
+    physical_security_score: float
+    human_security_score: float
+    overall_security_score: float
+    total_assessments: int
+    employee_count: int
+    test_num: int = -1
+
+
 @contextmanager
 def test_er_database_populator(num_employees):
     """Context manager for testing ER diagram database populator"""
@@ -587,113 +732,144 @@ def test_er_database_populator(num_employees):
         populator.close_connection()
 
 
-def run_single_er_test(test_num, num_employees):
-    """Run a single test with the ER diagram schema"""
+def run_single_er_test(populator, test_num, num_employees):
+    """Run a single test with the ER diagram schema on an open populator"""
     print(f"\n{'='*15} ER SCHEMA TEST {test_num}: {num_employees} Employees {'='*15}")
     
-    with test_er_database_populator(num_employees) as (populator, employee_count):
-        # Generate data
-        if not populator.generate_employees(employee_count):
-            print(f"✗ Test {test_num}: Failed to generate employees")
-            return None
+    # Start from empty tables - the connection is shared across all test configurations
+    if not populator.delete_all_data():
+        print(f"✗ Test {test_num}: Failed to clear previous data")
+        return None
+    
+    # Generate data
+    if not populator.generate_employees(num_employees):
+        print(f"✗ Test {test_num}: Failed to generate employees")
+        return None
+    
+    employee_ids = populator.get_employee_ids()
+    if not employee_ids:
+        print(f"✗ Test {test_num}: No employee IDs found")
+        return None
+    
+    if not (populator.generate_phish_smish_simulations(employee_ids) and
+            populator.generate_vishing_simulations(employee_ids) and
+            populator.generate_quishing_simulations(employee_ids) and
+            populator.generate_red_team_assessments(employee_ids)):
+        print(f"✗ Test {test_num}: Failed to generate complete data")
+        return None
+    
+    # Get detailed metrics for ER schema
+    try:
+        # The generators recorded their running totals, so no table is re-scanned here
+        populator.cursor.execute(_RUN_METRICS_SELECT_SQL)
+        run_metrics = {row[0]: (row[1], row[2]) for row in populator.cursor.fetchall()}
         
-        employee_ids = populator.get_employee_ids()
-        if not employee_ids:
-            print(f"✗ Test {test_num}: No employee IDs found")
-            return None
+        def average(metric_name):
+            total, row_count = run_metrics.get(metric_name, (0, 0))
+            return float(total) / row_count if row_count else 0
         
-        if not (populator.generate_phish_smish_simulations(employee_ids) and
-                populator.generate_vishing_simulations(employee_ids) and
-                populator.generate_quishing_simulations(employee_ids) and
-                populator.generate_red_team_assessments(employee_ids)):
-            print(f"✗ Test {test_num}: Failed to generate complete data")
-            return None
+        baseline_click = average('baseline_click_rate')
+        sim_click = average('simulation_click_rate')
+        vish_rate = average('vishing_response_rate')
+        qr_scan_rate = average('qr_scan_rate')
+        malicious_clicks, total_qr_sims = run_metrics.get('malicious_qr_clicks', (0, 0))
+        malicious_clicks = int(malicious_clicks)
+        avg_physical = average('physical_security_score')
+        avg_human = average('human_security_score')
+        avg_overall = average('overall_security_score')
+        total_assessments = run_metrics.get('physical_security_score', (0, 0))[1]
         
-        # Get detailed metrics for ER schema
-        try:
-            # Phishing metrics from employee_master (baseline data)
-            populator.cursor.execute("""
-                SELECT AVG(click_response_rate) as avg_baseline_click 
-                FROM employee_master
-            """)
-            baseline_result = populator.cursor.fetchone()
-            baseline_click = float(baseline_result[0]) if baseline_result[0] else 0
-            
-            # Phishing metrics from simulation table
-            populator.cursor.execute("""
-                SELECT AVG(click_response_rate) as avg_sim_click 
-                FROM employee_phish_smish_sim
-            """)
-            sim_result = populator.cursor.fetchone()
-            sim_click = float(sim_result[0]) if sim_result[0] else 0
-            
-            # Vishing metrics
-            populator.cursor.execute("""
-                SELECT AVG(vish_response_rate) as avg_vish_rate 
-                FROM employee_vishing_sim
-            """)
-            vish_result = populator.cursor.fetchone()
-            vish_rate = float(vish_result[0]) if vish_result[0] else 0
-            
-            # Quishing metrics
-            populator.cursor.execute("""
-                SELECT 
-                    AVG(qr_scan_rate) as avg_qr_scan,
-                    COUNT(CASE WHEN malicious_qr_clicked = 1 THEN 1 END) as malicious_clicks,
-                    COUNT(*) as total_qr_sims
-                FROM employee_quishing_sim
-            """)
-            qr_result = populator.cursor.fetchone()
-            qr_scan_rate = float(qr_result[0]) if qr_result[0] else 0
-            malicious_clicks = int(qr_result[1]) if qr_result[1] else 0
-            total_qr_sims = int(qr_result[2]) if qr_result[2] else 0
-            
-            # Red team assessment scores
-            populator.cursor.execute("""
-                SELECT 
-                    AVG(physical_security_score) as avg_physical,
-                    AVG(human_security_score) as avg_human,
-                    AVG(overall_assessment_score) as avg_overall,
-                    COUNT(*) as total_assessments
-                FROM red_team_assessment
-            """)
-            assessment_result = populator.cursor.fetchone()
-            avg_physical = float(assessment_result[0]) if assessment_result[0] else 0
-            avg_human = float(assessment_result[1]) if assessment_result[1] else 0
-            avg_overall = float(assessment_result[2]) if assessment_result[2] else 0
-            total_assessments = int(assessment_result[3]) if assessment_result[3] else 0
-            
-            metrics = {
-                'baseline_click_rate': baseline_click,
-                'simulation_click_rate': sim_click,
-                'vishing_response_rate': vish_rate,
-                'qr_scan_rate': qr_scan_rate,
-                'malicious_qr_clicks': malicious_clicks,
-                'total_qr_simulations': total_qr_sims,
-                'physical_security_score': avg_physical,
-                'human_security_score': avg_human,
-                'overall_security_score': avg_overall,
-                'total_assessments': total_assessments,
-                'employee_count': employee_count
-            }
-            
-            # Display results
-            print(f"Results for {employee_count} employees:")
-            print(f"  Employee Master Click Rate: {baseline_click:.2f}% (target: ~22%)")
-            print(f"  Simulation Click Rate: {sim_click:.2f}% (mixed baseline/post-intervention)")
-            print(f"  Vishing Response Rate: {vish_rate:.2f}%")
-            print(f"  QR Scan Rate: {qr_scan_rate:.2f}%, Malicious Clicks: {malicious_clicks}/{total_qr_sims}")
-            print(f"  Security Scores - Physical: {avg_physical:.1f}, Human: {avg_human:.1f}, Overall: {avg_overall:.1f}")
-            print(f"  Red Team Assessments: {total_assessments} completed")
-            
-            return metrics
-            
-        except Exception as e:
-            print(f"✗ Error getting metrics: {e}")
-            return None
+        metrics = ErMetrics(
+            baseline_click_rate=baseline_click,
+            simulation_click_rate=sim_click,
+            vishing_response_rate=vish_rate,
+            qr_scan_rate=qr_scan_rate,
+            malicious_qr_clicks=malicious_clicks,
+            total_qr_simulations=total_qr_sims,
+            physical_security_score=avg_physical,
+            human_security_score=avg_human,
+            overall_security_score=avg_overall,
+            total_assessments=total_assessments,
+            employee_count=num_employees
+        )
+        
+        # Display results
+        print(f"Results for {num_employees} employees:")
+        print(f"  Employee Master Click Rate: {baseline_click:.2f}% (target: ~22%)")
+        print(f"  Simulation Click Rate: {sim_click:.2f}% (mixed baseline/post-intervention)")
+        print(f"  Vishing Response Rate: {vish_rate:.2f}%")
+        print(f"  QR Scan Rate: {qr_scan_rate:.2f}%, Malicious Clicks: {malicious_clicks}/{total_qr_sims}")
+        print(f"  Security Scores - Physical: {avg_physical:.1f}, Human: {avg_human:.1f}, Overall: {avg_overall:.1f}")
+        print(f"  Red Team Assessments: {total_assessments} completed")
+        
+        return metrics
+        
+    except Exception as e:
+        print(f"✗ Error getting metrics: {e}")
+        return None
+
+
+def test_recorded_metrics_match_stored_rows():
+    """Test that the totals recorded in run_metrics agree with the rows actually written"""
+    with test_er_database_populator(60) as (populator, num_employees):
+        assert run_single_er_test(populator, 1, num_employees) is not None, "ER test run failed"
+        
+        populator.cursor.execute(_ER_METRICS_SQL)
+        result = [value or 0 for value in populator.cursor.fetchone()]
+        stored_metrics = {
+            'baseline_click_rate': (result[0], result[1]),
+            'simulation_click_rate': (result[2], result[3]),
+            'vishing_response_rate': (result[4], result[5]),
+            'qr_scan_rate': (result[6], result[8]),
+            'malicious_qr_clicks': (result[7], result[8]),
+            'physical_security_score': (result[9], result[12]),
+            'human_security_score': (result[10], result[12]),
+            'overall_security_score': (result[11], result[12]),
+        }
+        
+        populator.cursor.execute(_RUN_METRICS_SELECT_SQL)
+        run_metrics = {row[0]: (row[1], row[2]) for row in populator.cursor.fetchall()}
+        for metric_name, (total, row_count) in stored_metrics.items():
+            assert metric_name in run_metrics, f"{metric_name} was not recorded"
+            recorded_total, recorded_count = run_metrics[metric_name]
+            assert recorded_count == row_count, f"{metric_name}: {recorded_count} rows recorded, {row_count} stored"
+            assert math.isclose(recorded_total, total, rel_tol=1e-9, abs_tol=1e-6), \
+                f"{metric_name}: recorded total {recorded_total} differs from stored {total}"
+
+
+def _run_isolated_er_test(test_num, num_employees):
+    """Run one ER test on a private in-memory database, returning (metrics, captured output)"""
+    # Worker processes may start from a copy of the parent's RNG state; reseed so
+    # every configuration draws independent data
+    random.seed()
+    Faker.seed()
+    
+    output = io.StringIO()
+    with redirect_stdout(output):
+        with test_er_database_populator(num_employees) as (populator, _):
+            result = run_single_er_test(populator, test_num, num_employees)
+    return result, output.getvalue()
+
+
+def _summary(values):
+    """Return (mean, sample stdev) of a sequence of floats"""
+    count = len(values)
+    if count == 0:
+        return 0.0, 0.0
+    # math.fsum sums in C with exact rounding, so no Fraction-based statistics path is needed
+    mean = math.fsum(values) / count
+    if count == 1:
+        return mean, 0.0
+    variance = math.fsum((value - mean) * (value - mean) for value in values) / (count - 1)
+    return mean, variance ** 0.5
+
 
+def expected_assessment_range(num_employees):
+    """Return (expected red team assessments, allowed deviation) for an employee count"""
+    return int(num_employees * 0.7), num_employees * 0.1  # 70% assessed, 10% variance
 
-def validate_er_metrics(metrics, test_num, num_employees):
+
+def validate_er_metrics(metrics, test_num, num_employees, assessment_target=None):
     """Validate that ER schema metrics meet expected ranges"""
     issues = []
     
@@ -708,15 +884,17 @@ def validate_er_metrics(metrics, test_num, num_employees):
     }
     
     for metric, (min_val, max_val) in expected_ranges.items():
-        if metric in metrics and metrics[metric] is not None:
-            value = metrics[metric]
+        value = getattr(metrics, metric, None)
+        if value is not None:
             if not (min_val <= value <= max_val):
                 issues.append(f"{metric}: {value:.2f} (expected {min_val}-{max_val})")
     
     # Check data volume expectations
-    expected_assessments = int(num_employees * 0.7)  # 70% should get assessed
-    actual_assessments = metrics.get('total_assessments', 0)
-    if abs(actual_assessments - expected_assessments) > num_employees * 0.1:  # Allow 10% variance
+    if assessment_target is None:
+        assessment_target = expected_assessment_range(num_employees)
+    expected_assessments, tolerance = assessment_target
+    actual_assessments = metrics.total_assessments
+    if abs(actual_assessments - expected_assessments) > tolerance:
         issues.append(f"assessments: {actual_assessments} (expected ~{expected_assessments})")
     
     if issues:
@@ -729,7 +907,16 @@ def validate_er_metrics(metrics, test_num, num_employees):
         return True
 
 
-def run_er_comprehensive_tests():
+def parse_args(argv=None):
+    """Parse command-line options for the ER test suite"""
+    parser = argparse.ArgumentParser(description="Run the ER schema comprehensive test suite")
+    parser.add_argument('--serial', action='store_true',
+                        help="Run every configuration in this process on one shared connection "
+                             "instead of one worker process per configuration")
+    return parser.parse_args(argv)
+
+
+def run_er_comprehensive_tests(serial=False):
     """Run comprehensive tests with the ER diagram schema"""
     print("FISST Academy Database Populator - ER Schema Comprehensive Test Suite")
     print("=" * 80)
@@ -752,74 +939,128 @@ def run_er_comprehensive_tests():
         (6, 150)   # Very large dataset
     ]
     
+    # Expected assessment volumes depend only on the configuration, so work them out once
+    assessment_targets = {
+        test_num: expected_assessment_range(employee_count)
+        for test_num, employee_count in test_configs
+    }
+    
     all_results = []
     successful_tests = 0
     
-    for test_num, employee_count in test_configs:
-        try:
-            result = run_single_er_test(test_num, employee_count)
-            if result:
-                result['test_num'] = test_num
-                all_results.append(result)
-                
-                if validate_er_metrics(result, test_num, employee_count):
-                    successful_tests += 1
-            else:
-                print(f"✗ Test {test_num}: Failed to complete")
-        except Exception as e:
-            print(f"✗ Test {test_num}: Exception occurred - {e}")
+    def record_result(test_num, employee_count, result):
+        nonlocal successful_tests
+        if result:
+            result.test_num = test_num
+            all_results.append(result)
+            
+            if validate_er_metrics(result, test_num, employee_count, assessment_targets[test_num]):
+                successful_tests += 1
+        else:
+            print(f"✗ Test {test_num}: Failed to complete")
+    
+    if serial:
+        # One connection and schema serve every configuration; tables are cleared between tests.
+        # Each configuration passes its own employee count to run_single_er_test, so the
+        # context manager is given none
+        with test_er_database_populator(None) as (populator, _):
+            for test_num, employee_count in test_configs:
+                try:
+                    record_result(test_num, employee_count,
+                                  run_single_er_test(populator, test_num, employee_count))
+                except Exception as e:
+                    print(f"✗ Test {test_num}: Exception occurred - {e}")
+    else:
+        # Configurations are independent, so each runs on its own in-memory database in a
+        # worker process; output is replayed in test order once everything has finished
+        outcomes = {}
+        with ProcessPoolExecutor(max_workers=min(len(test_configs), os.cpu_count() or 1)) as executor:
+            futures = {
+                executor.submit(_run_isolated_er_test, test_num, employee_count): test_num
+                for test_num, employee_count in test_configs
+            }
+            for future in as_completed(futures):
+                try:
+                    outcomes[futures[future]] = future.result()
+                except Exception as e:
+                    outcomes[futures[future]] = e
+        
+        for test_num, employee_count in test_configs:
+            outcome = outcomes[test_num]
+            if isinstance(outcome, Exception):
+                print(f"✗ Test {test_num}: Exception occurred - {outcome}")
+                continue
+            result, output = outcome
+            sys.stdout.write(output)
+            record_result(test_num, employee_count, result)
     
-    # Summary analysis
-    print(f"\n{'='*25} ER SCHEMA TEST SUMMARY {'='*25}")
-    print(f"Completed tests: {len(all_results)}/6")
-    print(f"Tests within expected ranges: {successful_tests}/{len(all_results)}")
+    # Summary analysis - built up as a list of lines and written out in one go
+    lines = []
+    lines.append(f"\n{'='*25} ER SCHEMA TEST SUMMARY {'='*25}")
+    lines.append(f"Completed tests: {len(all_results)}/6")
+    lines.append(f"Tests within expected ranges: {successful_tests}/{len(all_results)}")
     
     if all_results:
-        # Calculate aggregate statistics
-        baseline_clicks = [r['baseline_click_rate'] for r in all_results if r['baseline_click_rate']]
-        sim_clicks = [r['simulation_click_rate'] for r in all_results if r['simulation_click_rate']]
-        vish_rates = [r['vishing_response_rate'] for r in all_results if r['vishing_response_rate']]
-        qr_scan_rates = [r['qr_scan_rate'] for r in all_results if r['qr_scan_rate']]
+        # Calculate aggregate statistics - the four rate columns are gathered
+        # in a single pass into compact float arrays
+        baseline_clicks = array('d')
+        sim_clicks = array('d')
+        vish_rates = array('d')
+        qr_scan_rates = array('d')
+        for r in all_results:
+            if r.baseline_click_rate:
+                baseline_clicks.append(r.baseline_click_rate)
+            if r.simulation_click_rate:
+                sim_clicks.append(r.simulation_click_rate)
+            if r.vishing_response_rate:
+                vish_rates.append(r.vishing_response_rate)
+            if r.qr_scan_rate:
+                qr_scan_rates.append(r.qr_scan_rate)
         
-        print(f"\nAggregate Statistics across all tests:")
+        lines.append(f"\nAggregate Statistics across all tests:")
         if baseline_clicks:
-            print(f"Employee Master Click Rate: {statistics.mean(baseline_clicks):.2f}% ± {statistics.stdev(baseline_clicks) if len(baseline_clicks) > 1 else 0:.2f}% (target: ~22%)")
+            mean, stdev = _summary(baseline_clicks)
+            lines.append(f"Employee Master Click Rate: {mean:.2f}% ± {stdev:.2f}% (target: ~22%)")
         if sim_clicks:
-            print(f"Simulation Click Rate: {statistics.mean(sim_clicks):.2f}% ± {statistics.stdev(sim_clicks) if len(sim_clicks) > 1 else 0:.2f}%")
+            mean, stdev = _summary(sim_clicks)
+            lines.append(f"Simulation Click Rate: {mean:.2f}% ± {stdev:.2f}%")
         if vish_rates:
-            print(f"Vishing Response Rate: {statistics.mean(vish_rates):.2f}% ± {statistics.stdev(vish_rates) if len(vish_rates) > 1 else 0:.2f}%")
+            mean, stdev = _summary(vish_rates)
+            lines.append(f"Vishing Response Rate: {mean:.2f}% ± {stdev:.2f}%")
         if qr_scan_rates:
-            print(f"QR Scan Rate: {statistics.mean(qr_scan_rates):.2f}% ± {statistics.stdev(qr_scan_rates) if len(qr_scan_rates) > 1 else 0:.2f}%")
+            mean, stdev = _summary(qr_scan_rates)
+            lines.append(f"QR Scan Rate: {mean:.2f}% ± {stdev:.2f}%")
         
         # Data volume summary
-        total_employees = sum(r['employee_count'] for r in all_results)
-        total_assessments = sum(r['total_assessments'] for r in all_results)
-        total_qr_sims = sum(r['total_qr_simulations'] for r in all_results)
+        total_employees = sum(r.employee_count for r in all_results)
+        total_assessments = sum(r.total_assessments for r in all_results)
+        total_qr_sims = sum(r.total_qr_simulations for r in all_results)
         
-        print(f"\nData Volume Summary:")
-        print(f"Total Employees Generated: {total_employees}")
-        print(f"Total Red Team Assessments: {total_assessments}")
-        print(f"Total QR Simulations: {total_qr_sims}")
+        lines.append(f"\nData Volume Summary:")
+        lines.append(f"Total Employees Generated: {total_employees}")
+        lines.append(f"Total Red Team Assessments: {total_assessments}")
+        lines.append(f"Total QR Simulations: {total_qr_sims}")
         
         # Final assessment
         overall_success = (successful_tests >= 5 and len(all_results) == 6)
         
-        print(f"\n{'='*20} FINAL ER SCHEMA ASSESSMENT {'='*20}")
+        lines.append(f"\n{'='*20} FINAL ER SCHEMA ASSESSMENT {'='*20}")
         if overall_success:
-            print("✅ ER SCHEMA COMPREHENSIVE TEST PASSED")
-            print("✓ Data generation matches ER diagram structure")
-            print("✓ All tables populated with realistic data")
-            print("✓ Metrics align with case study requirements")
-            print("✓ Script is ready for production use with ER schema")
+            lines.append("✅ ER SCHEMA COMPREHENSIVE TEST PASSED")
+            lines.append("✓ Data generation matches ER diagram structure")
+            lines.append("✓ All tables populated with realistic data")
+            lines.append("✓ Metrics align with case study requirements")
+            lines.append("✓ Script is ready for production use with ER schema")
         else:
-            print("❌ ER SCHEMA COMPREHENSIVE TEST NEEDS ATTENTION")
-            print("⚠️ Some metrics may need adjustment")
-            print("⚠️ Review the generation logic for ER schema compliance")
+            lines.append("❌ ER SCHEMA COMPREHENSIVE TEST NEEDS ATTENTION")
+            lines.append("⚠️ Some metrics may need adjustment")
+            lines.append("⚠️ Review the generation logic for ER schema compliance")
     else:
-        print("❌ No tests completed successfully")
+        lines.append("❌ No tests completed successfully")
     
-    print("=" * 80)
+    lines.append("=" * 80)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
-    run_er_comprehensive_tests()
\ No newline at end of file
+    run_er_comprehensive_tests(serial=parse_args().serial)
\ No newline at end of file
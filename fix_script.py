@@ -8,43 +8,48 @@ import os
 import sys
 import subprocess
 import shutil
+import threading
+from collections import deque
+
+
+# Matched against the demo's raw output so lines never need decoding
+DEMO_SUCCESS_SENTINEL = "🎉 Demo completed successfully!".encode('utf-8')
 
 
 def clear_python_cache():
     """Clear Python cache files"""
     print("🧹 Clearing Python cache files...")
     
-    cache_dirs = []
-    cache_files = []
-    
-    # Find and remove __pycache__ directories
-    for root, dirs, files in os.walk('.'):
-        if '__pycache__' in dirs:
-            cache_path = os.path.join(root, '__pycache__')
-            cache_dirs.append(cache_path)
-        
-        # Find .pyc files
-        for file in files:
-            if file.endswith('.pyc'):
-                cache_files.append(os.path.join(root, file))
-    
-    # Remove cache directories
-    for cache_dir in cache_dirs:
-        try:
-            shutil.rmtree(cache_dir)
-            print(f"   ✓ Removed: {cache_dir}")
-        except Exception as e:
-            print(f"   ✗ Failed to remove {cache_dir}: {e}")
+    removed_dirs = 0
+    removed_files = 0
+    pending = ['.']
     
-    # Remove .pyc files
-    for cache_file in cache_files:
-        try:
-            os.remove(cache_file)
-            print(f"   ✓ Removed: {cache_file}")
-        except Exception as e:
-            print(f"   ✗ Failed to remove {cache_file}: {e}")
+    # Walk with os.scandir so entry types come from the directory listing
+    # (no extra stat per file) and delete caches as soon as they are found.
+    # A checkout holds only a handful of cache entries, so removal stays serial
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != '__pycache__':
+                        pending.append(entry.path)
+                        continue
+                    # Removed directories are never descended into
+                    try:
+                        shutil.rmtree(entry.path)
+                        print(f"   ✓ Removed: {entry.path}")
+                        removed_dirs += 1
+                    except Exception as e:
+                        print(f"   ✗ Failed to remove {entry.path}: {e}")
+                elif entry.name.endswith('.pyc'):
+                    try:
+                        os.remove(entry.path)
+                        print(f"   ✓ Removed: {entry.path}")
+                        removed_files += 1
+                    except Exception as e:
+                        print(f"   ✗ Failed to remove {entry.path}: {e}")
     
-    print(f"🧹 Cleared {len(cache_dirs)} cache directories and {len(cache_files)} cache files")
+    print(f"🧹 Cleared {removed_dirs} cache directories and {removed_files} cache files")
 
 
 def verify_installation():
@@ -59,21 +64,14 @@ def verify_installation():
         
         print("   ✓ database_populator.py found")
         
-        # Check Python syntax
+        # Importing the module parses it too, so a syntax error surfaces here as SyntaxError
         try:
-            import ast
-            with open('database_populator.py', 'r') as f:
-                source = f.read()
-            ast.parse(source)
+            from database_populator import DatabasePopulator
             print("   ✓ Python syntax is valid")
+            print("   ✓ Module imports successfully")
         except SyntaxError as e:
             print(f"   ✗ Syntax error in database_populator.py: {e}")
             return False
-        
-        # Try importing the module
-        try:
-            from database_populator import DatabasePopulator
-            print("   ✓ Module imports successfully")
         except ImportError as e:
             print(f"   ✗ Import error: {e}")
             return False
@@ -88,10 +86,7 @@ def verify_installation():
             '_get_red_team_assessment_table_sql'
         ]
         
-        missing_methods = []
-        for method_name in required_methods:
-            if not hasattr(dp, method_name):
-                missing_methods.append(method_name)
+        missing_methods = sorted(set(required_methods).difference(dir(dp)))
         
         if missing_methods:
             print(f"   ✗ Missing methods: {missing_methods}")
@@ -121,6 +116,28 @@ def verify_installation():
         return False
 
 
+def requirements_satisfied(requirements_file):
+    """Check installed package versions against a requirements file without running pip"""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+        from packaging.requirements import Requirement
+    except ImportError:
+        return False
+    
+    try:
+        with open(requirements_file, 'r') as f:
+            lines = [line.split('#', 1)[0].strip() for line in f]
+        for line in lines:
+            if not line:
+                continue
+            requirement = Requirement(line)
+            if not requirement.specifier.contains(version(requirement.name), prereleases=True):
+                return False
+        return True
+    except (PackageNotFoundError, ValueError):
+        return False
+
+
 def install_dependencies():
     """Install required dependencies"""
     print("\n📦 Installing dependencies...")
@@ -129,8 +146,13 @@ def install_dependencies():
         print("   ✗ requirements.txt not found!")
         return False
     
+    if requirements_satisfied('requirements.txt'):
+        print("   ✓ All dependencies already satisfied")
+        return True
+    
     try:
-        subprocess.check_call([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt', '--quiet'])
+        subprocess.check_call([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt',
+                               '--quiet', '--disable-pip-version-check', '--no-input'])
         print("   ✓ Dependencies installed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -143,25 +165,49 @@ def run_demo():
     print("\n🧪 Running demo to verify functionality...")
     
     try:
-        result = subprocess.run([sys.executable, 'demo_full_workflow.py'], 
-                              capture_output=True, text=True, timeout=30)
+        # Stream the demo output line by line instead of buffering all of it;
+        # lines stay raw bytes and only the last few are decoded for reporting
+        proc = subprocess.Popen([sys.executable, 'demo_full_workflow.py'],
+                                stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                env={**os.environ, 'PYTHONIOENCODING': 'utf-8'})
+        timed_out = threading.Event()
+        
+        def stop_demo():
+            timed_out.set()
+            proc.kill()
+        
+        timer = threading.Timer(30, stop_demo)
+        timer.start()
+        success = False
+        tail = deque(maxlen=5)
+        try:
+            # Keep draining after the sentinel so the demo can run its own cleanup
+            for line in proc.stdout:
+                if DEMO_SUCCESS_SENTINEL in line:
+                    success = True
+                tail.append(line)
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+        
+        if timed_out.is_set():
+            print("   ✗ Demo timed out")
+            return False
         
-        if result.returncode == 0:
-            if "🎉 Demo completed successfully!" in result.stdout:
+        if returncode == 0:
+            if success:
                 print("   ✅ Demo ran successfully!")
                 return True
             else:
                 print("   ⚠️  Demo ran but didn't complete successfully")
-                print(f"   Output: {result.stdout[-200:]}")  # Last 200 chars
+                print(f"   Output: {b''.join(tail).decode('utf-8', 'replace')[-200:]}")  # Last 200 chars
                 return False
         else:
-            print(f"   ✗ Demo failed with return code {result.returncode}")
-            print(f"   Error: {result.stderr}")
+            print(f"   ✗ Demo failed with return code {returncode}")
+            print(f"   Error: {b''.join(tail).decode('utf-8', 'replace')}")
             return False
             
-    except subprocess.TimeoutExpired:
-        print("   ✗ Demo timed out")
-        return False
     except Exception as e:
         print(f"   ✗ Error running demo: {e}")
         return False
@@ -4,9 +4,15 @@ MySQL Database Populator for FISST Academy Cybersecurity Simulation
 Populates existing tables with realistic fake data based on the provided schema.
 """
 
+import argparse
 import mysql.connector
+from mysql.connector import pooling
+import os
 import random
-import sys
+import tempfile
+from itertools import chain, islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from faker import Faker
 from faker.providers import BaseProvider
 from decimal import Decimal
@@ -14,45 +20,142 @@ from datetime import datetime, date, timedelta
 import time
 
 
+
+# Fallback when the server's max_allowed_packet cannot be read (MySQL 5.7 default)
+DEFAULT_MAX_ALLOWED_PACKET = 4 * 1024 * 1024
+BULK_INSERT_CHUNK_ROWS = 1000
+# Server-side prepared statements accept at most this many parameters
+MAX_PREPARED_PLACEHOLDERS = 65535
+# Row count above which the largest tables are streamed with LOAD DATA LOCAL INFILE
+LOAD_DATA_MIN_ROWS = 1000
+# Employee count from which row generation is sharded across worker processes
+PARALLEL_EMPLOYEE_MIN_ROWS = 5000
+# Employees per block when simulation columns are drawn in bulk
+SIMULATION_BLOCK_EMPLOYEES = 2000
+# One pooled connection per table loaded concurrently with --parallel-load
+CONNECTION_POOL_SIZE = 4
+# Session variables relaxed for the duration of a bulk load
+BULK_LOAD_SESSION_VARIABLES = ('autocommit', 'unique_checks', 'foreign_key_checks', 'sql_log_bin')
+# Insert tuning applied after connecting; durability settings are server-wide and opt-in
+BULK_SESSION_TUNING = (('SESSION', 'bulk_insert_buffer_size', 256 * 1024 * 1024),)
+RELAXED_DURABILITY_TUNING = (('GLOBAL', 'innodb_flush_log_at_trx_commit', 2), ('GLOBAL', 'sync_binlog', 0))
+
+POPULATED_TABLES = (
+    'employee_master',
+    'employee_phish_smish_sim',
+    'employee_vishing_sim',
+    'employee_quishing_sim',
+    'red_team_assessment',
+)
+
+EMPLOYEE_MASTER_COLUMNS = (
+    'employee_id', 'first_name', 'last_name', 'gender', 'date_of_birth', 'age', 'blood_group', 'marital_status',
+    'email', 'phone_number', 'address', 'state', 'postal_code', 'country', 'designation', 'department',
+    'salary', 'work_experience_years', 'joining_date', 'emergency_contact_name', 'emergency_contact_phone',
+    'family_details', 'medical_conditions', 'simulation_type', 'work_email', 'personal_email',
+    'click_response_rate', 'phish_last_simulation_date', 'phish_testing_status',
+    'vishing_phone_number', 'vishing_alt_phone_number', 'voice_auth_test', 'vish_response_rate',
+    'vish_last_simulation_date', 'vish_testing_status',
+    'quish_response_rate', 'quish_last_simulation_date', 'quish_testing_status',
+    'branch_location', 'branch_code', 'total_employees_at_branch', 'security_level', 'building_storeys',
+    'assessment_date', 'assessment_time_start', 'assessment_time_end', 'permission_granted',
+    'approving_official_name', 'approving_official_designation', 'identity_verification_required',
+    'identity_verified', 'security_guard_present', 'visitor_log_maintained', 'badge_issued',
+    'escort_required', 'restricted_areas_accessed', 'tailgating_possible', 'social_engineering_successful',
+    'physical_security_score', 'human_security_score', 'overall_assessment_score',
+    'vulnerabilities_found', 'recommendations', 'assessor_name', 'assessor_id', 'notes',
+    'red_team_testing_status', 'organisation_name',
+)
+
+PHISH_SMISH_COLUMNS = (
+    'serial_no', 'employee_id', 'simulation_type', 'work_email', 'personal_email',
+    'phone_number', 'click_response_rate', 'last_simulation_date', 'testing_status',
+)
+
+VISHING_COLUMNS = (
+    'serial_no', 'employee_id', 'phone_number', 'alt_phone_number', 'voice_auth_test',
+    'vish_response_rate', 'last_simulation', 'testing_status',
+)
+
+QUISHING_COLUMNS = (
+    'serial_no', 'employee_id', 'qr_code_link', 'device_used', 'scan_location', 'scan_time',
+    'response_action', 'quish_response_rate', 'last_simulation_date', 'testing_status',
+)
+
+RED_TEAM_COLUMNS = (
+    'serial_no', 'employee_id', 'branch_location', 'branch_code', 'total_employees_at_branch',
+    'security_level', 'building_storeys', 'assessment_date', 'assessment_time_start', 'assessment_time_end',
+    'permission_granted', 'approving_official_name', 'approving_official_designation',
+    'identity_verification_required', 'identity_verified', 'security_guard_present', 'visitor_log_maintained',
+    'badge_issued', 'escort_required', 'restricted_areas_accessed', 'tailgating_possible',
+    'social_engineering_successful', 'physical_security_score', 'human_security_score',
+    'overall_assessment_score', 'vulnerabilities_found', 'recommendations', 'assessor_name',
+    'assessor_id', 'notes', 'testing_status',
+)
+
+TABLE_COLUMNS = {
+    'employee_master': EMPLOYEE_MASTER_COLUMNS,
+    'employee_phish_smish_sim': PHISH_SMISH_COLUMNS,
+    'employee_vishing_sim': VISHING_COLUMNS,
+    'employee_quishing_sim': QUISHING_COLUMNS,
+    'red_team_assessment': RED_TEAM_COLUMNS,
+}
+
+
+def batched(iterable, size):
+    """Yield successive lists of up to size items (itertools.batched before Python 3.12)"""
+    iterator = iter(iterable)
+    return iter(lambda: list(islice(iterator, size)), [])
+
+
+def _build_insert(table, columns, rows=1):
+    """Build a parameterized INSERT for the given number of rows"""
+    row_placeholders = '(' + ', '.join(['%s'] * len(columns)) + ')'
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES " + ', '.join([row_placeholders] * rows)
+
+
 class IndianDataProvider(BaseProvider):
     """Custom Faker provider for Indian data"""
     
     # Common Indian first names
-    indian_first_names_male = [
+    indian_first_names_male = (
         'Aarav', 'Vivaan', 'Aditya', 'Vihaan', 'Arjun', 'Sai', 'Reyansh', 'Ayaan', 'Krishna', 'Ishaan',
         'Shaurya', 'Atharv', 'Advik', 'Pranav', 'Rishabh', 'Gokul', 'Rohan', 'Kiran', 'Aryan', 'Advait',
         'Vikram', 'Ankit', 'Rahul', 'Amit', 'Suresh', 'Rajesh', 'Deepak', 'Manoj', 'Ravi', 'Ashok'
-    ]
+    )
     
-    indian_first_names_female = [
+    indian_first_names_female = (
         'Saanvi', 'Ananya', 'Diya', 'Aadhya', 'Kiara', 'Anika', 'Avni', 'Sara', 'Myra', 'Aditi',
         'Kavya', 'Sia', 'Ira', 'Pihu', 'Riya', 'Arya', 'Tara', 'Siya', 'Nisha', 'Priya',
         'Meera', 'Pooja', 'Neha', 'Sita', 'Geeta', 'Sunita', 'Kavita', 'Anita', 'Seema', 'Rekha'
-    ]
+    )
     
     # Common Indian surnames
-    indian_last_names = [
+    indian_last_names = (
         'Sharma', 'Verma', 'Gupta', 'Agarwal', 'Bansal', 'Garg', 'Jain', 'Mittal', 'Shah', 'Patel',
         'Singh', 'Kumar', 'Yadav', 'Mishra', 'Pandey', 'Tiwari', 'Shukla', 'Dubey', 'Saxena', 'Srivastava',
         'Chandra', 'Iyer', 'Nair', 'Reddy', 'Rao', 'Pillai', 'Menon', 'Das', 'Roy', 'Ghosh'
-    ]
+    )
     
     # Indian cities
-    indian_cities = [
+    indian_cities = (
         'Mumbai', 'Delhi', 'Bangalore', 'Hyderabad', 'Chennai', 'Kolkata', 'Pune', 'Ahmedabad',
         'Surat', 'Jaipur', 'Lucknow', 'Kanpur', 'Nagpur', 'Visakhapatnam', 'Indore', 'Thane',
         'Bhopal', 'Patna', 'Vadodara', 'Ghaziabad', 'Ludhiana', 'Coimbatore', 'Madurai', 'Vijayawada'
-    ]
+    )
     
     # Indian street name components
-    indian_street_components = [
+    indian_street_components = (
         'MG Road', 'Gandhi Nagar', 'Nehru Street', 'Rajaji Road', 'Anna Salai', 'Brigade Road',
         'Commercial Street', 'Park Street', 'Church Street', 'Ring Road', 'Civil Lines', 'Model Town'
-    ]
+    )
+    
+    # Male and female pools are the same size, so one draw from both matches indian_name()
+    indian_first_names = indian_first_names_male + indian_first_names_female
     
     def indian_name(self):
         """Generate a random Indian name"""
-        if random.choice([True, False]):
+        if self.generator.random.choice([True, False]):
             first_name = self.random_element(self.indian_first_names_male)
         else:
             first_name = self.random_element(self.indian_first_names_female)
@@ -65,21 +168,262 @@ class IndianDataProvider(BaseProvider):
     
     def indian_phone(self):
         """Generate a random Indian phone number"""
-        return f"+91 {random.randint(7000000000, 9999999999)}"
+        return f"+91 {self.generator.random.randint(7000000000, 9999999999)}"
     
     def street_name(self):
         """Generate a random Indian street name"""
         return self.random_element(self.indian_street_components)
+    
+    def batch_names(self, n):
+        """Generate n Indian first and last names as two parallel lists"""
+        return (self.generator.random.choices(self.indian_first_names, k=n),
+                self.generator.random.choices(self.indian_last_names, k=n))
+    
+    def batch_full_names(self, n):
+        """Generate n full Indian names"""
+        return [f"{first} {last}" for first, last in zip(*self.batch_names(n))]
+    
+    def batch_phones(self, n):
+        """Generate n Indian phone numbers"""
+        return [f"+91 {number}" for number in self.generator.random.choices(range(7000000000, 10000000000), k=n)]
+
+
+# Randomly drawn boolean columns in employee_master
+EMPLOYEE_FLAG_COLUMNS = 9
+# Randomly drawn boolean columns in red_team_assessment
+RED_TEAM_FLAG_COLUMNS = 8
+DAYS_PER_YEAR = 365
+DAYS_PER_MONTH = 30
+
+# Fixed vocabularies shared by the generators
+BRANCH_CODES = ('MUM01', 'DEL02', 'BLR03', 'HYD04', 'CHN05', 'KOL06', 'PUN07', 'AHM08')
+BRANCH_LOCATIONS = ('Mumbai', 'Delhi', 'Bangalore', 'Hyderabad', 'Chennai', 'Kolkata', 'Pune', 'Ahmedabad')
+SIMULATION_TESTING_STATUSES = ('Completed', 'Pending', 'Failed', 'Passed')
+CONTACT_ROLES = ('Manager', 'Director', 'VP', 'Senior Manager')
+SECURITY_VULNERABILITIES = (
+    'Weak access controls', 'Inadequate visitor management', 'Social engineering susceptibility',
+    'Poor password practices', 'Unsecured workstations', 'None significant'
+)
+SECURITY_RECOMMENDATIONS = (
+    'Implement two-factor authentication', 'Enhanced security training',
+    'Improve visitor access controls', 'Regular security assessments',
+    'Employee awareness programs', 'Continue current practices'
+)
+# Half of employees report no condition; cumulative weights are precomputed for random.choices
+MEDICAL_CONDITIONS = ('None', 'Diabetes', 'Hypertension', 'Asthma')
+MEDICAL_CONDITION_CUM_WEIGHTS = (3, 4, 5, 6)
+
+
+def date_range_pool(start_days_ago, end_days_ago=0):
+    """List every date from start_days_ago to end_days_ago days before today"""
+    today = date.today()
+    return [today - timedelta(days=offset) for offset in range(end_days_ago, start_days_ago + 1)]
+
+
+def random_dates(start_days_ago, end_days_ago, n, rng=random):
+    """Draw n dates between start_days_ago and end_days_ago days before today"""
+    today = date.today()
+    return [today - timedelta(days=offset) for offset in rng.choices(range(end_days_ago, start_days_ago + 1), k=n)]
+
+
+def random_times(n, rng=random):
+    """Draw n times of day formatted as HH:MM:SS"""
+    return [f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+            for seconds in rng.choices(range(86400), k=n)]
+
+
+def random_datetimes(start_days_ago, n, rng=random):
+    """Draw n whole-second datetimes between start_days_ago days ago and now"""
+    now = datetime.now().replace(microsecond=0)
+    return [now - timedelta(seconds=offset) for offset in rng.choices(range(start_days_ago * 86400), k=n)]
+
+
+def random_flag_columns(count, n, rng=random):
+    """Draw count columns of n True/False values from one packed getrandbits call"""
+    if not n:
+        return [[] for _ in range(count)]
+    bits = format(rng.getrandbits(count * n), f'0{count * n}b')
+    return [[bit == '1' for bit in bits[offset:offset + n]] for offset in range(0, count * n, n)]
+
+
+def branch_columns(employee_ids):
+    """Map employee IDs round-robin onto branch location and branch code columns"""
+    branch_indices = [(employee_id - 1) % len(BRANCH_CODES) for employee_id in employee_ids]
+    return list(map(BRANCH_LOCATIONS.__getitem__, branch_indices)), list(map(BRANCH_CODES.__getitem__, branch_indices))
+
+
+def repeat_pairs(pairs, counts):
+    """Repeat each (serial_no, employee_id) pair count times, returned as two columns"""
+    serial_nos = []
+    employee_ids = []
+    for (serial_no, employee_id), count in zip(pairs, counts):
+        serial_nos.extend([serial_no] * count)
+        employee_ids.extend([employee_id] * count)
+    return serial_nos, employee_ids
+
+
+def generate_employee_columns(fake, start_id, n, consistent_stats, rng=random):
+    """Generate employee_master columns for employee IDs start_id .. start_id + n - 1"""
+    departments = ['IT Security', 'Human Resources', 'Finance', 'Operations', 'Marketing', 'Sales', 'Research', 'Admin']
+    designations = ['Analyst', 'Manager', 'Coordinator', 'Specialist', 'Executive', 'Director', 'Team Lead', 'Senior Analyst']
+    blood_groups = ['A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-']
+    marital_statuses = ['Single', 'Married', 'Divorced', 'Widowed']
+    indian_states = ['Maharashtra', 'Karnataka', 'Tamil Nadu', 'Delhi', 'Uttar Pradesh', 'Gujarat', 'West Bengal', 'Rajasthan']
+    
+    uniform = rng.uniform
+    
+    def uniform_column(low, high, digits):
+        return [round(uniform(low, high), digits) for _ in range(n)]
+    
+    # Every True/False flag column comes from one packed getrandbits draw
+    flag_columns = iter(random_flag_columns(EMPLOYEE_FLAG_COLUMNS, n, rng))
+    
+    def flag_column():
+        return next(flag_columns)
+    
+    employee_ids = list(range(start_id, start_id + n))
+    first_names, last_names = fake.batch_names(n)
+    
+    # Personal details
+    dates_of_birth = random_dates(65 * DAYS_PER_YEAR, 22 * DAYS_PER_YEAR, n, rng)
+    phone_numbers = fake.batch_phones(n)
+    cities = rng.choices(IndianDataProvider.indian_cities, k=n)
+    streets = rng.choices(IndianDataProvider.indian_street_components, k=n)
+    street_numbers = rng.choices(range(1, 1000), k=n)
+    addresses = [f"{number}, {street}, {city}" for number, street, city in zip(street_numbers, streets, cities)]
+    department_col = rng.choices(departments, k=n)
+    
+    # Use consistent statistics with small individual variations
+    base_click_rate = consistent_stats['phishing_click_rate']
+    base_vish_rate = consistent_stats['vishing_response_rate']
+    base_quish_rate = consistent_stats['quishing_scan_rate']
+    base_physical = consistent_stats['physical_security_score']
+    base_human = consistent_stats['human_security_score']
+    physical_scores = uniform_column(base_physical - 0.5, base_physical + 0.5, 1)
+    human_scores = uniform_column(base_human - 0.5, base_human + 0.5, 1)
+    
+    locations, codes = branch_columns(employee_ids)
+    
+    columns = [
+        employee_ids,
+        first_names,
+        last_names,
+        rng.choices(('M', 'F'), k=n),
+        dates_of_birth,
+        [2024 - dob.year for dob in dates_of_birth],
+        rng.choices(blood_groups, k=n),
+        rng.choices(marital_statuses, k=n),
+        [None] * n,  # email, assigned after all shards are merged
+        phone_numbers,
+        addresses,
+        rng.choices(indian_states, k=n),
+        [str(code) for code in rng.choices(range(100000, 1000000), k=n)],
+        ['India'] * n,
+        rng.choices(designations, k=n),
+        department_col,
+        uniform_column(300000, 2000000, 2),
+        uniform_column(0.5, 20.0, 1),
+        random_dates(10 * DAYS_PER_YEAR, 0, n, rng),
+        # Emergency contact
+        fake.batch_full_names(n),
+        fake.batch_phones(n),
+        # Family and medical details
+        [f"Family of {size} members" for size in rng.choices(range(2, 7), k=n)],
+        rng.choices(MEDICAL_CONDITIONS, cum_weights=MEDICAL_CONDITION_CUM_WEIGHTS, k=n),
+        ['Baseline Assessment'] * n,
+        [None] * n,  # work_email
+        [None] * n,  # personal_email
+        # Phishing data
+        uniform_column(base_click_rate - 1, base_click_rate + 1, 2),
+        random_dates(6 * DAYS_PER_MONTH, 3 * DAYS_PER_MONTH, n, rng),
+        ['Completed'] * n,
+        # Vishing data
+        phone_numbers,
+        fake.batch_phones(n),
+        flag_column(),
+        uniform_column(base_vish_rate - 1, base_vish_rate + 1, 2),
+        random_dates(6 * DAYS_PER_MONTH, 3 * DAYS_PER_MONTH, n, rng),
+        ['Completed'] * n,
+        # Quishing data
+        uniform_column(base_quish_rate - 1, base_quish_rate + 1, 2),
+        random_dates(6 * DAYS_PER_MONTH, 3 * DAYS_PER_MONTH, n, rng),
+        ['Completed'] * n,
+        # Branch and assessment data
+        locations,
+        codes,
+        rng.choices(range(15, 51), k=n),
+        rng.choices(('Low', 'Medium', 'High'), k=n),
+        rng.choices(range(1, 11), k=n),
+        random_dates(3 * DAYS_PER_MONTH, 0, n, rng),
+        random_times(n, rng),
+        random_times(n, rng),
+        flag_column(),
+        fake.batch_full_names(n),
+        rng.choices(CONTACT_ROLES, k=n),
+        # Security flags
+        [True] * n,
+        flag_column(),
+        flag_column(),
+        [True] * n,
+        flag_column(),
+        flag_column(),
+        flag_column(),
+        flag_column(),
+        flag_column(),
+        physical_scores,
+        human_scores,
+        [round((physical + human) / 2, 1) for physical, human in zip(physical_scores, human_scores)],
+        rng.choices(SECURITY_VULNERABILITIES, k=n),
+        rng.choices(SECURITY_RECOMMENDATIONS, k=n),
+        fake.batch_full_names(n),
+        [f"ASST{assessor:02d}" for assessor in rng.choices(range(1, 21), k=n)],
+        [f"Assessment completed for {department} department employee" for department in department_col],
+        ['Completed'] * n,
+        ['FISST Academy'] * n,
+    ]
+    return columns
+
+
+def seeded_generators(seed):
+    """Return a private random.Random and Faker pair for one worker"""
+    fake = Faker()
+    fake.add_provider(IndianDataProvider)
+    fake.seed_instance(seed)
+    return random.Random(seed), fake
+
+
+def _generate_employee_shard(start_id, count, consistent_stats, seed):
+    """Generate one shard of employee_master columns in a worker process"""
+    rng, fake = seeded_generators(seed)
+    return generate_employee_columns(fake, start_id, count, consistent_stats, rng)
 
 
 class DatabasePopulator:
     """Main class for database population and management"""
     
-    def __init__(self):
+    def __init__(self, seed=None):
+        self.pool = None
+        self.connection_config = None
         self.connection = None
         self.cursor = None
+        self.insert_cursor = None
+        self.max_allowed_packet = DEFAULT_MAX_ALLOWED_PACKET
+        self.in_bulk_load = False
+        self.inserted_employees = None
+        self._local_infile = None
+        self._saved_session_variables = {}
+        self._tuned_variables = []
+        self._consistent_stats = self.generate_consistent_statistics(0)
+        # INSERT statements keyed by (table, rows per statement)
+        self._insert_statements = {
+            (table, 1): _build_insert(table, columns) for table, columns in TABLE_COLUMNS.items()
+        }
+        # Instance generators keep runs reproducible when a seed is given
+        self.rng = random.Random(seed)
         self.fake = Faker()
         self.fake.add_provider(IndianDataProvider)
+        if seed is not None:
+            self.fake.seed_instance(seed)
     
     def get_database_config(self):
         """Get database connection details from user"""
@@ -142,22 +486,236 @@ class DatabasePopulator:
     def connect_to_database(self, config):
         """Establish database connection"""
         try:
-            self.connection = mysql.connector.connect(
-                host=config['host'],
-                port=config['port'],
-                database=config['database'],
-                user=config['username'],
-                password=config['password'],
-                connect_timeout=10
-            )
-            self.cursor = self.connection.cursor(dictionary=True)
+            self.connection_config = {
+                'host': config['host'],
+                'port': config['port'],
+                'database': config['database'],
+                'user': config['username'],
+                'password': config['password'],
+                'connect_timeout': 10,
+                # LOAD DATA LOCAL may only read the temp files written by _load_data_infile
+                'allow_local_infile_in_path': tempfile.gettempdir(),
+            }
+            self.connection = mysql.connector.connect(**self.connection_config)
+            self.cursor = self.connection.cursor()
+            self._load_max_allowed_packet()
             print(f"✓ Successfully connected to MySQL database!")
+            if not getattr(mysql.connector, 'HAVE_CEXT', False):
+                print("💡 mysql-connector C extension not available; bulk loads use the slower pure-Python protocol")
             return True
             
         except Exception as e:
             self._handle_connection_error(e, config)
             return False
     
+    def _load_max_allowed_packet(self):
+        """Read the server's max_allowed_packet so bulk inserts stay under it"""
+        try:
+            self.cursor.execute("SHOW VARIABLES LIKE 'max_allowed_packet'")
+            row = self.cursor.fetchone()
+            if row:
+                self.max_allowed_packet = int(row[1])
+        except Exception:
+            self.max_allowed_packet = DEFAULT_MAX_ALLOWED_PACKET
+    
+    def _bulk_insert(self, table, columns, rows, chunk_rows=BULK_INSERT_CHUNK_ROWS, cursor=None, insert_ids=None):
+        """Insert an iterable of rows using multi-row INSERT statements sized to max_allowed_packet"""
+        rows = iter(rows)
+        first_row = next(rows, None)
+        if first_row is None:
+            return 0
+        cursor = cursor or self._prepared_cursor()
+        
+        # Shrink the chunk if a probe row suggests it would exceed 80% of the packet
+        probe_row_bytes = sum(len(str(value)) + 4 for value in first_row) + 4
+        packet_rows = int(self.max_allowed_packet * 0.8) // probe_row_bytes
+        chunk_rows = max(1, min(chunk_rows, packet_rows, MAX_PREPARED_PLACEHOLDERS // len(columns)))
+        
+        inserted = 0
+        for chunk in batched(chain((first_row,), rows), chunk_rows):
+            # Reusing the cached string lets the prepared cursor skip re-preparing full chunks
+            key = (table, len(chunk))
+            sql = self._insert_statements.get(key)
+            if sql is None:
+                sql = self._insert_statements[key] = _build_insert(table, columns, len(chunk))
+            cursor.execute(sql, list(chain.from_iterable(chunk)))
+            # A multi-row INSERT reports the AUTO_INCREMENT value of its first row; callers only pass
+            # insert_ids after _insert_ids_are_consecutive() confirmed the ids follow on from it
+            if insert_ids is not None and cursor.lastrowid:
+                insert_ids.extend(range(cursor.lastrowid, cursor.lastrowid + len(chunk)))
+            inserted += len(chunk)
+        
+        return inserted
+    
+    def _insert_ids_are_consecutive(self):
+        """Check whether a multi-row INSERT's AUTO_INCREMENT ids can be derived from lastrowid"""
+        try:
+            self.cursor.execute("SELECT @@SESSION.auto_increment_increment, @@GLOBAL.innodb_autoinc_lock_mode")
+            increment, lock_mode = self.cursor.fetchone()
+        except Exception:
+            return False
+        # Interleaved lock mode (2) may give one statement non-consecutive ids under concurrent inserts
+        return int(increment) == 1 and int(lock_mode) < 2
+    
+    def _prepared_cursor(self):
+        """Lazily open the server-side prepared cursor used for INSERT batches"""
+        if self.insert_cursor is None:
+            self.insert_cursor = self.connection.cursor(prepared=True)
+        return self.insert_cursor
+    
+    @staticmethod
+    def _tsv_value(value):
+        """Format a value for a LOAD DATA tab-separated file"""
+        if value is None:
+            return '\\N'
+        if isinstance(value, bool):
+            return '1' if value else '0'
+        return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+    
+    def _local_infile_available(self):
+        """Check once whether the server accepts LOAD DATA LOCAL INFILE"""
+        if self._local_infile is None:
+            try:
+                self.cursor.execute("SELECT @@GLOBAL.local_infile")
+                self._local_infile = bool(int(self.cursor.fetchone()[0]))
+            except Exception:
+                self._local_infile = False
+        return self._local_infile
+    
+    def _insert_rows(self, table, columns, rows, expected_rows, cursor=None, insert_cursor=None):
+        """Load rows with LOAD DATA LOCAL INFILE when large and supported, else chunked INSERTs"""
+        if expected_rows > LOAD_DATA_MIN_ROWS and self._local_infile_available():
+            return self._load_data_infile(table, columns, rows, cursor=cursor)
+        return self._bulk_insert(table, columns, rows, cursor=insert_cursor)
+    
+    def _load_data_infile(self, table, columns, rows, cursor=None):
+        """Stream an iterable of rows into a table through LOAD DATA LOCAL INFILE"""
+        cursor = cursor or self.cursor
+        tsv_value = self._tsv_value
+        row_count = 0
+        with tempfile.NamedTemporaryFile('w', suffix='.tsv', encoding='utf-8', newline='', delete=False) as tsv:
+            path = tsv.name
+            for row in rows:
+                tsv.write('\t'.join([tsv_value(value) for value in row]) + '\n')
+                row_count += 1
+        
+        try:
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4 "
+                f"FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' ({', '.join(columns)})",
+                (path,)
+            )
+        finally:
+            os.remove(path)
+        
+        # LOAD DATA LOCAL downgrades duplicate-key and conversion errors to warnings and skips those rows
+        if cursor.rowcount != row_count:
+            raise RuntimeError(
+                f"LOAD DATA loaded {cursor.rowcount} of {row_count} rows into {table} "
+                "(duplicate keys are skipped with a warning)"
+            )
+        return row_count
+    
+    def _apply_bulk_session_tuning(self, relax_durability=False):
+        """Raise insert buffers (and optionally relax log flushing) for the duration of the run"""
+        tuning = BULK_SESSION_TUNING + (RELAXED_DURABILITY_TUNING if relax_durability else ())
+        for scope, name, value in tuning:
+            try:
+                self.cursor.execute(f"SELECT @@{scope}.{name}")
+                saved_value = self.cursor.fetchone()[0]
+                self.cursor.execute(f"SET {scope} {name} = %s", (value,))
+                self._tuned_variables.append((scope, name, saved_value))
+            except Exception as e:
+                print(f"⚠️  Could not set {scope.lower()} {name}: {e}")
+    
+    def _restore_session(self):
+        """Restore variables changed by _apply_bulk_session_tuning"""
+        while self._tuned_variables:
+            scope, name, value = self._tuned_variables.pop()
+            try:
+                self.cursor.execute(f"SET {scope} {name} = %s", (value,))
+            except Exception as e:
+                print(f"⚠️  Could not restore {scope.lower()} {name}: {e}")
+    
+    def _begin_bulk_load(self):
+        """Open a single transaction with autocommit, unique and FK checks and binlogging off"""
+        self._saved_session_variables = {}
+        for name in BULK_LOAD_SESSION_VARIABLES:
+            try:
+                self.cursor.execute(f"SELECT @@SESSION.{name} AS value")
+                saved_value = self.cursor.fetchone()[0]
+                self.cursor.execute(f"SET SESSION {name} = 0")
+                self._saved_session_variables[name] = saved_value
+            except Exception as e:
+                print(f"⚠️  Could not disable {name} for bulk load: {e}")
+        self.in_bulk_load = True
+    
+    def _end_bulk_load(self, commit=True):
+        """Commit or roll back the bulk-load transaction and restore session variables"""
+        self.in_bulk_load = False
+        try:
+            if commit:
+                self.connection.commit()
+            else:
+                self.connection.rollback()
+        finally:
+            for name, value in self._saved_session_variables.items():
+                try:
+                    self.cursor.execute(f"SET SESSION {name} = %s", (value,))
+                except Exception as e:
+                    print(f"⚠️  Could not restore {name}: {e}")
+            self._saved_session_variables = {}
+    
+    def _snapshot_indexes(self, table):
+        """Describe the table's non-unique secondary B-tree indexes from information_schema.STATISTICS"""
+        # UNIQUE indexes stay in place: the load runs with unique_checks=0 and a rebuild could fail on duplicates
+        self.cursor.execute(
+            "SELECT index_name, column_name, sub_part FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = %s AND index_name <> 'PRIMARY' "
+            "AND non_unique = 1 AND index_type = 'BTREE' ORDER BY index_name, seq_in_index",
+            (table,)
+        )
+        indexes = {}
+        for index_name, column_name, sub_part in self.cursor.fetchall():
+            indexes.setdefault(index_name, []).append(column_name if sub_part is None else f"{column_name}({sub_part})")
+        # Functional indexes have no column name and cannot be rebuilt from this snapshot
+        return {name: columns for name, columns in indexes.items() if None not in columns}
+    
+    def _drop_secondary_indexes(self, table):
+        """Drop secondary indexes before a bulk load and return what was dropped"""
+        dropped = {}
+        for index_name, columns in self._snapshot_indexes(table).items():
+            try:
+                self.cursor.execute(f"ALTER TABLE {table} DROP INDEX `{index_name}`")
+                dropped[index_name] = columns
+            except mysql.connector.Error as e:
+                # Indexes backing a foreign key cannot be dropped
+                print(f"⚠️  Keeping index {index_name} on {table}: {e}")
+        if dropped:
+            print(f"✓ Dropped {len(dropped)} secondary indexes on {table} for bulk load")
+        return dropped
+    
+    def _recreate_indexes(self, table, snapshot):
+        """Rebuild dropped indexes in a single ALTER TABLE after the bulk load"""
+        if not snapshot:
+            return
+        clauses = [
+            f"ADD INDEX `{index_name}` ({', '.join(columns)})"
+            for index_name, columns in snapshot.items()
+        ]
+        try:
+            # Sorted in-place build that leaves the table readable meanwhile
+            self.cursor.execute(f"ALTER TABLE {table} " + ", ".join(clauses) + ", ALGORITHM=INPLACE, LOCK=NONE")
+        except mysql.connector.Error as e:
+            print(f"✗ Failed to recreate indexes on {table} ({', '.join(snapshot)}): {e}")
+            raise
+        print(f"✓ Recreated {len(snapshot)} secondary indexes on {table}")
+    
+    def _commit(self):
+        """Commit unless a bulk load owns the transaction"""
+        if not self.in_bulk_load:
+            self.connection.commit()
+    
     def _handle_connection_error(self, error, config):
         """Handle database connection errors with helpful troubleshooting information"""
         error_str = str(error)
@@ -191,25 +749,19 @@ class DatabasePopulator:
     
     def verify_tables_exist(self):
         """Verify that all required tables exist in the database"""
-        required_tables = [
-            'employee_master',
-            'employee_phish_smish_sim',
-            'employee_vishing_sim',
-            'employee_quishing_sim',
-            'red_team_assessment'
-        ]
-        
-        existing_tables = []
-        missing_tables = []
+        required_tables = list(POPULATED_TABLES)
         
         try:
-            for table in required_tables:
-                self.cursor.execute(f"SHOW TABLES LIKE '{table}'")
-                result = self.cursor.fetchone()
-                if result:
-                    existing_tables.append(table)
-                else:
-                    missing_tables.append(table)
+            placeholders = ', '.join(['%s'] * len(required_tables))
+            with self.connection.cursor(dictionary=True) as cursor:
+                cursor.execute(
+                    "SELECT table_name AS table_name FROM information_schema.tables "
+                    f"WHERE table_schema = DATABASE() AND table_name IN ({placeholders})",
+                    required_tables
+                )
+                found_tables = {row['table_name'] for row in cursor.fetchall()}
+            existing_tables = [table for table in required_tables if table in found_tables]
+            missing_tables = [table for table in required_tables if table not in found_tables]
             
             if missing_tables:
                 print(f"❌ Missing required tables: {', '.join(missing_tables)}")
@@ -223,18 +775,22 @@ class DatabasePopulator:
             print(f"✗ Error checking tables: {e}")
             return False
     
+    def _table_counts(self):
+        """Count rows in every populated table with a single query"""
+        with self.connection.cursor(dictionary=True) as cursor:
+            cursor.execute(
+                "SELECT " + ", ".join(f"(SELECT COUNT(*) FROM {table}) AS {table}" for table in POPULATED_TABLES)
+            )
+            return cursor.fetchone()
+    
     def check_data_exists(self):
         """Check if data exists in any of the tables"""
-        tables = ['employee_master', 'employee_phish_smish_sim', 'employee_vishing_sim', 'employee_quishing_sim', 'red_team_assessment']
-        
         try:
-            for table in tables:
-                self.cursor.execute(f"SELECT COUNT(*) as count FROM {table}")
-                result = self.cursor.fetchone()
-                count = result['count']
-                if count > 0:
-                    return True
-            return False
+            # EXISTS stops at the first row, unlike COUNT(*) which scans every InnoDB row
+            self.cursor.execute(
+                "SELECT " + " OR ".join(f"EXISTS(SELECT 1 FROM {table})" for table in POPULATED_TABLES)
+            )
+            return bool(self.cursor.fetchone()[0])
         except Exception as e:
             print(f"Error checking data existence: {e}")
             return False
@@ -243,30 +799,36 @@ class DatabasePopulator:
         """Display summary of existing data"""
         print("\n=== Existing Data Summary ===")
         
-        tables = {
-            'employee_master': 'SELECT COUNT(*) as count FROM employee_master',
-            'employee_phish_smish_sim': 'SELECT COUNT(*) as count FROM employee_phish_smish_sim',
-            'employee_vishing_sim': 'SELECT COUNT(*) as count FROM employee_vishing_sim',
-            'employee_quishing_sim': 'SELECT COUNT(*) as count FROM employee_quishing_sim',
-            'red_team_assessment': 'SELECT COUNT(*) as count FROM red_team_assessment'
-        }
+        try:
+            counts = self._table_counts()
+        except Exception as e:
+            print(f"Error - {e}")
+            return
         
-        for table_name, query in tables.items():
-            try:
-                self.cursor.execute(query)
-                result = self.cursor.fetchone()
-                count = result['count']
-                print(f"{table_name.replace('_', ' ').title()}: {count} records")
-            except Exception as e:
-                print(f"{table_name}: Error - {e}")
+        for table_name in POPULATED_TABLES:
+            print(f"{table_name.replace('_', ' ').title()}: {counts[table_name]} records")
     
     def delete_all_data(self):
         """Delete all data from tables in correct order (respecting foreign keys)"""
         tables = ['red_team_assessment', 'employee_quishing_sim', 'employee_vishing_sim', 'employee_phish_smish_sim', 'employee_master']
         
         try:
-            for table in tables:
-                self.cursor.execute(f"DELETE FROM {table}")
+            try:
+                # TRUNCATE resets each table without per-row undo logging
+                self.cursor.execute("SET SESSION foreign_key_checks = 0")
+                try:
+                    for table in tables:
+                        self.cursor.execute(f"TRUNCATE TABLE {table}")
+                finally:
+                    self.cursor.execute("SET SESSION foreign_key_checks = 1")
+            except mysql.connector.Error as e:
+                print(f"⚠️  TRUNCATE failed ({e}), falling back to DELETE")
+                for table in tables:
+                    self.cursor.execute(f"DELETE FROM {table}")
+                self.connection.commit()
+                # DELETE keeps the AUTO_INCREMENT counters, so rewind them as TRUNCATE would
+                for table in tables:
+                    self.cursor.execute(f"ALTER TABLE {table} AUTO_INCREMENT = 1")
             self.connection.commit()
             print("✓ All existing data deleted successfully!")
             return True
@@ -277,8 +839,8 @@ class DatabasePopulator:
     
     def generate_consistent_statistics(self, num_employees):
         """Generate consistent statistics regardless of employee count"""
-        import random as stats_random
-        stats_random.seed(42)  # Fixed seed for consistent results
+        # A private generator keeps the fixed seed from resetting the global random state
+        stats_random = random.Random(42)
         
         # Base percentages that should remain consistent
         base_stats = {
@@ -297,185 +859,72 @@ class DatabasePopulator:
         
         return variations
     
+    def _generate_employee_columns_parallel(self, num_employees, consistent_stats):
+        """Generate employee_master columns in disjoint employee_id shards across CPU cores"""
+        workers = os.cpu_count() or 1
+        shard_size = -(-num_employees // workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_generate_employee_shard, start_id,
+                                min(shard_size, num_employees - start_id + 1),
+                                consistent_stats, self.rng.getrandbits(32))
+                for start_id in range(1, num_employees + 1, shard_size)
+            ]
+            shards = [future.result() for future in futures]
+        return [list(chain.from_iterable(parts)) for parts in zip(*shards)]
+    
     def generate_employees(self, num_employees):
         """Generate employee master data according to the new schema"""
         # Get consistent statistics for this run
-        consistent_stats = self.generate_consistent_statistics(num_employees)
+        consistent_stats = self._consistent_stats
         
-        departments = ['IT Security', 'Human Resources', 'Finance', 'Operations', 'Marketing', 'Sales', 'Research', 'Admin']
-        designations = ['Analyst', 'Manager', 'Coordinator', 'Specialist', 'Executive', 'Director', 'Team Lead', 'Senior Analyst']
-        blood_groups = ['A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-']
-        marital_statuses = ['Single', 'Married', 'Divorced', 'Widowed']
-        indian_states = ['Maharashtra', 'Karnataka', 'Tamil Nadu', 'Delhi', 'Uttar Pradesh', 'Gujarat', 'West Bengal', 'Rajasthan']
-        branch_codes = ['MUM01', 'DEL02', 'BLR03', 'HYD04', 'CHN05', 'KOL06', 'PUN07', 'AHM08']
-        branch_locations = ['Mumbai', 'Delhi', 'Bangalore', 'Hyderabad', 'Chennai', 'Kolkata', 'Pune', 'Ahmedabad']
+        columns = None
+        if num_employees >= PARALLEL_EMPLOYEE_MIN_ROWS:
+            try:
+                columns = self._generate_employee_columns_parallel(num_employees, consistent_stats)
+            except Exception as e:
+                print(f"⚠️  Parallel generation unavailable ({e}), generating employees serially")
+        if columns is None:
+            columns = generate_employee_columns(self.fake, 1, num_employees, consistent_stats, self.rng)
         
-        employees_data = []
-        used_emails = set()
+        # Unique emails are assigned after merging; repeated names get the unique employee_id appended
+        employee_ids = columns[EMPLOYEE_MASTER_COLUMNS.index('employee_id')]
+        first_names = columns[EMPLOYEE_MASTER_COLUMNS.index('first_name')]
+        last_names = columns[EMPLOYEE_MASTER_COLUMNS.index('last_name')]
+        base_emails = [f"{first_name.lower()}.{last_name.lower()}" for first_name, last_name in zip(first_names, last_names)]
+        seen_bases = set()
+        work_emails = []
+        for employee_id, base_email in zip(employee_ids, base_emails):
+            if base_email in seen_bases:
+                work_emails.append(f"{base_email}.{employee_id}@fisstacademy.com")
+            else:
+                seen_bases.add(base_email)
+                work_emails.append(f"{base_email}@fisstacademy.com")
+        personal_emails = [f"{base_email}@gmail.com" for base_email in base_emails]
         
-        for i in range(num_employees):
-            employee_id = i + 1  # Integer employee_id starting from 1
-            
-            # Generate Indian name components
-            name_parts = self.fake.indian_name().split()
-            first_name = name_parts[0]
-            last_name = name_parts[1] if len(name_parts) > 1 else 'Kumar'
-            
-            # Generate unique emails
-            base_work_email = f"{first_name.lower()}.{last_name.lower()}"
-            work_email = f"{base_work_email}@fisstacademy.com"
-            counter = 1
-            while work_email in used_emails:
-                work_email = f"{base_work_email}{counter}@fisstacademy.com"
-                counter += 1
-            used_emails.add(work_email)
-            
-            personal_email = f"{base_work_email}@gmail.com"
-            email = work_email  # Primary email
-            
-            # Generate other details
-            gender = random.choice(['M', 'F'])
-            date_of_birth = self.fake.date_between(start_date='-65y', end_date='-22y')
-            age = 2024 - date_of_birth.year
-            blood_group = random.choice(blood_groups)
-            marital_status = random.choice(marital_statuses)
-            phone_number = self.fake.indian_phone()
-            city = self.fake.indian_city()
-            address = f"{random.randint(1, 999)}, {self.fake.street_name()}, {city}"
-            state = random.choice(indian_states)
-            postal_code = str(random.randint(100000, 999999))
-            country = 'India'
-            designation = random.choice(designations)
-            department = random.choice(departments)
-            salary = round(random.uniform(300000, 2000000), 2)
-            work_experience_years = round(random.uniform(0.5, 20.0), 1)
-            joining_date = self.fake.date_between(start_date='-10y', end_date='today')
-            
-            # Emergency contact
-            emergency_contact_name = self.fake.indian_name()
-            emergency_contact_phone = self.fake.indian_phone()
-            
-            # Family and medical details
-            family_details = f"Family of {random.randint(2, 6)} members"
-            medical_conditions = random.choice(['None', 'Diabetes', 'Hypertension', 'Asthma', 'None', 'None'])
-            
-            # Simulation type
-            simulation_type = 'Baseline Assessment'
-            
-            # Use consistent statistics with small individual variations
-            base_click_rate = consistent_stats['phishing_click_rate']
-            click_response_rate = round(random.uniform(base_click_rate - 1, base_click_rate + 1), 2)
-            phish_last_simulation_date = self.fake.date_between(start_date='-6m', end_date='-3m')
-            phish_testing_status = 'Completed'
-            
-            # Vishing data with consistent stats
-            vishing_phone_number = phone_number
-            vishing_alt_phone_number = self.fake.indian_phone()
-            voice_auth_test = random.choice([True, False])
-            base_vish_rate = consistent_stats['vishing_response_rate']
-            vish_response_rate = round(random.uniform(base_vish_rate - 1, base_vish_rate + 1), 2)
-            vish_last_simulation_date = self.fake.date_between(start_date='-6m', end_date='-3m')
-            vish_testing_status = 'Completed'
-            
-            # Quishing data
-            base_quish_rate = consistent_stats['quishing_scan_rate']
-            quish_response_rate = round(random.uniform(base_quish_rate - 1, base_quish_rate + 1), 2)
-            quish_last_simulation_date = self.fake.date_between(start_date='-6m', end_date='-3m')
-            quish_testing_status = 'Completed'
-            
-            # Branch and assessment data
-            branch_idx = i % len(branch_codes)
-            branch_location = branch_locations[branch_idx]
-            branch_code = branch_codes[branch_idx]
-            total_employees_at_branch = random.randint(15, 50)
-            security_level = random.choice(['Low', 'Medium', 'High'])
-            building_storeys = random.randint(1, 10)
-            
-            # Assessment details
-            assessment_date = self.fake.date_between(start_date='-3m', end_date='today')
-            assessment_time_start = self.fake.time()
-            assessment_time_end = self.fake.time()
-            permission_granted = random.choice([True, False])
-            approving_official_name = self.fake.indian_name()
-            approving_official_designation = random.choice(['Manager', 'Director', 'VP', 'Senior Manager'])
-            
-            # Security flags
-            identity_verification_required = True
-            identity_verified = random.choice([True, False])
-            security_guard_present = random.choice([True, False])
-            visitor_log_maintained = True
-            badge_issued = random.choice([True, False])
-            escort_required = random.choice([True, False])
-            restricted_areas_accessed = random.choice([True, False])
-            tailgating_possible = random.choice([True, False])
-            social_engineering_successful = random.choice([True, False])
-            
-            # Use consistent scores with small variations
-            base_physical = consistent_stats['physical_security_score']
-            base_human = consistent_stats['human_security_score']
-            physical_security_score = round(random.uniform(base_physical - 0.5, base_physical + 0.5), 1)
-            human_security_score = round(random.uniform(base_human - 0.5, base_human + 0.5), 1)
-            overall_assessment_score = round((physical_security_score + human_security_score) / 2, 1)
-            
-            # Assessment details
-            vulnerabilities_found = random.choice([
-                'Weak access controls', 'Inadequate visitor management', 'Social engineering susceptibility',
-                'Poor password practices', 'Unsecured workstations', 'None significant'
-            ])
-            recommendations = random.choice([
-                'Implement two-factor authentication', 'Enhanced security training',
-                'Improve visitor access controls', 'Regular security assessments',
-                'Employee awareness programs', 'Continue current practices'
-            ])
-            assessor_name = self.fake.indian_name()
-            assessor_id = f"ASST{random.randint(1, 20):02d}"
-            notes = f"Assessment completed for {department} department employee"
-            red_team_testing_status = 'Completed'
-            organisation_name = 'FISST Academy'
-            
-            employees_data.append((
-                employee_id, first_name, last_name, gender, date_of_birth, age, blood_group, marital_status,
-                email, phone_number, address, state, postal_code, country, designation, department,
-                salary, work_experience_years, joining_date, emergency_contact_name, emergency_contact_phone,
-                family_details, medical_conditions, simulation_type, work_email, personal_email,
-                click_response_rate, phish_last_simulation_date, phish_testing_status,
-                vishing_phone_number, vishing_alt_phone_number, voice_auth_test, vish_response_rate,
-                vish_last_simulation_date, vish_testing_status,
-                quish_response_rate, quish_last_simulation_date, quish_testing_status,
-                branch_location, branch_code, total_employees_at_branch, security_level, building_storeys,
-                assessment_date, assessment_time_start, assessment_time_end, permission_granted, 
-                approving_official_name, approving_official_designation, identity_verification_required, 
-                identity_verified, security_guard_present, visitor_log_maintained, badge_issued, 
-                escort_required, restricted_areas_accessed, tailgating_possible, social_engineering_successful,
-                physical_security_score, human_security_score, overall_assessment_score,
-                vulnerabilities_found, recommendations, assessor_name, assessor_id, notes, 
-                red_team_testing_status, organisation_name
-            ))
+        columns[EMPLOYEE_MASTER_COLUMNS.index('email')] = work_emails  # Primary email
+        columns[EMPLOYEE_MASTER_COLUMNS.index('work_email')] = work_emails
+        columns[EMPLOYEE_MASTER_COLUMNS.index('personal_email')] = personal_emails
         
+        # Columns stay separate until insert time; LOAD DATA streams them row by row
+        # serial_nos is only collected when lastrowid arithmetic is safe; otherwise they are read back
+        serial_nos = [] if self._insert_ids_are_consecutive() else None
         try:
-            sql = """
-            INSERT INTO employee_master (
-                employee_id, first_name, last_name, gender, date_of_birth, age, blood_group, marital_status,
-                email, phone_number, address, state, postal_code, country, designation, department,
-                salary, work_experience_years, joining_date, emergency_contact_name, emergency_contact_phone,
-                family_details, medical_conditions, simulation_type, work_email, personal_email,
-                click_response_rate, phish_last_simulation_date, phish_testing_status,
-                vishing_phone_number, vishing_alt_phone_number, voice_auth_test, vish_response_rate,
-                vish_last_simulation_date, vish_testing_status,
-                quish_response_rate, quish_last_simulation_date, quish_testing_status,
-                branch_location, branch_code, total_employees_at_branch, security_level, building_storeys,
-                assessment_date, assessment_time_start, assessment_time_end, permission_granted, 
-                approving_official_name, approving_official_designation, identity_verification_required, 
-                identity_verified, security_guard_present, visitor_log_maintained, badge_issued, 
-                escort_required, restricted_areas_accessed, tailgating_possible, social_engineering_successful,
-                physical_security_score, human_security_score, overall_assessment_score,
-                vulnerabilities_found, recommendations, assessor_name, assessor_id, notes, 
-                red_team_testing_status, organisation_name
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
+            if num_employees > LOAD_DATA_MIN_ROWS and self._local_infile_available():
+                try:
+                    self._load_data_infile('employee_master', EMPLOYEE_MASTER_COLUMNS, zip(*columns))
+                except mysql.connector.Error as e:
+                    print(f"⚠️  LOAD DATA LOCAL INFILE unavailable ({e}), falling back to INSERT batches")
+                    self._bulk_insert('employee_master', EMPLOYEE_MASTER_COLUMNS, zip(*columns), insert_ids=serial_nos)
+            else:
+                self._bulk_insert('employee_master', EMPLOYEE_MASTER_COLUMNS, zip(*columns), insert_ids=serial_nos)
             
-            self.cursor.executemany(sql, employees_data)
-            self.connection.commit()
+            # Keep (serial_no, employee_id) pairs when every generated serial_no is known
+            if serial_nos is not None and len(serial_nos) == num_employees:
+                self.inserted_employees = list(zip(serial_nos, columns[EMPLOYEE_MASTER_COLUMNS.index('employee_id')]))
+            else:
+                self.inserted_employees = None
+            self._commit()
             print(f"✓ Generated {num_employees} employees in employee_master table!")
             return True
             
@@ -488,50 +937,47 @@ class DatabasePopulator:
         """Get list of employee IDs and serial numbers"""
         try:
             self.cursor.execute("SELECT serial_no, employee_id FROM employee_master")
-            results = self.cursor.fetchall()
-            return [(row['serial_no'], row['employee_id']) for row in results]
+            return self.cursor.fetchall()
         except Exception as e:
             print(f"Error fetching employee IDs: {e}")
             return []
     
-    def generate_phish_smish_simulations(self, employee_data):
-        """Generate phishing/smishing simulation data"""
-        consistent_stats = self.generate_consistent_statistics(len(employee_data))
+    def _phish_smish_rows(self, employee_data, rng=None, fake=None):
+        """Yield phishing/smishing simulation data rows"""
+        consistent_stats = self._consistent_stats
         base_click_rate = consistent_stats['phishing_click_rate']
         
-        sim_data = []
-        simulation_types = ['Email', 'SMS']
-        testing_statuses = ['Completed', 'Pending', 'Failed', 'Passed']
-        
-        for serial_no, employee_id in employee_data:
-            # Generate multiple simulation entries per employee
-            for _ in range(random.randint(2, 4)):
-                simulation_type = random.choice(simulation_types)
-                work_email = f"emp{employee_id}@fisstacademy.com"
-                personal_email = f"emp{employee_id}@gmail.com"
-                phone_number = self.fake.indian_phone()
-                
-                # Use consistent statistics with small individual variations
-                click_response_rate = round(random.uniform(base_click_rate - 1.5, base_click_rate + 1.5), 2)
-                last_simulation_date = self.fake.date_between(start_date='-6m', end_date='today')
-                testing_status = random.choice(testing_statuses)
-                
-                sim_data.append((
-                    serial_no, employee_id, simulation_type, work_email, personal_email,
-                    phone_number, click_response_rate, last_simulation_date, testing_status
-                ))
+        rng = rng or self.rng
+        fake = fake or self.fake
+        recent_dates = date_range_pool(6 * DAYS_PER_MONTH)
+        simulation_types = ('Email', 'SMS')
         
-        try:
-            sql = """
-            INSERT INTO employee_phish_smish_sim (
-                serial_no, employee_id, simulation_type, work_email, personal_email, 
-                phone_number, click_response_rate, last_simulation_date, testing_status
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
+        for block in batched(employee_data, SIMULATION_BLOCK_EMPLOYEES):
+            # Generate multiple simulation entries per employee, drawn column by column
+            serial_nos, employee_ids = repeat_pairs(block, rng.choices(range(2, 5), k=len(block)))
+            total = len(serial_nos)
             
-            self.cursor.executemany(sql, sim_data)
-            self.connection.commit()
-            print(f"✓ Generated {len(sim_data)} phishing/smishing simulation entries!")
+            yield from zip(
+                serial_nos,
+                employee_ids,
+                rng.choices(simulation_types, k=total),
+                [f"emp{employee_id}@fisstacademy.com" for employee_id in employee_ids],
+                [f"emp{employee_id}@gmail.com" for employee_id in employee_ids],
+                fake.batch_phones(total),
+                # Use consistent statistics with small individual variations
+                [round(rng.uniform(base_click_rate - 1.5, base_click_rate + 1.5), 2) for _ in range(total)],
+                rng.choices(recent_dates, k=total),
+                rng.choices(SIMULATION_TESTING_STATUSES, k=total),
+            )
+    
+    def generate_phish_smish_simulations(self, employee_data):
+        """Generate phishing/smishing simulation data"""
+        try:
+            # Two to four phishing/smishing entries per employee
+            inserted = self._insert_rows('employee_phish_smish_sim', PHISH_SMISH_COLUMNS,
+                                         self._phish_smish_rows(employee_data), 3 * len(employee_data))
+            self._commit()
+            print(f"✓ Generated {inserted} phishing/smishing simulation entries!")
             return True
             
         except Exception as e:
@@ -539,42 +985,38 @@ class DatabasePopulator:
             self.connection.rollback()
             return False
     
-    def generate_vishing_simulations(self, employee_data):
-        """Generate vishing simulation data"""
-        consistent_stats = self.generate_consistent_statistics(len(employee_data))
+    def _vishing_rows(self, employee_data, rng=None, fake=None):
+        """Yield vishing simulation data rows"""
+        consistent_stats = self._consistent_stats
         base_vish_rate = consistent_stats['vishing_response_rate']
         
-        sim_data = []
-        testing_statuses = ['Completed', 'Pending', 'Failed', 'Passed']
+        rng = rng or self.rng
+        fake = fake or self.fake
+        recent_dates = date_range_pool(6 * DAYS_PER_MONTH)
         
-        for serial_no, employee_id in employee_data:
-            # Generate vishing simulation entries
-            for _ in range(random.randint(1, 3)):
-                phone_number = self.fake.indian_phone()
-                alt_phone_number = self.fake.indian_phone()
-                voice_auth_test = random.choice([True, False])
-                
+        for block in batched(employee_data, SIMULATION_BLOCK_EMPLOYEES):
+            # Generate vishing simulation entries, drawn column by column
+            serial_nos, employee_ids = repeat_pairs(block, rng.choices(range(1, 4), k=len(block)))
+            total = len(serial_nos)
+            
+            yield from zip(
+                serial_nos,
+                employee_ids,
+                fake.batch_phones(total),
+                fake.batch_phones(total),
+                random_flag_columns(1, total, rng)[0],
                 # Use consistent statistics with small individual variations
-                vish_response_rate = round(random.uniform(base_vish_rate - 1.5, base_vish_rate + 1.5), 2)
-                last_simulation = self.fake.date_between(start_date='-6m', end_date='today')
-                testing_status = random.choice(testing_statuses)
-                
-                sim_data.append((
-                    serial_no, employee_id, phone_number, alt_phone_number, voice_auth_test,
-                    vish_response_rate, last_simulation, testing_status
-                ))
-        
+                [round(rng.uniform(base_vish_rate - 1.5, base_vish_rate + 1.5), 2) for _ in range(total)],
+                rng.choices(recent_dates, k=total),
+                rng.choices(SIMULATION_TESTING_STATUSES, k=total),
+            )
+    
+    def generate_vishing_simulations(self, employee_data):
+        """Generate vishing simulation data"""
         try:
-            sql = """
-            INSERT INTO employee_vishing_sim (
-                serial_no, employee_id, phone_number, alt_phone_number, voice_auth_test,
-                vish_response_rate, last_simulation, testing_status
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            
-            self.cursor.executemany(sql, sim_data)
-            self.connection.commit()
-            print(f"✓ Generated {len(sim_data)} vishing simulation entries!")
+            inserted = self._bulk_insert('employee_vishing_sim', VISHING_COLUMNS, self._vishing_rows(employee_data))
+            self._commit()
+            print(f"✓ Generated {inserted} vishing simulation entries!")
             return True
             
         except Exception as e:
@@ -582,54 +1024,49 @@ class DatabasePopulator:
             self.connection.rollback()
             return False
     
-    def generate_quishing_simulations(self, employee_data):
-        """Generate quishing simulation data"""
-        consistent_stats = self.generate_consistent_statistics(len(employee_data))
+    def _quishing_rows(self, employee_data, rng=None, fake=None):
+        """Yield quishing simulation data rows"""
+        consistent_stats = self._consistent_stats
         base_qr_scan_rate = consistent_stats['quishing_scan_rate']
         
-        sim_data = []
-        qr_links = [
+        rng = rng or self.rng
+        recent_dates = date_range_pool(6 * DAYS_PER_MONTH)
+        qr_links = (
             'https://fake-payment.com/qr123',
             'https://fake-wifi.com/connect',
             'https://fake-survey.com/form456',
             'https://fake-menu.com/restaurant',
             'https://fake-download.com/app789'
-        ]
-        devices = ['Mobile', 'Desktop', 'Tablet']
-        locations = ['Office', 'Cafe', 'Home', 'Mall', 'Restaurant']
-        response_actions = ['Clicked', 'Ignored', 'Reported']
-        testing_statuses = ['Completed', 'Pending', 'Failed', 'Passed']
-        
-        for serial_no, employee_id in employee_data:
-            # Generate quishing simulation entries
-            for _ in range(random.randint(1, 2)):
-                qr_code_link = random.choice(qr_links)
-                device_used = random.choice(devices)
-                scan_location = random.choice(locations)
-                scan_time = self.fake.date_time_between(start_date='-6m', end_date='now')
-                response_action = random.choice(response_actions)
-                
-                # Use consistent statistics with small individual variations
-                quish_response_rate = round(random.uniform(base_qr_scan_rate - 1.5, base_qr_scan_rate + 1.5), 2)
-                last_simulation_date = self.fake.date_between(start_date='-6m', end_date='today')
-                testing_status = random.choice(testing_statuses)
-                
-                sim_data.append((
-                    serial_no, employee_id, qr_code_link, device_used, scan_location, scan_time,
-                    response_action, quish_response_rate, last_simulation_date, testing_status
-                ))
+        )
+        devices = ('Mobile', 'Desktop', 'Tablet')
+        locations = ('Office', 'Cafe', 'Home', 'Mall', 'Restaurant')
+        response_actions = ('Clicked', 'Ignored', 'Reported')
         
-        try:
-            sql = """
-            INSERT INTO employee_quishing_sim (
-                serial_no, employee_id, qr_code_link, device_used, scan_location, scan_time,
-                response_action, quish_response_rate, last_simulation_date, testing_status
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
+        for block in batched(employee_data, SIMULATION_BLOCK_EMPLOYEES):
+            # Generate quishing simulation entries, drawn column by column
+            serial_nos, employee_ids = repeat_pairs(block, rng.choices(range(1, 3), k=len(block)))
+            total = len(serial_nos)
             
-            self.cursor.executemany(sql, sim_data)
-            self.connection.commit()
-            print(f"✓ Generated {len(sim_data)} quishing simulation entries!")
+            yield from zip(
+                serial_nos,
+                employee_ids,
+                rng.choices(qr_links, k=total),
+                rng.choices(devices, k=total),
+                rng.choices(locations, k=total),
+                random_datetimes(6 * DAYS_PER_MONTH, total, rng),
+                rng.choices(response_actions, k=total),
+                # Use consistent statistics with small individual variations
+                [round(rng.uniform(base_qr_scan_rate - 1.5, base_qr_scan_rate + 1.5), 2) for _ in range(total)],
+                rng.choices(recent_dates, k=total),
+                rng.choices(SIMULATION_TESTING_STATUSES, k=total),
+            )
+    
+    def generate_quishing_simulations(self, employee_data):
+        """Generate quishing simulation data"""
+        try:
+            inserted = self._bulk_insert('employee_quishing_sim', QUISHING_COLUMNS, self._quishing_rows(employee_data))
+            self._commit()
+            print(f"✓ Generated {inserted} quishing simulation entries!")
             return True
             
         except Exception as e:
@@ -637,94 +1074,149 @@ class DatabasePopulator:
             self.connection.rollback()
             return False
     
-    def generate_red_team_assessments(self, employee_data):
-        """Generate red team assessment data"""
-        consistent_stats = self.generate_consistent_statistics(len(employee_data))
-        
-        assessment_data = []
-        security_levels = ['Low', 'Medium', 'High', 'Critical']
-        testing_statuses = ['Completed', 'In Progress', 'Scheduled', 'Cancelled']
-        branch_codes = ['MUM01', 'DEL02', 'BLR03', 'HYD04', 'CHN05', 'KOL06', 'PUN07', 'AHM08']
-        branch_locations = ['Mumbai', 'Delhi', 'Bangalore', 'Hyderabad', 'Chennai', 'Kolkata', 'Pune', 'Ahmedabad']
-        
-        for serial_no, employee_id in employee_data:
-            # Generate assessment entries (not every employee gets assessed)
-            if random.random() < 0.7:  # 70% of employees get assessed
-                branch_idx = (employee_id - 1) % len(branch_codes)
-                branch_location = branch_locations[branch_idx]
-                branch_code = branch_codes[branch_idx]
-                total_employees_at_branch = random.randint(15, 50)
-                security_level = random.choice(security_levels)
-                building_storeys = random.randint(1, 10)
-                
-                assessment_date = self.fake.date_between(start_date='-3m', end_date='today')
-                assessment_time_start = self.fake.time()
-                assessment_time_end = self.fake.time()
-                permission_granted = random.choice([True, False])
-                approving_official_name = self.fake.indian_name()
-                approving_official_designation = random.choice(['Manager', 'Director', 'VP', 'Senior Manager'])
-                
+    def _connection_pool(self):
+        """Open the connection pool on first use; only --parallel-load needs more than one connection"""
+        if self.pool is None:
+            self.pool = pooling.MySQLConnectionPool(
+                pool_name='populator', pool_size=CONNECTION_POOL_SIZE, **self.connection_config
+            )
+        return self.pool
+    
+    @contextmanager
+    def _borrow(self):
+        """Borrow a pooled connection and cursor, returning them to the pool afterwards"""
+        connection = self._connection_pool().get_connection()
+        cursor = connection.cursor()
+        try:
+            yield connection, cursor
+        finally:
+            cursor.close()
+            connection.close()
+    
+    def _load_table_from_pool(self, table, columns, build_rows, employee_data, expected_rows, seed):
+        """Generate and load one table on its own pooled connection and commit it"""
+        # Worker threads draw from their own generators rather than sharing self.rng/self.fake
+        rng, fake = seeded_generators(seed)
+        rows = build_rows(employee_data, rng, fake)
+        with self._borrow() as (connection, cursor):
+            insert_cursor = connection.cursor(prepared=True)
+            cursor.execute("SET SESSION unique_checks = 0")
+            cursor.execute("SET SESSION foreign_key_checks = 0")
+            try:
+                inserted = self._insert_rows(table, columns, rows, expected_rows, cursor=cursor, insert_cursor=insert_cursor)
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                insert_cursor.close()
+                cursor.execute("SET SESSION unique_checks = 1")
+                cursor.execute("SET SESSION foreign_key_checks = 1")
+        return inserted
+    
+    def load_simulations_concurrently(self, employee_data):
+        """Generate the simulation and red team tables and load them in parallel on pooled connections"""
+        # LOAD DATA support is probed and the pool opened here so worker threads never race on them
+        self._local_infile_available()
+        self._connection_pool()
+        # Only the two largest tables are worth a LOAD DATA round trip
+        employee_count = len(employee_data)
+        jobs = [
+            ('employee_phish_smish_sim', PHISH_SMISH_COLUMNS, self._phish_smish_rows, 3 * employee_count, 'phishing/smishing simulation'),
+            ('employee_vishing_sim', VISHING_COLUMNS, self._vishing_rows, 0, 'vishing simulation'),
+            ('employee_quishing_sim', QUISHING_COLUMNS, self._quishing_rows, 0, 'quishing simulation'),
+            ('red_team_assessment', RED_TEAM_COLUMNS, self._red_team_rows, int(employee_count * 0.7), 'red team assessment'),
+        ]
+        
+        success = True
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = [(executor.submit(self._load_table_from_pool, table, columns, build_rows, employee_data,
+                                        expected_rows, self.rng.getrandbits(32)), label)
+                       for table, columns, build_rows, expected_rows, label in jobs]
+            for future, label in futures:
+                try:
+                    print(f"✓ Generated {future.result()} {label} entries!")
+                except Exception as e:
+                    print(f"✗ Error generating {label}s: {e}")
+                    success = False
+        return success
+    
+    def _red_team_rows(self, employee_data, rng=None, fake=None):
+        """Yield red team assessment rows from block-wise column draws"""
+        consistent_stats = self._consistent_stats
+        
+        rng = rng or self.rng
+        fake = fake or self.fake
+        security_levels = ('Low', 'Medium', 'High', 'Critical')
+        testing_statuses = ('Completed', 'In Progress', 'Scheduled', 'Cancelled')
+        
+        # Consistent base scores shared by every block
+        base_physical = consistent_stats['physical_security_score']
+        base_human = consistent_stats['human_security_score']
+        
+        # Employees are processed a block at a time so memory stays flat as the table grows
+        for block in batched(employee_data, SIMULATION_BLOCK_EMPLOYEES):
+            # Generate assessment entries (not every employee gets assessed): 70% of employees get assessed,
+            # picked by sampling positions rather than drawing a random number per employee
+            picked = sorted(rng.sample(range(len(block)), round(len(block) * 0.7)))
+            assessed = [block[position] for position in picked]
+            k = len(assessed)
+            serial_nos = [serial_no for serial_no, _ in assessed]
+            employee_ids = [employee_id for _, employee_id in assessed]
+            locations, codes = branch_columns(employee_ids)
+            
+            # Use consistent scores with small variations
+            physical_scores = [round(rng.uniform(base_physical - 0.5, base_physical + 0.5), 1) for _ in range(k)]
+            human_scores = [round(rng.uniform(base_human - 0.5, base_human + 0.5), 1) for _ in range(k)]
+            
+            # The eight random True/False columns come from one packed bit draw
+            flags = iter(random_flag_columns(RED_TEAM_FLAG_COLUMNS, k, rng))
+            
+            columns = [
+                serial_nos,
+                employee_ids,
+                locations,
+                codes,
+                rng.choices(range(15, 51), k=k),
+                rng.choices(security_levels, k=k),
+                rng.choices(range(1, 11), k=k),
+                random_dates(3 * DAYS_PER_MONTH, 0, k, rng),
+                random_times(k, rng),
+                random_times(k, rng),
+                next(flags),
+                fake.batch_full_names(k),
+                rng.choices(CONTACT_ROLES, k=k),
                 # Security measures
-                identity_verification_required = True
-                identity_verified = random.choice([True, False])
-                security_guard_present = random.choice([True, False])
-                visitor_log_maintained = True
-                badge_issued = random.choice([True, False])
-                escort_required = random.choice([True, False])
-                restricted_areas_accessed = random.choice([True, False])
-                tailgating_possible = random.choice([True, False])
-                social_engineering_successful = random.choice([True, False])
-                
-                # Use consistent scores with small variations
-                base_physical = consistent_stats['physical_security_score']
-                base_human = consistent_stats['human_security_score']
-                physical_security_score = round(random.uniform(base_physical - 0.5, base_physical + 0.5), 1)
-                human_security_score = round(random.uniform(base_human - 0.5, base_human + 0.5), 1)
-                overall_assessment_score = round((physical_security_score + human_security_score) / 2, 1)
-                
+                [True] * k,
+                next(flags),
+                next(flags),
+                [True] * k,
+                next(flags),
+                next(flags),
+                next(flags),
+                next(flags),
+                next(flags),
+                physical_scores,
+                human_scores,
+                [round((physical + human) / 2, 1) for physical, human in zip(physical_scores, human_scores)],
                 # Assessment details
-                vulnerabilities_found = random.choice([
-                    'Weak access controls', 'Inadequate visitor management', 'Social engineering susceptibility',
-                    'Poor password practices', 'Unsecured workstations', 'None significant'
-                ])
-                recommendations = random.choice([
-                    'Implement two-factor authentication', 'Enhanced security training',
-                    'Improve visitor access controls', 'Regular security assessments',
-                    'Employee awareness programs', 'Continue current practices'
-                ])
-                assessor_name = self.fake.indian_name()
-                assessor_id = f"ASST{random.randint(1, 20):02d}"
-                notes = f"Assessment completed for employee {employee_id}"
-                testing_status = random.choice(testing_statuses)
-                
-                assessment_data.append((
-                    serial_no, employee_id, branch_location, branch_code, total_employees_at_branch,
-                    security_level, building_storeys, assessment_date, assessment_time_start, assessment_time_end,
-                    permission_granted, approving_official_name, approving_official_designation,
-                    identity_verification_required, identity_verified, security_guard_present, visitor_log_maintained,
-                    badge_issued, escort_required, restricted_areas_accessed, tailgating_possible,
-                    social_engineering_successful, physical_security_score, human_security_score, 
-                    overall_assessment_score, vulnerabilities_found, recommendations, assessor_name, 
-                    assessor_id, notes, testing_status
-                ))
-        
+                rng.choices(SECURITY_VULNERABILITIES, k=k),
+                rng.choices(SECURITY_RECOMMENDATIONS, k=k),
+                fake.batch_full_names(k),
+                [f"ASST{assessor:02d}" for assessor in rng.choices(range(1, 21), k=k)],
+                [f"Assessment completed for employee {employee_id}" for employee_id in employee_ids],
+                rng.choices(testing_statuses, k=k),
+            ]
+            yield from zip(*columns)
+    
+    def generate_red_team_assessments(self, employee_data):
+        """Generate red team assessment data"""
         try:
-            sql = """
-            INSERT INTO red_team_assessment (
-                serial_no, employee_id, branch_location, branch_code, total_employees_at_branch,
-                security_level, building_storeys, assessment_date, assessment_time_start, assessment_time_end,
-                permission_granted, approving_official_name, approving_official_designation,
-                identity_verification_required, identity_verified, security_guard_present, visitor_log_maintained,
-                badge_issued, escort_required, restricted_areas_accessed, tailgating_possible,
-                social_engineering_successful, physical_security_score, human_security_score, 
-                overall_assessment_score, vulnerabilities_found, recommendations, assessor_name, 
-                assessor_id, notes, testing_status
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            
-            self.cursor.executemany(sql, assessment_data)
-            self.connection.commit()
-            print(f"✓ Generated {len(assessment_data)} red team assessment entries!")
+            # About 70% of employees are assessed
+            inserted = self._insert_rows('red_team_assessment', RED_TEAM_COLUMNS,
+                                         self._red_team_rows(employee_data), int(len(employee_data) * 0.7))
+            self._commit()
+            print(f"✓ Generated {inserted} red team assessment entries!")
             return True
             
         except Exception as e:
@@ -737,79 +1229,65 @@ class DatabasePopulator:
         print("\n=== Generated Data Statistics Summary ===")
         
         try:
+            # All aggregates come back from one UNION ALL round trip, keyed by metric
+            with self.connection.cursor(dictionary=True) as cursor:
+                cursor.execute("""
+                    SELECT 'employees' AS metric, COUNT(*) AS total, NULL AS avg_1, NULL AS avg_2, NULL AS avg_3
+                    FROM employee_master
+                    UNION ALL
+                    SELECT 'phish', COUNT(*), AVG(click_response_rate), NULL, NULL
+                    FROM employee_phish_smish_sim
+                    UNION ALL
+                    SELECT 'vish', COUNT(*), AVG(vish_response_rate), NULL, NULL
+                    FROM employee_vishing_sim
+                    UNION ALL
+                    SELECT 'quish', COUNT(*), AVG(quish_response_rate), NULL, NULL
+                    FROM employee_quishing_sim
+                    UNION ALL
+                    SELECT 'red_team', COUNT(*), AVG(physical_security_score),
+                           AVG(human_security_score), AVG(overall_assessment_score)
+                    FROM red_team_assessment
+                """)
+                metrics = {row['metric']: row for row in cursor.fetchall()}
+            
             # Employee statistics
-            self.cursor.execute("SELECT COUNT(*) as count FROM employee_master")
-            employee_count = self.cursor.fetchone()['count']
-            print(f"Total Employees: {employee_count}")
+            print(f"Total Employees: {metrics['employees']['total']}")
             
             # Phishing statistics
-            self.cursor.execute("""
-                SELECT 
-                    AVG(click_response_rate) as avg_click_rate,
-                    COUNT(*) as total_phish_sims
-                FROM employee_phish_smish_sim
-            """)
-            phish_metrics = self.cursor.fetchone()
+            phish_metrics = metrics.get('phish')
             if phish_metrics:
-                avg_click = phish_metrics['avg_click_rate']
-                total_phish = phish_metrics['total_phish_sims']
-                print(f"Phishing Simulations: {total_phish} total")
-                print(f"Average Click Rate: {avg_click:.1f}%")
+                print(f"Phishing Simulations: {phish_metrics['total']} total")
+                print(f"Average Click Rate: {phish_metrics['avg_1']:.1f}%")
             
             # Vishing statistics
-            self.cursor.execute("""
-                SELECT 
-                    AVG(vish_response_rate) as avg_vish_rate,
-                    COUNT(*) as total_vish_sims
-                FROM employee_vishing_sim
-            """)
-            vish_metrics = self.cursor.fetchone()
+            vish_metrics = metrics.get('vish')
             if vish_metrics:
-                avg_vish = vish_metrics['avg_vish_rate']
-                total_vish = vish_metrics['total_vish_sims']
-                print(f"Vishing Simulations: {total_vish} total")
-                print(f"Average Response Rate: {avg_vish:.1f}%")
+                print(f"Vishing Simulations: {vish_metrics['total']} total")
+                print(f"Average Response Rate: {vish_metrics['avg_1']:.1f}%")
             
             # Quishing statistics
-            self.cursor.execute("""
-                SELECT 
-                    AVG(quish_response_rate) as avg_qr_scan_rate,
-                    COUNT(*) as total_quishing_sims
-                FROM employee_quishing_sim
-            """)
-            quish_metrics = self.cursor.fetchone()
+            quish_metrics = metrics.get('quish')
             if quish_metrics:
-                avg_qr_scan = quish_metrics['avg_qr_scan_rate']
-                total_quish = quish_metrics['total_quishing_sims']
-                print(f"Quishing Simulations: {total_quish} total")
-                print(f"QR Scan Rate: {avg_qr_scan:.1f}%")
+                print(f"Quishing Simulations: {quish_metrics['total']} total")
+                print(f"QR Scan Rate: {quish_metrics['avg_1']:.1f}%")
             
             # Red team assessment statistics
-            self.cursor.execute("""
-                SELECT 
-                    AVG(physical_security_score) as avg_physical_score,
-                    AVG(human_security_score) as avg_human_score,
-                    AVG(overall_assessment_score) as avg_overall_score,
-                    COUNT(*) as total_assessments
-                FROM red_team_assessment
-            """)
-            assessment_metrics = self.cursor.fetchone()
+            assessment_metrics = metrics.get('red_team')
             if assessment_metrics:
-                avg_physical = assessment_metrics['avg_physical_score']
-                avg_human = assessment_metrics['avg_human_score']
-                avg_overall = assessment_metrics['avg_overall_score']
-                total_assessments = assessment_metrics['total_assessments']
-                print(f"Red Team Assessments: {total_assessments} total")
-                print(f"Physical Security Score: {avg_physical:.1f}/10")
-                print(f"Human Security Score: {avg_human:.1f}/10")
-                print(f"Overall Assessment Score: {avg_overall:.1f}/10")
+                print(f"Red Team Assessments: {assessment_metrics['total']} total")
+                print(f"Physical Security Score: {assessment_metrics['avg_1']:.1f}/10")
+                print(f"Human Security Score: {assessment_metrics['avg_2']:.1f}/10")
+                print(f"Overall Assessment Score: {assessment_metrics['avg_3']:.1f}/10")
             
         except Exception as e:
             print(f"Error generating statistics: {e}")
     
     def close_connection(self):
         """Close database connection"""
+        if self.insert_cursor:
+            self.insert_cursor.close()
         if self.cursor:
+            self._restore_session()
             self.cursor.close()
         if self.connection:
             self.connection.close()
@@ -828,8 +1306,22 @@ def get_yes_no_input(prompt):
             print("Please enter 'yes' or 'no'")
 
 
-def main():
+def parse_args(argv=None):
+    """Parse command-line options for the bulk load"""
+    parser = argparse.ArgumentParser(description="Populate the FISST Academy MySQL tables with fake data")
+    parser.add_argument('--relax-durability', action='store_true',
+                        help="Relax global redo log and binlog flushing for the duration of the run")
+    parser.add_argument('--parallel-load', action='store_true',
+                        help="Load the simulation and red team tables concurrently on pooled connections; "
+                             "not atomic, so tables loaded before a failure stay committed")
+    parser.add_argument('--drop-indexes', action='store_true',
+                        help="Drop non-unique secondary indexes for the bulk load and rebuild them afterwards")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Main function"""
+    args = parse_args(argv)
     print("FISST Academy MySQL Database Populator")
     print("=" * 50)
     print("🚀 This script populates existing MySQL tables with realistic cybersecurity simulation data.")
@@ -846,6 +1338,8 @@ def main():
         if not populator.connect_to_database(config):
             return
         
+        populator._apply_bulk_session_tuning(relax_durability=args.relax_durability)
+        
         # Verify tables exist
         if not populator.verify_tables_exist():
             print("\n❌ Required tables are missing. Please create them first using the provided SQL schema.")
@@ -887,21 +1381,54 @@ def main():
         print(f"\n🎯 Generating data for {num_employees} employees...")
         print("📊 Using consistent statistics to ensure reliable reporting metrics...")
         
-        # Generate all data
-        if populator.generate_employees(num_employees):
-            employee_data = populator.get_employee_ids()
-            
-            if (populator.generate_phish_smish_simulations(employee_data) and
-                populator.generate_vishing_simulations(employee_data) and
-                populator.generate_quishing_simulations(employee_data) and
-                populator.generate_red_team_assessments(employee_data)):
+        # Generate all data inside a single bulk-load transaction
+        # ALTER TABLE commits implicitly, so indexes are dropped before the transaction begins
+        dropped_indexes = {}
+        if args.drop_indexes:
+            dropped_indexes = {table: populator._drop_secondary_indexes(table) for table in POPULATED_TABLES}
+        populator._begin_bulk_load()
+        generated = False
+        try:
+            if populator.generate_employees(num_employees):
+                employee_data = populator.inserted_employees or populator.get_employee_ids()
                 
-                print("\n✅ All data generated successfully!")
-                populator.display_statistics_summary()
+                if args.parallel_load:
+                    # Pooled connections cannot see this transaction, so publish employees first;
+                    # each worker commits its own table, so from here on the run is not atomic
+                    populator.connection.commit()
+                    try:
+                        generated = populator.load_simulations_concurrently(employee_data)
+                    finally:
+                        if not generated:
+                            print("\n⚠️  --parallel-load is not atomic: employee_master and every table "
+                                  "that finished loading remain committed")
+                            print("💡 Delete the existing data when prompted on the next run before generating again")
+                else:
+                    generated = (populator.generate_phish_smish_simulations(employee_data) and
+                                 populator.generate_vishing_simulations(employee_data) and
+                                 populator.generate_quishing_simulations(employee_data) and
+                                 populator.generate_red_team_assessments(employee_data))
+                if not generated:
+                    print("\n❌ Some data generation failed")
             else:
-                print("\n❌ Some data generation failed")
-        else:
-            print("\n❌ Employee generation failed")
+                print("\n❌ Employee generation failed")
+        finally:
+            try:
+                populator._end_bulk_load(commit=generated)
+            finally:
+                # Every table is rebuilt before a failure is reported, and any failure fails the run
+                failed_tables = []
+                for table, snapshot in dropped_indexes.items():
+                    try:
+                        populator._recreate_indexes(table, snapshot)
+                    except mysql.connector.Error:
+                        failed_tables.append(table)
+                if failed_tables:
+                    raise RuntimeError(f"secondary indexes could not be recreated on {', '.join(failed_tables)}")
+        
+        if generated:
+            print("\n✅ All data generated successfully!")
+            populator.display_statistics_summary()
     
     except KeyboardInterrupt:
         print("\n\n👋 Operation cancelled by user")
@@ -5,42 +5,203 @@ Populates existing tables with realistic fake data.
 This is a database population script, not a table creation script.
 """
 
+import argparse
+import csv
 import mysql.connector
+import os
 import random
 import sys
+import tempfile
+from collections import Counter
 from faker import Faker
 from faker.providers import BaseProvider
 from decimal import Decimal
 from datetime import datetime, date, timedelta
+from itertools import chain, islice
+
+
+# Rows generated and sent per batch while loading employee_master
+EMPLOYEE_BATCH_SIZE = 10000
+# Employees whose simulation rows are generated and flushed together
+SIMULATION_BATCH_EMPLOYEES = 10000
+# Employee count from which batches are streamed with LOAD DATA LOCAL INFILE
+LOAD_DATA_MIN_ROWS = 1000
+# Server-side prepared statements accept at most this many placeholders
+MAX_PREPARED_PLACEHOLDERS = 65535
+
+# Session settings for the bulk load, reverted in close_connection
+BULK_LOAD_SESSION_SETTINGS = (
+    ("bulk_insert_buffer_size", 268435456, None),
+    ("foreign_key_checks", 0, 1),
+)
+# Only safe once employee_master is empty: with the check off InnoDB may admit duplicate employee_ids
+EMPTY_TABLE_SESSION_SETTINGS = (
+    ("unique_checks", 0, 1),
+)
+
+# Tables written by the populator, in load order
+POPULATED_TABLES = (
+    'employee_master',
+    'employee_phish_smish_sim',
+    'employee_vishing_sim',
+    'employee_quishing_sim',
+    'red_team_assessment',
+)
+
+# INSERT column order; generated row tuples must follow the same order
+EMPLOYEE_COLUMNS = (
+    'employee_id', 'first_name', 'last_name', 'gender', 'date_of_birth', 'age', 'blood_group',
+    'marital_status', 'email', 'phone_number', 'address', 'state', 'postal_code', 'country',
+    'designation', 'department', 'salary', 'work_experience_years', 'joining_date',
+    'emergency_contact_name', 'emergency_contact_phone', 'family_details', 'medical_conditions',
+    'simulation_type', 'work_email', 'personal_email', 'click_response_rate',
+    'phish_last_simulation_date', 'phish_testing_status', 'vishing_phone_number',
+    'vishing_alt_phone_number', 'voice_auth_test', 'vish_response_rate',
+    'vish_last_simulation_date', 'vish_testing_status', 'quish_response_rate',
+    'quish_last_simulation_date', 'quish_testing_status', 'branch_location', 'branch_code',
+    'total_employees_at_branch', 'security_level', 'building_storeys', 'assessment_date',
+    'assessment_time_start', 'assessment_time_end', 'permission_granted', 'approving_official_name',
+    'approving_official_designation', 'identity_verification_required', 'identity_verified',
+    'security_guard_present', 'visitor_log_maintained', 'badge_issued', 'escort_required',
+    'restricted_areas_accessed', 'tailgating_possible', 'social_engineering_successful',
+    'physical_security_score', 'human_security_score', 'overall_assessment_score',
+    'vulnerabilities_found', 'recommendations', 'assessor_name', 'assessor_id', 'notes',
+    'red_team_testing_status', 'organisation_name',
+)
+PHISH_COLUMNS = (
+    'serial_no', 'employee_id', 'simulation_type', 'work_email', 'personal_email', 'phone_number',
+    'click_response_rate', 'last_simulation_date', 'testing_status',
+)
+VISHING_COLUMNS = (
+    'serial_no', 'employee_id', 'phone_number', 'alt_phone_number', 'voice_auth_test',
+    'vish_response_rate', 'last_simulation', 'testing_status',
+)
+QUISHING_COLUMNS = (
+    'serial_no', 'employee_id', 'qr_code_link', 'device_used', 'scan_location', 'scan_time',
+    'response_action', 'quish_response_rate', 'last_simulation_date', 'testing_status',
+)
+RED_TEAM_COLUMNS = (
+    'serial_no', 'employee_id', 'branch_location', 'branch_code', 'total_employees_at_branch',
+    'security_level', 'building_storeys', 'assessment_date', 'assessment_time_start',
+    'assessment_time_end', 'permission_granted', 'approving_official_name',
+    'approving_official_designation', 'identity_verification_required', 'identity_verified',
+    'security_guard_present', 'visitor_log_maintained', 'badge_issued', 'escort_required',
+    'restricted_areas_accessed', 'tailgating_possible', 'social_engineering_successful',
+    'physical_security_score', 'human_security_score', 'overall_assessment_score',
+    'vulnerabilities_found', 'recommendations', 'assessor_name', 'assessor_id', 'notes',
+    'testing_status',
+)
+
+
+def build_insert_sql(table, columns, rows=1):
+    """Build a parameterized INSERT with a VALUES group for each of rows rows"""
+    values = f"({', '.join(['%s'] * len(columns))})"
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES {', '.join([values] * rows)}"
+
+
+DAYS_PER_YEAR = 365
+DAYS_PER_MONTH = 30
+
+# Fixed vocabularies shared by the generators
+GENDERS = ('M', 'F')
+BLOOD_GROUPS = ('O+', 'O-', 'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-')
+MARITAL_STATUSES = ('Single', 'Married', 'Divorced', 'Widowed')
+STREETS = ('MG Road', 'Gandhi Nagar', 'Anna Salai')
+STATES = ('Maharashtra', 'Karnataka', 'Tamil Nadu', 'Delhi', 'Gujarat')
+DESIGNATIONS = ('Analyst', 'Manager', 'Senior Analyst', 'Executive', 'Team Lead')
+DEPARTMENTS = ('IT', 'Finance', 'HR', 'Operations', 'Marketing', 'Security')
+MEDICAL_CONDITIONS = ('None', 'Diabetes', 'Hypertension', 'Asthma', 'None')
+EMPLOYEE_SIMULATION_TYPES = ('Phishing', 'Vishing', 'Quishing')
+TESTING_STATUSES = ('Completed', 'Scheduled', 'In Progress')
+SECURITY_LEVELS = ('High', 'Medium', 'Low')
+OFFICIAL_DESIGNATIONS = ('Manager', 'Director', 'VP')
+VULNERABILITIES = ('Weak access controls', 'Social engineering susceptibility', 'None significant')
+RECOMMENDATIONS = ('Enhanced security training', 'Improve access controls', 'Continue current practices')
+PHISH_SIMULATION_TYPES = ('Phishing', 'Smishing')
+QUISHING_DEVICES = ('Mobile', 'Desktop', 'Tablet')
+QUISHING_LOCATIONS = ('Office', 'Home', 'Public WiFi', 'Cafe', 'Airport')
+QUISHING_ACTIONS = ('Clicked', 'Ignored', 'Reported')
+
+
+def random_phone():
+    """Draw an Indian mobile number in the same format as IndianDataProvider.indian_phone"""
+    return f"+91 {random.randint(70, 99)}{random.randint(10000000, 99999999)}"
+
+
+def random_dates(start_days_ago, end_days_ago, n):
+    """Draw n dates between start_days_ago and end_days_ago days before today"""
+    today = date.today()
+    return [today - timedelta(days=offset) for offset in random.choices(range(end_days_ago, start_days_ago + 1), k=n)]
+
+
+def random_datetimes(start_days_ago, n):
+    """Draw n whole-second datetimes between start_days_ago days ago and now"""
+    now = datetime.now().replace(microsecond=0)
+    return [now - timedelta(seconds=offset) for offset in random.choices(range(start_days_ago * 86400 + 1), k=n)]
+
+
+def random_times(n):
+    """Draw n times of day formatted as HH:MM:SS"""
+    return [f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+            for seconds in random.choices(range(86400), k=n)]
+
+
+def repeat_pairs(pairs, counts):
+    """Repeat each (serial_no, employee_id) pair count times, returned as two columns"""
+    serial_nos = []
+    employee_ids = []
+    for (serial_no, employee_id), count in zip(pairs, counts):
+        serial_nos.extend([serial_no] * count)
+        employee_ids.extend([employee_id] * count)
+    return serial_nos, employee_ids
+
+
+def parse_args(argv=None):
+    """Parse command-line options; settings left unset are asked for interactively"""
+    parser = argparse.ArgumentParser(description="Populate the FISST Academy tables with fake data")
+    parser.add_argument('--host', default=os.getenv('DB_HOST'), help="MySQL host (env: DB_HOST)")
+    parser.add_argument('--port', type=int, default=os.getenv('DB_PORT'), help="MySQL port (env: DB_PORT)")
+    parser.add_argument('--database', default=os.getenv('DB_NAME'), help="Database name (env: DB_NAME)")
+    parser.add_argument('--user', default=os.getenv('DB_USER'), help="MySQL user (env: DB_USER)")
+    parser.add_argument('--password', default=os.getenv('DB_PASSWORD'), help="MySQL password (env: DB_PASSWORD)")
+    parser.add_argument('--employees', type=int, help="Number of employees to generate")
+    clear_group = parser.add_mutually_exclusive_group()
+    clear_group.add_argument('--clear', dest='clear', action='store_true', default=None,
+                             help="Clear existing data without asking")
+    clear_group.add_argument('--keep', dest='clear', action='store_false',
+                             help="Keep existing data without asking")
+    parser.add_argument('--drop-indexes', action='store_true',
+                        help="Drop non-unique secondary indexes for the bulk load and rebuild them afterwards")
+    return parser.parse_args(argv)
 
 
 class IndianDataProvider(BaseProvider):
     """Custom Faker provider for Indian data"""
     
-    indian_first_names_male = [
+    indian_first_names_male = (
         'Aarav', 'Vivaan', 'Aditya', 'Vihaan', 'Arjun', 'Sai', 'Reyansh', 'Ayaan', 'Krishna', 'Ishaan',
         'Shaurya', 'Atharv', 'Advik', 'Pranav', 'Rishabh', 'Gokul', 'Rohan', 'Kiran', 'Aryan', 'Advait',
         'Vikram', 'Ankit', 'Rahul', 'Amit', 'Suresh', 'Rajesh', 'Deepak', 'Manoj', 'Ravi', 'Ashok'
-    ]
+    )
     
-    indian_first_names_female = [
+    indian_first_names_female = (
         'Saanvi', 'Ananya', 'Diya', 'Aadhya', 'Kiara', 'Anika', 'Avni', 'Sara', 'Myra', 'Aditi',
         'Kavya', 'Sia', 'Ira', 'Pihu', 'Riya', 'Arya', 'Tara', 'Siya', 'Nisha', 'Priya',
         'Meera', 'Pooja', 'Neha', 'Sita', 'Geeta', 'Sunita', 'Kavita', 'Anita', 'Seema', 'Rekha'
-    ]
+    )
     
-    indian_last_names = [
+    indian_last_names = (
         'Sharma', 'Verma', 'Gupta', 'Agarwal', 'Bansal', 'Garg', 'Jain', 'Mittal', 'Shah', 'Patel',
         'Singh', 'Kumar', 'Yadav', 'Mishra', 'Pandey', 'Tiwari', 'Shukla', 'Dubey', 'Saxena', 'Srivastava'
-    ]
+    )
     
-    indian_cities = [
+    indian_cities = (
         'Mumbai', 'Delhi', 'Bangalore', 'Hyderabad', 'Chennai', 'Kolkata', 'Pune', 'Ahmedabad',
         'Surat', 'Jaipur', 'Lucknow', 'Kanpur', 'Nagpur', 'Visakhapatnam', 'Indore', 'Thane'
-    ]
+    )
     
     def indian_name(self):
-        gender = random.choice(['M', 'F'])
+        gender = random.choice(GENDERS)
         if gender == 'M':
             first_name = random.choice(self.indian_first_names_male)
         else:
@@ -61,20 +222,35 @@ class SimpleDatabasePopulator:
     def __init__(self):
         self.connection = None
         self.cursor = None
+        # Session settings applied so far, reverted by restore_session_settings
+        self.session_settings = []
+        # Prepared INSERT cursors keyed by table, and the statement strings keyed by (table, rows)
+        self.insert_cursors = {}
+        self.insert_statements = {}
+        # ALTER TABLE ... ADD clauses for indexes dropped during the bulk load, keyed by table
+        self.dropped_indexes = {}
         self.fake = Faker()
         self.fake.add_provider(IndianDataProvider)
+        # Name pools drawn from directly in the generators instead of going through Faker per row
+        self.first_name_pool = IndianDataProvider.indian_first_names_male + IndianDataProvider.indian_first_names_female
+        self.full_name_pool = [
+            f"{first_name} {last_name}"
+            for first_name in self.first_name_pool
+            for last_name in IndianDataProvider.indian_last_names
+        ]
         # Use fixed seed for consistent statistics
         random.seed(42)
         Faker.seed(42)
     
-    def connect_to_database(self):
-        """Connect to MySQL database"""
+    def connect_to_database(self, args=None):
+        """Connect to MySQL database, prompting for any setting not given on the command line or environment"""
         print("=== Database Connection ===")
-        host = input("Enter host (default: localhost): ").strip() or "localhost"
-        port = int(input("Enter port (default: 3306): ").strip() or "3306")
-        database = input("Enter database name: ").strip()
-        username = input("Enter username: ").strip()
-        password = input("Enter password: ").strip()
+        args = args or parse_args([])
+        host = args.host or input("Enter host (default: localhost): ").strip() or "localhost"
+        port = args.port or int(input("Enter port (default: 3306): ").strip() or "3306")
+        database = args.database or input("Enter database name: ").strip()
+        username = args.user or input("Enter username: ").strip()
+        password = args.password if args.password is not None else input("Enter password: ").strip()
         
         try:
             self.connection = mysql.connector.connect(
@@ -87,15 +263,35 @@ class SimpleDatabasePopulator:
                 buffered=True,  # This helps prevent unread result errors
                 use_unicode=True,
                 charset='utf8mb4',
-                collation='utf8mb4_unicode_ci'
+                collation='utf8mb4_unicode_ci',
+                # LOAD DATA LOCAL may only read the temp files written by _load_data_batch
+                allow_local_infile_in_path=tempfile.gettempdir()
             )
             self.cursor = self.connection.cursor(dictionary=True, buffered=True)
             print("✓ Successfully connected to MySQL database!")
+            self.apply_bulk_load_settings()
             return True
         except Exception as e:
             print(f"✗ Failed to connect: {e}")
             return False
     
+    def apply_bulk_load_settings(self, settings=BULK_LOAD_SESSION_SETTINGS):
+        """Relax per-row checks and enlarge insert buffers for this session"""
+        for setting in settings:
+            name, value, _ = setting
+            try:
+                self.cursor.execute(f"SET SESSION {name} = %s", (value,))
+                self.session_settings.append(setting)
+            except Exception as e:
+                print(f"⚠️  Could not set {name}: {e}")
+    
+    def restore_session_settings(self):
+        """Re-enable the checks disabled for the bulk load"""
+        while self.session_settings:
+            name, _, restore_value = self.session_settings.pop()
+            if restore_value is not None:
+                self.cursor.execute(f"SET SESSION {name} = %s", (restore_value,))
+    
     def verify_tables_exist(self):
         """Verify that required tables exist"""
         required_tables = [
@@ -107,16 +303,22 @@ class SimpleDatabasePopulator:
         ]
         
         print("\n=== Verifying Tables ===")
-        missing_tables = []
         
-        for table in required_tables:
-            try:
-                self.cursor.execute(f"SHOW TABLES LIKE '{table}'")
-                if not self.cursor.fetchone():
-                    missing_tables.append(table)
-            except Exception as e:
-                print(f"Error checking table {table}: {e}")
-                return False
+        try:
+            # One round trip for every table instead of a SHOW TABLES per table
+            placeholders = ", ".join(["%s"] * len(required_tables))
+            with self.connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT table_name FROM information_schema.tables "
+                    f"WHERE table_schema = DATABASE() AND table_name IN ({placeholders})",
+                    tuple(required_tables)
+                )
+                present_tables = {row[0] for row in cursor.fetchall()}
+        except Exception as e:
+            print(f"Error checking tables: {e}")
+            return False
+        
+        missing_tables = [table for table in required_tables if table not in present_tables]
         
         if missing_tables:
             print(f"❌ Missing tables: {', '.join(missing_tables)}")
@@ -132,8 +334,12 @@ class SimpleDatabasePopulator:
                   'employee_phish_smish_sim', 'employee_master']
         
         try:
+            # TRUNCATE drops each table's pages instead of deleting row by row;
+            # foreign key checks must be off for it to accept referenced tables.
+            # They stay off for the bulk load and restore_session_settings() re-enables them.
+            self.cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
             for table in tables:
-                self.cursor.execute(f"DELETE FROM {table}")
+                self.cursor.execute(f"TRUNCATE TABLE {table}")
             self.connection.commit()
             print("✓ Existing data cleared successfully!")
             return True
@@ -142,145 +348,252 @@ class SimpleDatabasePopulator:
             self.connection.rollback()
             return False
     
-    def generate_employee_data(self, num_employees):
-        """Generate employee master data"""
-        print(f"\n=== Generating {num_employees} employees ===")
+    def _drop_secondary_indexes(self):
+        """Drop non-unique secondary indexes so the bulk load skips per-row index maintenance"""
+        placeholders = ", ".join(["%s"] * len(POPULATED_TABLES))
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT table_name, index_name, column_name, sub_part FROM information_schema.statistics "
+                    f"WHERE table_schema = DATABASE() AND table_name IN ({placeholders}) "
+                    "AND non_unique = 1 AND index_type = 'BTREE' "
+                    "ORDER BY table_name, index_name, seq_in_index",
+                    POPULATED_TABLES
+                )
+                indexes = {}
+                for table, index_name, column_name, sub_part in cursor.fetchall():
+                    # Functional index parts have no column name and are recorded as None
+                    part = column_name and (f"`{column_name}`" if sub_part is None else f"`{column_name}`({sub_part})")
+                    indexes.setdefault((table, index_name), []).append(part)
+                
+                for (table, index_name), columns in indexes.items():
+                    # Functional indexes cannot be rebuilt from these columns, so they stay in place
+                    if None in columns:
+                        continue
+                    try:
+                        cursor.execute(f"ALTER TABLE {table} DROP INDEX `{index_name}`")
+                    except mysql.connector.Error as e:
+                        # Indexes backing a foreign key cannot be dropped
+                        print(f"⚠️  Keeping index {index_name} on {table}: {e}")
+                        continue
+                    self.dropped_indexes.setdefault(table, []).append(f"ADD INDEX `{index_name}` ({', '.join(columns)})")
+        except mysql.connector.Error as e:
+            print(f"⚠️  Could not drop secondary indexes: {e}")
+        
+        for table, clauses in self.dropped_indexes.items():
+            print(f"✓ Dropped {len(clauses)} secondary indexes on {table} for bulk load")
+    
+    def _recreate_indexes(self):
+        """Rebuild the dropped indexes with one ALTER TABLE per table, raising if any table fails"""
+        failed_tables = []
+        while self.dropped_indexes:
+            table, clauses = self.dropped_indexes.popitem()
+            try:
+                with self.connection.cursor() as cursor:
+                    cursor.execute(f"ALTER TABLE {table} " + ", ".join(clauses))
+                print(f"✓ Recreated {len(clauses)} secondary indexes on {table}")
+            except mysql.connector.Error as e:
+                print(f"✗ Failed to recreate indexes on {table}: {e}")
+                failed_tables.append(table)
+        # Every table is attempted before the failure is reported, so one bad rebuild
+        # does not leave the others without their indexes
+        if failed_tables:
+            raise RuntimeError(f"secondary indexes could not be recreated on {', '.join(failed_tables)}")
+    
+    def _employee_columns(self, start_id, n, email_counts):
+        """Generate employee master columns for employee IDs start_id .. start_id + n - 1"""
+        uniform = random.uniform
+        choices = random.choices
         
-        employees_data = []
-        used_emails = set()
+        def uniform_column(low, high, digits):
+            return [round(uniform(low, high), digits) for _ in range(n)]
         
-        for i in range(1, num_employees + 1):
-            # Generate Indian name
-            name_parts = self.fake.indian_name().split()
-            first_name = name_parts[0]
-            last_name = name_parts[1] if len(name_parts) > 1 else 'Kumar'
-            
-            # Generate unique emails with @fisstacademy.com
+        def flag_column():
+            return choices((True, False), k=n)
+        
+        # Generate Indian names
+        first_names = choices(self.first_name_pool, k=n)
+        last_names = choices(IndianDataProvider.indian_last_names, k=n)
+        
+        # Generate unique emails with @fisstacademy.com
+        work_emails = [None] * n
+        personal_emails = [None] * n
+        for index, (first_name, last_name) in enumerate(zip(first_names, last_names)):
             base_email = f"{first_name.lower()}.{last_name.lower()}"
-            work_email = f"{base_email}@fisstacademy.com"
-            counter = 1
-            while work_email in used_emails:
-                work_email = f"{base_email}{counter}@fisstacademy.com"
-                counter += 1
-            used_emails.add(work_email)
-            
-            personal_email = f"{base_email}@gmail.com"
-            email = work_email  # Primary email
-            
-            # Generate other data
-            gender = random.choice(['M', 'F'])
-            date_of_birth = self.fake.date_between(start_date='-65y', end_date='-22y')
-            age = 2024 - date_of_birth.year
-            blood_group = random.choice(['O+', 'O-', 'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-'])
-            marital_status = random.choice(['Single', 'Married', 'Divorced', 'Widowed'])
-            phone_number = self.fake.indian_phone()
-            address = f"{random.randint(1, 999)} {random.choice(['MG Road', 'Gandhi Nagar', 'Anna Salai'])}"
-            state = random.choice(['Maharashtra', 'Karnataka', 'Tamil Nadu', 'Delhi', 'Gujarat'])
-            postal_code = f"{random.randint(100000, 999999)}"
-            country = 'India'
-            designation = random.choice(['Analyst', 'Manager', 'Senior Analyst', 'Executive', 'Team Lead'])
-            department = random.choice(['IT', 'Finance', 'HR', 'Operations', 'Marketing', 'Security'])
-            salary = round(random.uniform(25000, 150000), 2)
-            work_experience_years = round(random.uniform(0.5, 25.0), 1)
-            joining_date = self.fake.date_between(start_date='-10y', end_date='today')
-            emergency_contact_name = self.fake.indian_name()
-            emergency_contact_phone = self.fake.indian_phone()
-            family_details = f"Family of {random.randint(2, 6)} members"
-            medical_conditions = random.choice(['None', 'Diabetes', 'Hypertension', 'Asthma', 'None'])
-            simulation_type = random.choice(['Phishing', 'Vishing', 'Quishing'])
-            
-            # Simulation rates with consistent statistics
-            base_phish_rate = 23.1
-            base_vish_rate = 23.6  
-            base_quish_rate = 23.1
-            
-            click_response_rate = round(random.uniform(base_phish_rate - 2, base_phish_rate + 2), 2)
-            phish_last_simulation_date = self.fake.date_between(start_date='-6m', end_date='today')
-            phish_testing_status = random.choice(['Completed', 'Scheduled', 'In Progress'])
-            
-            vishing_phone_number = phone_number
-            vishing_alt_phone_number = self.fake.indian_phone()
-            voice_auth_test = random.choice([True, False])
-            vish_response_rate = round(random.uniform(base_vish_rate - 2, base_vish_rate + 2), 2)
-            vish_last_simulation_date = self.fake.date_between(start_date='-6m', end_date='today')
-            vish_testing_status = random.choice(['Completed', 'Scheduled', 'In Progress'])
-            
-            quish_response_rate = round(random.uniform(base_quish_rate - 2, base_quish_rate + 2), 2)
-            quish_last_simulation_date = self.fake.date_between(start_date='-6m', end_date='today')
-            quish_testing_status = random.choice(['Completed', 'Scheduled', 'In Progress'])
-            
+            # Each repeat of a base gets the next numeric suffix; names never end in a digit, so these stay unique
+            counter = email_counts[base_email]
+            email_counts[base_email] = counter + 1
+            work_emails[index] = f"{base_email}{counter or ''}@fisstacademy.com"
+            personal_emails[index] = f"{base_email}@gmail.com"
+        
+        # Generate other data
+        dates_of_birth = random_dates(65 * DAYS_PER_YEAR, 22 * DAYS_PER_YEAR, n)
+        phone_numbers = [random_phone() for _ in range(n)]
+        departments = choices(DEPARTMENTS, k=n)
+        
+        # Simulation rates with consistent statistics
+        base_phish_rate = 23.1
+        base_vish_rate = 23.6
+        base_quish_rate = 23.1
+        
+        physical_security_scores = uniform_column(1.0, 10.0, 1)
+        human_security_scores = uniform_column(1.0, 10.0, 1)
+        
+        return [
+            list(range(start_id, start_id + n)),
+            first_names,
+            last_names,
+            choices(GENDERS, k=n),
+            dates_of_birth,
+            [2024 - date_of_birth.year for date_of_birth in dates_of_birth],
+            choices(BLOOD_GROUPS, k=n),
+            choices(MARITAL_STATUSES, k=n),
+            work_emails,  # Primary email
+            phone_numbers,
+            [f"{number} {street}" for number, street in
+             zip(choices(range(1, 1000), k=n), choices(STREETS, k=n))],
+            choices(STATES, k=n),
+            [str(code) for code in choices(range(100000, 1000000), k=n)],
+            ['India'] * n,
+            choices(DESIGNATIONS, k=n),
+            departments,
+            uniform_column(25000, 150000, 2),
+            uniform_column(0.5, 25.0, 1),
+            random_dates(10 * DAYS_PER_YEAR, 0, n),
+            choices(self.full_name_pool, k=n),
+            [random_phone() for _ in range(n)],
+            [f"Family of {size} members" for size in choices(range(2, 7), k=n)],
+            choices(MEDICAL_CONDITIONS, k=n),
+            choices(EMPLOYEE_SIMULATION_TYPES, k=n),
+            work_emails,
+            personal_emails,
+            # Phishing data
+            uniform_column(base_phish_rate - 2, base_phish_rate + 2, 2),
+            random_dates(6 * DAYS_PER_MONTH, 0, n),
+            choices(TESTING_STATUSES, k=n),
+            # Vishing data
+            phone_numbers,
+            [random_phone() for _ in range(n)],
+            flag_column(),
+            uniform_column(base_vish_rate - 2, base_vish_rate + 2, 2),
+            random_dates(6 * DAYS_PER_MONTH, 0, n),
+            choices(TESTING_STATUSES, k=n),
+            # Quishing data
+            uniform_column(base_quish_rate - 2, base_quish_rate + 2, 2),
+            random_dates(6 * DAYS_PER_MONTH, 0, n),
+            choices(TESTING_STATUSES, k=n),
             # Red team assessment data
-            branch_location = self.fake.indian_city()
-            branch_code = f"BR{random.randint(10, 99)}"
-            total_employees_at_branch = random.randint(50, 500)
-            security_level = random.choice(['High', 'Medium', 'Low'])
-            building_storeys = random.randint(1, 20)
-            assessment_date = self.fake.date_between(start_date='-3m', end_date='today')
-            assessment_time_start = self.fake.time()
-            assessment_time_end = self.fake.time()
-            permission_granted = random.choice([True, False])
-            approving_official_name = self.fake.indian_name()
-            approving_official_designation = random.choice(['Manager', 'Director', 'VP'])
-            identity_verification_required = True
-            identity_verified = random.choice([True, False])
-            security_guard_present = random.choice([True, False])
-            visitor_log_maintained = True
-            badge_issued = random.choice([True, False])
-            escort_required = random.choice([True, False])
-            restricted_areas_accessed = random.choice([True, False])
-            tailgating_possible = random.choice([True, False])
-            social_engineering_successful = random.choice([True, False])
-            physical_security_score = round(random.uniform(1.0, 10.0), 1)
-            human_security_score = round(random.uniform(1.0, 10.0), 1)
-            overall_assessment_score = round((physical_security_score + human_security_score) / 2, 1)
-            vulnerabilities_found = random.choice(['Weak access controls', 'Social engineering susceptibility', 'None significant'])
-            recommendations = random.choice(['Enhanced security training', 'Improve access controls', 'Continue current practices'])
-            assessor_name = self.fake.indian_name()
-            assessor_id = f"ASST{random.randint(1, 20):02d}"
-            notes = f"Assessment completed for {department} department"
-            red_team_testing_status = 'Completed'
-            organisation_name = 'FISST Academy'
-            
-            employees_data.append((
-                i, first_name, last_name, gender, date_of_birth, age, blood_group, marital_status,
-                email, phone_number, address, state, postal_code, country, designation, department,
-                salary, work_experience_years, joining_date, emergency_contact_name, emergency_contact_phone,
-                family_details, medical_conditions, simulation_type, work_email, personal_email,
-                click_response_rate, phish_last_simulation_date, phish_testing_status,
-                vishing_phone_number, vishing_alt_phone_number, voice_auth_test, vish_response_rate,
-                vish_last_simulation_date, vish_testing_status, quish_response_rate, quish_last_simulation_date,
-                quish_testing_status, branch_location, branch_code, total_employees_at_branch, security_level,
-                building_storeys, assessment_date, assessment_time_start, assessment_time_end, permission_granted,
-                approving_official_name, approving_official_designation, identity_verification_required,
-                identity_verified, security_guard_present, visitor_log_maintained, badge_issued, escort_required,
-                restricted_areas_accessed, tailgating_possible, social_engineering_successful, physical_security_score,
-                human_security_score, overall_assessment_score, vulnerabilities_found, recommendations,
-                assessor_name, assessor_id, notes, red_team_testing_status, organisation_name
-            ))
+            choices(IndianDataProvider.indian_cities, k=n),
+            [f"BR{code}" for code in choices(range(10, 100), k=n)],
+            choices(range(50, 501), k=n),
+            choices(SECURITY_LEVELS, k=n),
+            choices(range(1, 21), k=n),
+            random_dates(3 * DAYS_PER_MONTH, 0, n),
+            random_times(n),
+            random_times(n),
+            flag_column(),
+            choices(self.full_name_pool, k=n),
+            choices(OFFICIAL_DESIGNATIONS, k=n),
+            [True] * n,
+            flag_column(),
+            flag_column(),
+            [True] * n,
+            flag_column(),
+            flag_column(),
+            flag_column(),
+            flag_column(),
+            flag_column(),
+            physical_security_scores,
+            human_security_scores,
+            [round((physical + human) / 2, 1) for physical, human in zip(physical_security_scores, human_security_scores)],
+            choices(VULNERABILITIES, k=n),
+            choices(RECOMMENDATIONS, k=n),
+            choices(self.full_name_pool, k=n),
+            [f"ASST{assessor:02d}" for assessor in choices(range(1, 21), k=n)],
+            [f"Assessment completed for {department} department" for department in departments],
+            ['Completed'] * n,
+            ['FISST Academy'] * n,
+        ]
+    
+    def _iter_employee_rows(self, num_employees):
+        """Yield employee master rows, generating their columns one batch at a time"""
+        email_counts = Counter()
+        
+        for start_id in range(1, num_employees + 1, EMPLOYEE_BATCH_SIZE):
+            n = min(EMPLOYEE_BATCH_SIZE, num_employees - start_id + 1)
+            yield from zip(*self._employee_columns(start_id, n, email_counts))
+    
+    def _prepared_cursor(self, table):
+        """Lazily open the server-side prepared cursor used for one table's INSERT batches"""
+        cursor = self.insert_cursors.get(table)
+        if cursor is None:
+            cursor = self.insert_cursors[table] = self.connection.cursor(prepared=True)
+        return cursor
+    
+    def _insert_batch(self, table, columns, rows):
+        """Insert rows with multi-row INSERTs through the table's prepared cursor"""
+        # A prepared cursor re-prepares whenever it is given a different statement, so each table
+        # keeps its own cursor and the per-block rotation through the tables does not evict it
+        cursor = self._prepared_cursor(table)
+        # A prepared cursor runs executemany row by row, so rows are grouped into
+        # multi-row statements that stay under the placeholder limit
+        chunk_rows = MAX_PREPARED_PLACEHOLDERS // len(columns)
+        for start in range(0, len(rows), chunk_rows):
+            chunk = rows[start:start + chunk_rows]
+            # Reusing the same string object lets the cursor skip re-preparing consecutive full chunks;
+            # a shorter final chunk is a different statement and is prepared afresh
+            key = (table, len(chunk))
+            sql = self.insert_statements.get(key)
+            if sql is None:
+                sql = self.insert_statements[key] = build_insert_sql(table, columns, len(chunk))
+            cursor.execute(sql, list(chain.from_iterable(chunk)))
+    
+    def _load_data_batch(self, table, columns, batch):
+        """Load a batch of rows through LOAD DATA LOCAL INFILE from a temporary CSV file"""
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', newline='', encoding='utf-8', delete=False) as csv_file:
+            path = csv_file.name
+            writer = csv.writer(csv_file, lineterminator='\n')
+            # MySQL reads 'True'/'False' as 0, so booleans are written as 1/0
+            writer.writerows([int(value) if isinstance(value, bool) else value for value in row] for row in batch)
         
         try:
-            sql = """
-            INSERT INTO employee_master (
-                employee_id, first_name, last_name, gender, date_of_birth, age, blood_group, marital_status,
-                email, phone_number, address, state, postal_code, country, designation, department,
-                salary, work_experience_years, joining_date, emergency_contact_name, emergency_contact_phone,
-                family_details, medical_conditions, simulation_type, work_email, personal_email,
-                click_response_rate, phish_last_simulation_date, phish_testing_status,
-                vishing_phone_number, vishing_alt_phone_number, voice_auth_test, vish_response_rate,
-                vish_last_simulation_date, vish_testing_status, quish_response_rate, quish_last_simulation_date,
-                quish_testing_status, branch_location, branch_code, total_employees_at_branch, security_level,
-                building_storeys, assessment_date, assessment_time_start, assessment_time_end, permission_granted,
-                approving_official_name, approving_official_designation, identity_verification_required,
-                identity_verified, security_guard_present, visitor_log_maintained, badge_issued, escort_required,
-                restricted_areas_accessed, tailgating_possible, social_engineering_successful, physical_security_score,
-                human_security_score, overall_assessment_score, vulnerabilities_found, recommendations,
-                assessor_name, assessor_id, notes, red_team_testing_status, organisation_name
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            
-            self.cursor.executemany(sql, employees_data)
+            self.cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4 "
+                "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' LINES TERMINATED BY '\\n' "
+                f"({', '.join(columns)})",
+                (path,)
+            )
+        finally:
+            os.remove(path)
+        
+        # LOCAL turns duplicate-key errors into warnings and skips the row, so fail like INSERT would
+        if self.cursor.rowcount != len(batch):
+            raise RuntimeError(
+                f"LOAD DATA loaded {self.cursor.rowcount} of {len(batch)} rows into {table} "
+                "(duplicate keys are skipped with a warning)"
+            )
+    
+    def generate_employee_data(self, num_employees):
+        """Generate employee master data"""
+        print(f"\n=== Generating {num_employees} employees ===")
+        
+        try:
+            # Rows are generated lazily and sent in fixed-size batches inside one transaction
+            rows = self._iter_employee_rows(num_employees)
+            use_load_data = num_employees >= LOAD_DATA_MIN_ROWS
+            inserted = 0
+            for batch in iter(lambda: list(islice(rows, EMPLOYEE_BATCH_SIZE)), []):
+                if use_load_data:
+                    try:
+                        self._load_data_batch('employee_master', EMPLOYEE_COLUMNS, batch)
+                    except mysql.connector.Error as e:
+                        print(f"⚠️  LOAD DATA LOCAL INFILE unavailable ({e}), using INSERT batches")
+                        use_load_data = False
+                if not use_load_data:
+                    self._insert_batch('employee_master', EMPLOYEE_COLUMNS, batch)
+                inserted += len(batch)
             self.connection.commit()
-            print(f"✓ Generated {len(employees_data)} employees!")
+            print(f"✓ Generated {inserted} employees!")
             return True
             
         except Exception as e:
@@ -292,221 +605,187 @@ class SimpleDatabasePopulator:
         """Generate simulation data for all tables"""
         print("\n=== Generating simulation data ===")
         
-        # Get employee data
-        self.cursor.execute("SELECT serial_no, employee_id FROM employee_master")
-        employees = self.cursor.fetchall()
+        # Get (serial_no, employee_id) tuples; a plain cursor skips building a dict per row
+        with self.connection.cursor() as cursor:
+            cursor.execute("SELECT serial_no, employee_id FROM employee_master")
+            employees = cursor.fetchall()
         
         if not employees:
             print("No employees found!")
             return False
         
-        # Generate phishing/smishing data
-        self.generate_phishing_data(employees)
-        
-        # Generate vishing data  
-        self.generate_vishing_data(employees)
-        
-        # Generate quishing data
-        self.generate_quishing_data(employees)
+        # One pass over the employees in blocks; every block's rows for all four tables are
+        # flushed together and the whole load is committed once
+        loaders = [
+            ('phishing simulation', 'employee_phish_smish_sim', PHISH_COLUMNS, self._phishing_rows),
+            ('vishing simulation', 'employee_vishing_sim', VISHING_COLUMNS, self._vishing_rows),
+            ('quishing simulation', 'employee_quishing_sim', QUISHING_COLUMNS, self._quishing_rows),
+            ('red team assessment', 'red_team_assessment', RED_TEAM_COLUMNS, self._red_team_rows),
+        ]
+        totals = [0] * len(loaders)
         
-        # Generate red team assessment data
-        self.generate_red_team_data(employees)
+        try:
+            for block_start in range(0, len(employees), SIMULATION_BATCH_EMPLOYEES):
+                block = employees[block_start:block_start + SIMULATION_BATCH_EMPLOYEES]
+                for position, (_, table, columns, build_rows) in enumerate(loaders):
+                    rows = build_rows(block)
+                    self._insert_batch(table, columns, rows)
+                    totals[position] += len(rows)
+            self.connection.commit()
+        except Exception as e:
+            print(f"✗ Error generating simulation data: {e}")
+            self.connection.rollback()
+            return False
         
+        for (label, _, _, _), total in zip(loaders, totals):
+            print(f"✓ Generated {total} {label} entries!")
         return True
     
-    def generate_phishing_data(self, employees):
-        """Generate phishing simulation data"""
-        phish_data = []
-        simulation_types = ['Phishing', 'Smishing']
-        
-        for emp in employees:
-            for _ in range(random.randint(1, 3)):
-                simulation_type = random.choice(simulation_types)
-                work_email = f"emp{emp['employee_id']}@fisstacademy.com"
-                personal_email = f"emp{emp['employee_id']}@gmail.com"
-                phone_number = self.fake.indian_phone()
-                click_response_rate = round(random.uniform(21.0, 25.0), 2)
-                last_simulation_date = self.fake.date_between(start_date='-6m', end_date='today')
-                testing_status = random.choice(['Completed', 'Scheduled', 'In Progress'])
-                
-                phish_data.append((
-                    emp['serial_no'], emp['employee_id'], simulation_type, work_email, 
-                    personal_email, phone_number, click_response_rate, last_simulation_date, testing_status
-                ))
-        
-        sql = """
-        INSERT INTO employee_phish_smish_sim (
-            serial_no, employee_id, simulation_type, work_email, personal_email, 
-            phone_number, click_response_rate, last_simulation_date, testing_status
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
-        
-        self.cursor.executemany(sql, phish_data)
-        print(f"✓ Generated {len(phish_data)} phishing simulation entries!")
+    def _phishing_rows(self, employees):
+        """Build phishing simulation rows for a block of employees"""
+        choices = random.choices
+        uniform = random.uniform
+        # One to three entries per employee, drawn once and expanded column-wise
+        serial_nos, employee_ids = repeat_pairs(employees, choices(range(1, 4), k=len(employees)))
+        total = len(serial_nos)
+        
+        return list(zip(
+            serial_nos,
+            employee_ids,
+            choices(PHISH_SIMULATION_TYPES, k=total),
+            [f"emp{employee_id}@fisstacademy.com" for employee_id in employee_ids],
+            [f"emp{employee_id}@gmail.com" for employee_id in employee_ids],
+            [random_phone() for _ in range(total)],
+            [round(uniform(21.0, 25.0), 2) for _ in range(total)],
+            random_dates(6 * DAYS_PER_MONTH, 0, total),
+            choices(TESTING_STATUSES, k=total),
+        ))
     
-    def generate_vishing_data(self, employees):
-        """Generate vishing simulation data"""
-        vish_data = []
-        
-        for emp in employees:
-            for _ in range(random.randint(1, 2)):
-                phone_number = self.fake.indian_phone()
-                alt_phone_number = self.fake.indian_phone()
-                voice_auth_test = random.choice([True, False])
-                vish_response_rate = round(random.uniform(21.5, 25.5), 2)
-                last_simulation = self.fake.date_between(start_date='-6m', end_date='today')
-                testing_status = random.choice(['Completed', 'Scheduled', 'In Progress'])
-                
-                vish_data.append((
-                    emp['serial_no'], emp['employee_id'], phone_number, alt_phone_number,
-                    voice_auth_test, vish_response_rate, last_simulation, testing_status
-                ))
-        
-        sql = """
-        INSERT INTO employee_vishing_sim (
-            serial_no, employee_id, phone_number, alt_phone_number, voice_auth_test,
-            vish_response_rate, last_simulation, testing_status
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        """
-        
-        self.cursor.executemany(sql, vish_data)
-        print(f"✓ Generated {len(vish_data)} vishing simulation entries!")
+    def _vishing_rows(self, employees):
+        """Build vishing simulation rows for a block of employees"""
+        choices = random.choices
+        uniform = random.uniform
+        serial_nos, employee_ids = repeat_pairs(employees, choices(range(1, 3), k=len(employees)))
+        total = len(serial_nos)
+        
+        return list(zip(
+            serial_nos,
+            employee_ids,
+            [random_phone() for _ in range(total)],
+            [random_phone() for _ in range(total)],
+            choices((True, False), k=total),
+            [round(uniform(21.5, 25.5), 2) for _ in range(total)],
+            random_dates(6 * DAYS_PER_MONTH, 0, total),
+            choices(TESTING_STATUSES, k=total),
+        ))
     
-    def generate_quishing_data(self, employees):
-        """Generate quishing simulation data"""
-        quish_data = []
-        devices = ['Mobile', 'Desktop', 'Tablet']
-        locations = ['Office', 'Home', 'Public WiFi', 'Cafe', 'Airport']
-        actions = ['Clicked', 'Ignored', 'Reported']
-        
-        for emp in employees:
-            for _ in range(random.randint(1, 2)):
-                qr_code_link = f"https://fisst-test.com/qr/{random.randint(1000, 9999)}"
-                device_used = random.choice(devices)
-                scan_location = random.choice(locations)
-                scan_time = self.fake.date_time_between(start_date='-6m', end_date='now')
-                response_action = random.choice(actions)
-                quish_response_rate = round(random.uniform(21.0, 25.0), 2)
-                last_simulation_date = self.fake.date_between(start_date='-6m', end_date='today')
-                testing_status = random.choice(['Completed', 'Scheduled', 'In Progress'])
-                
-                quish_data.append((
-                    emp['serial_no'], emp['employee_id'], qr_code_link, device_used, scan_location,
-                    scan_time, response_action, quish_response_rate, last_simulation_date, testing_status
-                ))
-        
-        sql = """
-        INSERT INTO employee_quishing_sim (
-            serial_no, employee_id, qr_code_link, device_used, scan_location, scan_time,
-            response_action, quish_response_rate, last_simulation_date, testing_status
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
-        
-        self.cursor.executemany(sql, quish_data)
-        print(f"✓ Generated {len(quish_data)} quishing simulation entries!")
+    def _quishing_rows(self, employees):
+        """Build quishing simulation rows for a block of employees"""
+        choices = random.choices
+        uniform = random.uniform
+        serial_nos, employee_ids = repeat_pairs(employees, choices(range(1, 3), k=len(employees)))
+        total = len(serial_nos)
+        
+        return list(zip(
+            serial_nos,
+            employee_ids,
+            [f"https://fisst-test.com/qr/{code}" for code in choices(range(1000, 10000), k=total)],
+            choices(QUISHING_DEVICES, k=total),
+            choices(QUISHING_LOCATIONS, k=total),
+            random_datetimes(6 * DAYS_PER_MONTH, total),
+            choices(QUISHING_ACTIONS, k=total),
+            [round(uniform(21.0, 25.0), 2) for _ in range(total)],
+            random_dates(6 * DAYS_PER_MONTH, 0, total),
+            choices(TESTING_STATUSES, k=total),
+        ))
     
-    def generate_red_team_data(self, employees):
-        """Generate red team assessment data"""
-        red_team_data = []
-        
-        for emp in employees:
-            branch_location = self.fake.indian_city()
-            branch_code = f"BR{random.randint(10, 99)}"
-            total_employees_at_branch = random.randint(50, 500)
-            security_level = random.choice(['High', 'Medium', 'Low'])
-            building_storeys = random.randint(1, 20)
-            assessment_date = self.fake.date_between(start_date='-3m', end_date='today')
-            assessment_time_start = self.fake.time()
-            assessment_time_end = self.fake.time()
-            permission_granted = random.choice([True, False])
-            approving_official_name = self.fake.indian_name()
-            approving_official_designation = random.choice(['Manager', 'Director', 'VP'])
-            identity_verification_required = True
-            identity_verified = random.choice([True, False])
-            security_guard_present = random.choice([True, False])
-            visitor_log_maintained = True
-            badge_issued = random.choice([True, False])
-            escort_required = random.choice([True, False])
-            restricted_areas_accessed = random.choice([True, False])
-            tailgating_possible = random.choice([True, False])
-            social_engineering_successful = random.choice([True, False])
-            physical_security_score = round(random.uniform(1.0, 10.0), 1)
-            human_security_score = round(random.uniform(1.0, 10.0), 1)
-            overall_assessment_score = round((physical_security_score + human_security_score) / 2, 1)
-            vulnerabilities_found = random.choice(['Weak access controls', 'Social engineering susceptibility', 'None significant'])
-            recommendations = random.choice(['Enhanced security training', 'Improve access controls', 'Continue current practices'])
-            assessor_name = self.fake.indian_name()
-            assessor_id = f"ASST{random.randint(1, 20):02d}"
-            notes = f"Red team assessment completed"
-            testing_status = 'Completed'
-            
-            red_team_data.append((
-                emp['serial_no'], emp['employee_id'], branch_location, branch_code, total_employees_at_branch,
-                security_level, building_storeys, assessment_date, assessment_time_start, assessment_time_end,
-                permission_granted, approving_official_name, approving_official_designation,
-                identity_verification_required, identity_verified, security_guard_present, visitor_log_maintained,
-                badge_issued, escort_required, restricted_areas_accessed, tailgating_possible,
-                social_engineering_successful, physical_security_score, human_security_score,
-                overall_assessment_score, vulnerabilities_found, recommendations, assessor_name,
-                assessor_id, notes, testing_status
-            ))
-        
-        sql = """
-        INSERT INTO red_team_assessment (
-            serial_no, employee_id, branch_location, branch_code, total_employees_at_branch,
-            security_level, building_storeys, assessment_date, assessment_time_start, assessment_time_end,
-            permission_granted, approving_official_name, approving_official_designation,
-            identity_verification_required, identity_verified, security_guard_present, visitor_log_maintained,
-            badge_issued, escort_required, restricted_areas_accessed, tailgating_possible,
-            social_engineering_successful, physical_security_score, human_security_score,
-            overall_assessment_score, vulnerabilities_found, recommendations, assessor_name,
-            assessor_id, notes, testing_status
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
-        
-        self.cursor.executemany(sql, red_team_data)
-        print(f"✓ Generated {len(red_team_data)} red team assessment entries!")
+    def _red_team_rows(self, employees):
+        """Build red team assessment rows for a block of employees"""
+        choices = random.choices
+        randint = random.randint
+        uniform = random.uniform
+        n = len(employees)
+        
+        def flag_column():
+            return choices((True, False), k=n)
+        
+        serial_nos, employee_ids = zip(*employees) if employees else ((), ())
+        physical_security_scores = [round(uniform(1.0, 10.0), 1) for _ in range(n)]
+        human_security_scores = [round(uniform(1.0, 10.0), 1) for _ in range(n)]
+        
+        # Columns follow RED_TEAM_COLUMNS and are zipped into rows in C
+        return list(zip(
+            serial_nos,
+            employee_ids,
+            choices(IndianDataProvider.indian_cities, k=n),
+            [f"BR{randint(10, 99)}" for _ in range(n)],
+            [randint(50, 500) for _ in range(n)],
+            choices(SECURITY_LEVELS, k=n),
+            [randint(1, 20) for _ in range(n)],
+            random_dates(3 * DAYS_PER_MONTH, 0, n),
+            random_times(n),
+            random_times(n),
+            flag_column(),
+            choices(self.full_name_pool, k=n),
+            choices(OFFICIAL_DESIGNATIONS, k=n),
+            [True] * n,
+            flag_column(),
+            flag_column(),
+            [True] * n,
+            flag_column(),
+            flag_column(),
+            flag_column(),
+            flag_column(),
+            flag_column(),
+            physical_security_scores,
+            human_security_scores,
+            [round((physical + human) / 2, 1) for physical, human in zip(physical_security_scores, human_security_scores)],
+            choices(VULNERABILITIES, k=n),
+            choices(RECOMMENDATIONS, k=n),
+            choices(self.full_name_pool, k=n),
+            [f"ASST{randint(1, 20):02d}" for _ in range(n)],
+            ["Red team assessment completed"] * n,
+            ["Completed"] * n,
+        ))
     
     def display_statistics(self):
         """Display data statistics"""
         print("\n=== Data Statistics ===")
         
         try:
-            # Employee count
-            self.cursor.execute("SELECT COUNT(*) as count FROM employee_master")
-            result = self.cursor.fetchone()
-            emp_count = result['count'] if result else 0
-            print(f"Employees: {emp_count}")
+            # Every count and average in a single round trip; the three averages
+            # share one scan of employee_master
+            self.cursor.execute("""
+                SELECT
+                    COUNT(*) AS employees,
+                    (SELECT COUNT(*) FROM employee_phish_smish_sim) AS phishing,
+                    (SELECT COUNT(*) FROM employee_vishing_sim) AS vishing,
+                    (SELECT COUNT(*) FROM employee_quishing_sim) AS quishing,
+                    (SELECT COUNT(*) FROM red_team_assessment) AS red_team,
+                    AVG(click_response_rate) AS phish_avg,
+                    AVG(vish_response_rate) AS vish_avg,
+                    AVG(quish_response_rate) AS quish_avg
+                FROM employee_master
+            """)
+            result = self.cursor.fetchone() or {}
+            
+            print(f"Employees: {result.get('employees') or 0}")
             
             # Simulation counts
             tables = [
-                ('Phishing Simulations', 'employee_phish_smish_sim'),
-                ('Vishing Simulations', 'employee_vishing_sim'),
-                ('Quishing Simulations', 'employee_quishing_sim'),
-                ('Red Team Assessments', 'red_team_assessment')
+                ('Phishing Simulations', 'phishing'),
+                ('Vishing Simulations', 'vishing'),
+                ('Quishing Simulations', 'quishing'),
+                ('Red Team Assessments', 'red_team')
             ]
             
-            for name, table in tables:
-                self.cursor.execute(f"SELECT COUNT(*) as count FROM {table}")
-                result = self.cursor.fetchone()
-                count = result['count'] if result else 0
-                print(f"{name}: {count}")
+            for name, key in tables:
+                print(f"{name}: {result.get(key) or 0}")
             
             # Average response rates
-            self.cursor.execute("SELECT AVG(click_response_rate) as avg_rate FROM employee_master")
-            result = self.cursor.fetchone()
-            phish_avg = result['avg_rate'] if result and result['avg_rate'] else 0
-            print(f"Average Phishing Response Rate: {phish_avg:.1f}%")
-            
-            self.cursor.execute("SELECT AVG(vish_response_rate) as avg_rate FROM employee_master")
-            result = self.cursor.fetchone()
-            vish_avg = result['avg_rate'] if result and result['avg_rate'] else 0
-            print(f"Average Vishing Response Rate: {vish_avg:.1f}%")
-            
-            self.cursor.execute("SELECT AVG(quish_response_rate) as avg_rate FROM employee_master")
-            result = self.cursor.fetchone()
-            quish_avg = result['avg_rate'] if result and result['avg_rate'] else 0
-            print(f"Average Quishing Response Rate: {quish_avg:.1f}%")
+            print(f"Average Phishing Response Rate: {result.get('phish_avg') or 0:.1f}%")
+            print(f"Average Vishing Response Rate: {result.get('vish_avg') or 0:.1f}%")
+            print(f"Average Quishing Response Rate: {result.get('quish_avg') or 0:.1f}%")
             
         except Exception as e:
             print(f"Error displaying statistics: {e}")
@@ -527,7 +806,13 @@ class SimpleDatabasePopulator:
                         pass
                 except:
                     pass
+                try:
+                    self.restore_session_settings()
+                except Exception:
+                    pass
                 self.cursor.close()
+            for cursor in self.insert_cursors.values():
+                cursor.close()
             if self.connection:
                 self.connection.close()
             print("\n✓ Database connection closed")
@@ -535,8 +820,9 @@ class SimpleDatabasePopulator:
             print(f"\n⚠️  Warning during connection cleanup: {e}")
 
 
-def main():
+def main(argv=None):
     """Main function"""
+    args = parse_args(argv)
     print("FISST Academy Simple Database Populator")
     print("=" * 50)
     
@@ -544,7 +830,7 @@ def main():
     
     try:
         # Connect to database
-        if not populator.connect_to_database():
+        if not populator.connect_to_database(args):
             return
         
         # Verify tables exist
@@ -554,35 +840,51 @@ def main():
         # Check for existing data
         print("\n=== Data Management ===")
         try:
-            populator.cursor.execute("SELECT COUNT(*) as count FROM employee_master")
-            existing_count = populator.cursor.fetchone()['count']
-            if existing_count > 0:
-                print(f"Found {existing_count} existing employees.")
-                clear_data = input("Clear existing data? (y/n): ").strip().lower()
-                if clear_data == 'y':
+            # Only existence matters here; EXISTS stops at the first row instead of counting them all
+            populator.cursor.execute("SELECT EXISTS(SELECT 1 FROM employee_master) AS has_data")
+            has_data = populator.cursor.fetchone()['has_data']
+            if has_data:
+                print("Found existing employees.")
+                if args.clear is None:
+                    args.clear = input("Clear existing data? (y/n): ").strip().lower() == 'y'
+                if args.clear:
                     if not populator.clear_existing_data():
                         return
+                    has_data = False
         except Exception as e:
             print(f"Error checking existing data: {e}")
             return
         
+        # Unique checks are only skipped when no existing row can collide with the generated ones
+        if not has_data:
+            populator.apply_bulk_load_settings(EMPTY_TABLE_SESSION_SETTINGS)
+        
         # Get number of employees
-        while True:
+        num_employees = args.employees
+        if num_employees is not None and num_employees <= 0:
+            print("Please enter a positive number.")
+            num_employees = None
+        while num_employees is None:
             try:
-                num_employees = int(input("\nEnter number of employees to generate: ").strip())
-                if num_employees > 0:
-                    break
+                value = int(input("\nEnter number of employees to generate: ").strip())
+                if value > 0:
+                    num_employees = value
                 else:
                     print("Please enter a positive number.")
             except ValueError:
                 print("Please enter a valid number.")
         
-        # Generate data
-        if not populator.generate_employee_data(num_employees):
-            return
-        
-        if not populator.generate_simulation_data():
-            return
+        # Generate data; ALTER TABLE commits implicitly, so indexes go before any rows
+        if args.drop_indexes:
+            populator._drop_secondary_indexes()
+        try:
+            if not populator.generate_employee_data(num_employees):
+                return
+            
+            if not populator.generate_simulation_data():
+                return
+        finally:
+            populator._recreate_indexes()
         
         # Display statistics
         populator.display_statistics()
@@ -5,10 +5,32 @@ Test script to verify consistent statistics across different employee counts
 
 import sys
 import os
+import math
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from database_populator import DatabasePopulator
 
+METRICS = ('phishing_click_rate', 'vishing_response_rate', 'quishing_scan_rate', 'physical_security_score', 'human_security_score')
+
+
+def summarize(values):
+    """Return mean, population standard deviation, min and max in one pass (Welford's algorithm)"""
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    low = math.inf
+    high = -math.inf
+    for x in values:
+        count += 1
+        delta = x - mean
+        mean += delta / count
+        m2 += delta * (x - mean)
+        if x < low:
+            low = x
+        if x > high:
+            high = x
+    return mean, math.sqrt(m2 / count), low, high
+
 def test_consistent_statistics():
     """Test that statistics remain consistent across different employee counts"""
     print("Testing Consistent Statistics Generation")
@@ -19,11 +41,13 @@ def test_consistent_statistics():
     # Test different employee counts
     employee_counts = [5, 10, 25, 50, 100]
     
-    all_stats = []
+    # One list of values per metric, filled as the stats are generated
+    metric_values = {metric: [] for metric in METRICS}
     
     for count in employee_counts:
         stats = dp.generate_consistent_statistics(count)
-        all_stats.append(stats)
+        for metric in METRICS:
+            metric_values[metric].append(stats[metric])
         
         print(f"\nEmployee Count: {count}")
         print(f"  Phishing Click Rate: {stats['phishing_click_rate']:.1f}%")
@@ -36,16 +60,13 @@ def test_consistent_statistics():
     print(f"\n{'='*50}")
     print("Consistency Analysis:")
     
-    for metric in ['phishing_click_rate', 'vishing_response_rate', 'quishing_scan_rate', 'physical_security_score', 'human_security_score']:
-        values = [stat[metric] for stat in all_stats]
-        avg = sum(values) / len(values)
-        variance = sum((x - avg) ** 2 for x in values) / len(values)
-        std_dev = variance ** 0.5
+    for metric, values in metric_values.items():
+        avg, std_dev, low, high = summarize(values)
         
         print(f"{metric.replace('_', ' ').title()}:")
         print(f"  Average: {avg:.2f}")
         print(f"  Standard Deviation: {std_dev:.2f}")
-        print(f"  Range: {min(values):.2f} - {max(values):.2f}")
+        print(f"  Range: {low:.2f} - {high:.2f}")
         
         if std_dev < 2.0:  # Within 2 units
             print(f"  ✓ CONSISTENT (std dev < 2.0)")
@@ -15,19 +15,29 @@ from faker import Faker
 import unittest
 from unittest.mock import patch, MagicMock
 
+# Shared Faker with the Indian provider registered once for every test
+fake = Faker()
+fake.add_provider(IndianDataProvider)
+INDIAN_CITIES = frozenset(IndianDataProvider.indian_cities)
+INDIAN_PHONE_PREFIX = '+91'
+
+# Fragments each database type's employee_master DDL must contain
+EMPLOYEE_SQL_MARKERS = {
+    'mysql': ('AUTO_INCREMENT', 'ENGINE=InnoDB'),
+    'postgresql': ('SERIAL', 'employee_id INT UNIQUE'),
+}
+
 
 class TestDatabasePopulator(unittest.TestCase):
     """Test cases for DatabasePopulator functionality"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.populator = DatabasePopulator()
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures once; every test sets db_type before relying on it"""
+        cls.populator = DatabasePopulator()
     
     def test_indian_data_provider(self):
         """Test Indian data provider generates expected data"""
-        fake = Faker()
-        fake.add_provider(IndianDataProvider)
-        
         # Test Indian name generation
         name = fake.indian_name()
         self.assertIsInstance(name, str)
@@ -36,34 +46,39 @@ class TestDatabasePopulator(unittest.TestCase):
         # Test Indian phone generation
         phone = fake.indian_phone()
         self.assertIsInstance(phone, str)
-        self.assertTrue(phone.startswith('+91'))
+        self.assertTrue(phone.startswith(INDIAN_PHONE_PREFIX))
         
         # Test Indian city generation
         city = fake.indian_city()
         self.assertIsInstance(city, str)
-        self.assertIn(city, IndianDataProvider.indian_cities)
+        self.assertIn(city, INDIAN_CITIES)
     
-    def test_database_type_validation(self):
-        """Test database type is set correctly"""
-        self.populator.db_type = 'mysql'
-        self.assertEqual(self.populator.db_type, 'mysql')
+    def test_bulk_generation(self):
+        """Test bulk name and phone generation matches the provider's formats"""
+        names = self.populator.bulk_generate_names(50)
+        phones = self.populator.bulk_generate_phones(50)
+        self.assertEqual(len(names), 50)
+        self.assertEqual(len(phones), 50)
         
-        self.populator.db_type = 'postgresql'
-        self.assertEqual(self.populator.db_type, 'postgresql')
+        for name in names:
+            first_name, last_name = name.split(' ')
+            self.assertIn(first_name, IndianDataProvider.indian_first_names)
+            self.assertIn(last_name, IndianDataProvider.indian_last_names)
+        
+        for phone in phones:
+            self.assertTrue(phone.startswith(INDIAN_PHONE_PREFIX + ' '))
+            self.assertEqual(len(phone), 14)
     
     def test_table_sql_generation(self):
-        """Test SQL generation for different database types"""
-        # Test MySQL SQL generation
-        self.populator.db_type = 'mysql'
-        employees_sql = self.populator._get_employee_master_table_sql()
-        self.assertIn('AUTO_INCREMENT', employees_sql)
-        self.assertIn('ENGINE=InnoDB', employees_sql)
-        
-        # Test PostgreSQL SQL generation
-        self.populator.db_type = 'postgresql'
-        employees_sql = self.populator._get_employee_master_table_sql()
-        self.assertIn('SERIAL', employees_sql)
-        self.assertIn('employee_id INT UNIQUE', employees_sql)
+        """Test database type selection and SQL generation for each database type"""
+        for db_type, markers in EMPLOYEE_SQL_MARKERS.items():
+            with self.subTest(db_type=db_type):
+                self.populator.db_type = db_type
+                self.assertEqual(self.populator.db_type, db_type)
+                
+                employees_sql = self.populator._get_employee_master_table_sql()
+                for marker in markers:
+                    self.assertIn(marker, employees_sql)
     
     def test_get_yes_no_input_mock(self):
         """Test yes/no input function with mocked input"""
@@ -83,46 +98,29 @@ class TestDatabasePopulator(unittest.TestCase):
             result = get_yes_no_input("Test prompt")
             self.assertFalse(result)
 
-
-def test_data_generation():
-    """Test data generation without database connection"""
-    print("Testing data generation logic...")
     
-    populator = DatabasePopulator()
-    
-    # Test employee data structure
-    fake = populator.fake
-    
-    departments = ['IT Security', 'Human Resources', 'Finance', 'Operations', 'Marketing', 'Sales']
-    positions = ['Analyst', 'Manager', 'Coordinator', 'Specialist', 'Executive', 'Director']
-    
-    print("Sample employee data:")
-    for i in range(3):
-        employee_id = f"FISST{str(i+1).zfill(4)}"
-        name = fake.indian_name()
-        email = f"{name.lower().replace(' ', '.')}@fisst.edu"
-        phone = fake.indian_phone()
-        city = fake.indian_city()
+    def test_data_generation_smoke(self):
+        """Test data generation without database connection"""
+        print("Testing data generation logic...")
         
-        print(f"  {employee_id}: {name}, {email}, {phone}, {city}")
-    
-    print("✓ Employee data generation test passed!")
-
-
-def main():
-    """Run all tests"""
-    print("Running Database Populator Tests")
-    print("=" * 40)
-    
-    # Run unit tests
-    unittest.main(argv=[''], exit=False, verbosity=2)
-    
-    # Run additional tests
-    test_data_generation()
-    
-    print("\n" + "=" * 40)
-    print("All tests completed!")
+        # Test employee data structure
+        fake = self.populator.fake
+        
+        departments = ['IT Security', 'Human Resources', 'Finance', 'Operations', 'Marketing', 'Sales']
+        positions = ['Analyst', 'Manager', 'Coordinator', 'Specialist', 'Executive', 'Director']
+        
+        # Resolve the provider methods once instead of through Faker's proxy on every call
+        indian_name, indian_phone, indian_city = fake.indian_name, fake.indian_phone, fake.indian_city
+        samples = [(f"FISST{i + 1:04d}", indian_name(), indian_phone(), indian_city()) for i in range(3)]
+        
+        print("Sample employee data:")
+        for employee_id, name, phone, city in samples:
+            email = f"{name.lower().replace(' ', '.')}@fisst.edu"
+            print(f"  {employee_id}: {name}, {email}, {phone}, {city}")
+        
+        print("✓ Employee data generation test passed!")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # unittest discovers every test once, including the data generation smoke test
+    unittest.main(verbosity=2)
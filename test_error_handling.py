@@ -5,8 +5,10 @@ Test script to demonstrate the improved error handling
 
 import sys
 import os
+from unittest.mock import patch
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import mysql.connector
 from database_populator import DatabasePopulator
 
 def test_error_scenarios():
@@ -26,7 +28,11 @@ def test_error_scenarios():
         'username': 'wrong_user',
         'password': 'wrong_password'
     }
-    populator.connect_to_database(config1)
+    # The driver is patched so each scenario fails immediately instead of waiting on the network
+    access_denied = mysql.connector.errors.ProgrammingError(
+        msg="Access denied for user 'wrong_user'@'localhost' (using password: YES)", errno=1045)
+    with patch('mysql.connector.connect', side_effect=access_denied):
+        populator.connect_to_database(config1)
     
     # Test 2: Connection refused error
     print("\n" + "="*50)
@@ -38,12 +44,17 @@ def test_error_scenarios():
         'username': 'root',
         'password': 'password'
     }
-    populator.connect_to_database(config2)
+    connection_refused = mysql.connector.errors.DatabaseError(
+        msg="Can't connect to MySQL server on 'nonexistent.host.com:3306'", errno=2003)
+    with patch('mysql.connector.connect', side_effect=connection_refused):
+        populator.connect_to_database(config2)
     
     # Test 3: Unknown database error
     print("\n" + "="*50)
     print("3. Testing Unknown Database Error:")
-    # This will be simulated by the error message matching
+    unknown_database = mysql.connector.errors.ProgrammingError(msg="Unknown database 'test_db'", errno=1049)
+    with patch('mysql.connector.connect', side_effect=unknown_database):
+        populator.connect_to_database({**config2, 'host': 'localhost'})
     
     print("\n" + "="*50)
     print("✅ Error handling demonstration complete!")
@@ -4,16 +4,74 @@ Test script to verify the 5 tables are created correctly and populated with data
 Tests the main database_populator.py script functionality.
 """
 
+import atexit
 import sqlite3
 import sys
 import os
 from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain
 
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from database_populator import DatabasePopulator
 
+# Bulk-load tuning for the test connection; WAL and sync settings only apply to file databases
+MEMORY_DB_PRAGMAS = (
+    ('temp_store', 'MEMORY'),
+    ('cache_size', -64000),
+)
+FILE_DB_PRAGMAS = (
+    ('journal_mode', 'WAL'),
+    ('synchronous', 'NORMAL'),
+    ('mmap_size', 268435456),
+) + MEMORY_DB_PRAGMAS
+
+# Named shared-cache in-memory database: every connection in the process (and any thread) sees the same tables
+SHARED_MEMORY_DB_URI = 'file:populator_test?mode=memory&cache=shared'
+
+# Bound parameters per statement on SQLite builds older than 3.32
+SQLITE_MAX_VARIABLES = 999
+
+# Populated tables, children before employee_master so rows can be cleared in order
+TEST_TABLES = (
+    'red_team_assessment',
+    'employee_quishing_sim',
+    'employee_vishing_sim',
+    'employee_phish_smish_sim',
+    'employee_master',
+)
+
+# Row counts for every populated table in a single statement
+TABLE_DESCRIPTIONS = {
+    'employee_master': 'employees',
+    'employee_phish_smish_sim': 'phish/smish simulations',
+    'employee_vishing_sim': 'vishing simulations',
+    'employee_quishing_sim': 'quishing simulations',
+    'red_team_assessment': 'red team assessments'
+}
+TABLE_COUNTS_SQL = "SELECT " + ", ".join(f"(SELECT COUNT(*) FROM {table})" for table in TABLE_DESCRIPTIONS)
+
+# Empty-value counts for every required employee_master column in one scan
+REQUIRED_EMPLOYEE_FIELDS = (
+    'employee_id', 'first_name', 'last_name', 'email',
+    'phone_number', 'department', 'designation'
+)
+EMPTY_FIELD_COUNTS_SQL = "SELECT " + ", ".join(
+    f"COUNT(CASE WHEN {field} IS NULL OR {field} = '' THEN 1 END)" for field in REQUIRED_EMPLOYEE_FIELDS
+) + " FROM employee_master"
+
+# Indexes built after the bulk load instead of being maintained on every INSERT
+# (index name, table, column, unique)
+DEFERRED_INDEXES = (
+    ('idx_emp_id', 'employee_master', 'employee_id', True),
+    ('idx_phish_smish_emp', 'employee_phish_smish_sim', 'employee_id', False),
+    ('idx_vishing_emp', 'employee_vishing_sim', 'employee_id', False),
+    ('idx_quishing_emp', 'employee_quishing_sim', 'employee_id', False),
+    ('idx_red_team_emp', 'red_team_assessment', 'employee_id', False),
+)
+
 
 class SQLiteTestPopulator(DatabasePopulator):
     """SQLite version of DatabasePopulator for testing"""
@@ -21,25 +79,85 @@ class SQLiteTestPopulator(DatabasePopulator):
     def __init__(self):
         super().__init__()
         self.db_type = 'sqlite'  # Use SQLite for testing
+        # Built INSERT statements keyed by (table, rows) so repeated chunks reuse one string
+        self.insert_statements = {}
         
-    def connect_to_test_database(self):
-        """Connect to in-memory SQLite database for testing"""
+    def connect_to_test_database(self, database=':memory:'):
+        """Connect to an SQLite database for testing (in-memory by default)"""
         try:
-            self.connection = sqlite3.connect(':memory:')
+            # isolation_level=None: no implicit BEGINs from the driver, transactions are opened explicitly
+            if database == ':memory:':
+                self.connection = sqlite3.connect(
+                    SHARED_MEMORY_DB_URI, uri=True, check_same_thread=False, isolation_level=None
+                )
+            else:
+                self.connection = sqlite3.connect(database, isolation_level=None)
             self.connection.row_factory = sqlite3.Row  # Enable dict-like access
             self.cursor = self.connection.cursor()
-            print("✓ Connected to in-memory SQLite database for testing")
+            self._apply_pragmas(MEMORY_DB_PRAGMAS if database == ':memory:' else FILE_DB_PRAGMAS)
+            self.cursor.execute("PRAGMA foreign_keys = ON")
+            print(f"✓ Connected to {'in-memory' if database == ':memory:' else database} SQLite database for testing")
             return True
         except Exception as e:
             print(f"✗ Failed to connect to test database: {e}")
             return False
     
+    def _apply_pragmas(self, pragmas):
+        """Set the bulk-load PRAGMAs and report the values SQLite actually applied"""
+        for name, value in pragmas:
+            self.cursor.execute(f"PRAGMA {name} = {value}")
+        effective = ", ".join(f"{name}={self.cursor.execute(f'PRAGMA {name}').fetchone()[0]}" for name, _ in pragmas)
+        print(f"✓ SQLite PRAGMAs: {effective}")
+    
+    def get_missing_tables(self):
+        """Split the required tables into missing and existing with one sqlite_master query"""
+        existing = {row[0] for row in self.cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        missing_tables = [table for table in reversed(TEST_TABLES) if table not in existing]
+        existing_tables = [table for table in reversed(TEST_TABLES) if table in existing]
+        return missing_tables, existing_tables
+    
+    def _bulk_insert(self, table, columns, rows):
+        """Insert rows with multi-row VALUES statements sized to SQLite's parameter limit"""
+        chunk_rows = max(1, SQLITE_MAX_VARIABLES // len(columns))
+        for start in range(0, len(rows), chunk_rows):
+            chunk = rows[start:start + chunk_rows]
+            self.cursor.execute(self._insert_sql(table, columns, len(chunk)), list(chain.from_iterable(chunk)))
+    
+    def _insert_sql(self, table, columns, rows):
+        """Build, once per table and row count, a multi-row INSERT for SQLite"""
+        key = (table, rows)
+        sql = self.insert_statements.get(key)
+        if sql is None:
+            row_placeholders = f"({', '.join(['?'] * len(columns))})"
+            sql = self.insert_statements[key] = (
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES {', '.join([row_placeholders] * rows)}"
+            )
+        return sql
+    
+    def create_deferred_indexes(self):
+        """Build the employee_id indexes once the rows are in"""
+        for name, table, column, unique in DEFERRED_INDEXES:
+            self.cursor.execute(f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {name} ON {table} ({column})")
+    
+    def check_foreign_keys(self):
+        """Return every child row whose employee_id has no employee_master parent"""
+        return self.cursor.execute("PRAGMA foreign_key_check").fetchall()
+    
+    def _reset(self):
+        """Empty the tables and drop the deferred indexes so the next test loads from scratch"""
+        self.cursor.execute("BEGIN")
+        for name, _, _, _ in DEFERRED_INDEXES:
+            self.cursor.execute(f"DROP INDEX IF EXISTS {name}")
+        for table in TEST_TABLES:
+            self.cursor.execute(f"DELETE FROM {table}")
+        self.connection.commit()
+    
     def _get_employee_master_table_sql(self):
         """SQLite version of employee_master table"""
         return """
         CREATE TABLE IF NOT EXISTS employee_master (
             serial_no INTEGER PRIMARY KEY AUTOINCREMENT,
-            employee_id VARCHAR(20) UNIQUE NOT NULL,
+            employee_id VARCHAR(20) NOT NULL,  -- unique index added after the load
             first_name VARCHAR(50) NOT NULL,
             last_name VARCHAR(50) NOT NULL,
             gender CHAR(1),
@@ -190,22 +308,50 @@ class SQLiteTestPopulator(DatabasePopulator):
         """
 
 
+@lru_cache(maxsize=None)
+def shared_test_populator():
+    """Connect and create the tables once; every test in this module reuses the database"""
+    populator = SQLiteTestPopulator()
+    
+    if not populator.connect_to_test_database():
+        raise Exception("Could not connect to test database")
+    atexit.register(populator.close_connection)
+    
+    if not populator.create_tables():
+        raise Exception("Could not create tables")
+    
+    return populator
+
+
 @contextmanager
 def test_database_populator(num_employees):
     """Context manager for testing database populator"""
-    populator = SQLiteTestPopulator()
+    populator = shared_test_populator()
     
+    # Parents load before children, so per-row FK lookups are skipped and checked once at teardown.
+    # The PRAGMA is a no-op inside a transaction, so it is switched before BEGIN and after commit.
+    populator.connection.execute("PRAGMA foreign_keys = OFF")
+    populator._reset()
+    
+    # All generate_* calls share one transaction; their own commits are skipped until teardown
+    populator.connection.execute("BEGIN")
+    populator.in_bulk_load = True
     try:
-        if not populator.connect_to_test_database():
-            raise Exception("Could not connect to test database")
-        
-        if not populator.create_tables():
-            raise Exception("Could not create tables")
-        
         yield populator, num_employees
-        
+    except BaseException:
+        populator.connection.rollback()
+        raise
+    else:
+        # foreign_key_check needs the unique parent index, so it runs after the deferred indexes
+        populator.create_deferred_indexes()
+        violations = populator.check_foreign_keys()
+        if violations:
+            populator.connection.rollback()
+            raise AssertionError(f"{len(violations)} rows reference a missing employee_master row")
+        populator.connection.commit()
     finally:
-        populator.close_connection()
+        populator.in_bulk_load = False
+        populator.connection.execute("PRAGMA foreign_keys = ON")
 
 
 def test_table_creation():
@@ -213,18 +359,11 @@ def test_table_creation():
     print("=== Testing Table Creation ===")
     
     with test_database_populator(10) as (populator, _):
-        # Check that all 5 tables exist
-        expected_tables = [
-            'employee_master',
-            'employee_phish_smish_sim', 
-            'employee_vishing_sim',
-            'employee_quishing_sim',
-            'red_team_assessment'
-        ]
+        # Check that all 5 tables exist with one sqlite_master lookup
+        missing_tables, existing_tables = populator.get_missing_tables()
+        assert not missing_tables, f"Missing tables: {', '.join(missing_tables)}"
         
-        for table in expected_tables:
-            populator.cursor.execute(f"SELECT COUNT(*) FROM {table}")
-            result = populator.cursor.fetchone()
+        for table in existing_tables:
             print(f"✓ Table {table} exists and accessible")
         
         print("✓ All 5 tables created successfully!")
@@ -271,18 +410,9 @@ def test_data_generation():
         print("✓ Generated red team assessments")
         
         # Verify all tables have data
-        tables = {
-            'employee_master': 'employees',
-            'employee_phish_smish_sim': 'phish/smish simulations',
-            'employee_vishing_sim': 'vishing simulations',
-            'employee_quishing_sim': 'quishing simulations',
-            'red_team_assessment': 'red team assessments'
-        }
-        
         print("\n=== Data Verification ===")
-        for table, description in tables.items():
-            populator.cursor.execute(f"SELECT COUNT(*) FROM {table}")
-            count = populator.cursor.fetchone()[0]
+        counts = populator.cursor.execute(TABLE_COUNTS_SQL).fetchone()
+        for description, count in zip(TABLE_DESCRIPTIONS.values(), counts):
             print(f"✓ {description}: {count} records")
         
         return True
@@ -304,17 +434,8 @@ def test_data_completeness():
         populator.generate_red_team_assessments(employee_ids)
         
         # Check for empty required fields in employee_master
-        required_fields = [
-            'employee_id', 'first_name', 'last_name', 'email', 
-            'phone_number', 'department', 'designation'
-        ]
-        
-        for field in required_fields:
-            populator.cursor.execute(f"""
-                SELECT COUNT(*) FROM employee_master 
-                WHERE {field} IS NULL OR {field} = ''
-            """)
-            null_count = populator.cursor.fetchone()[0]
+        empty_counts = populator.cursor.execute(EMPTY_FIELD_COUNTS_SQL).fetchone()
+        for field, null_count in zip(REQUIRED_EMPLOYEE_FIELDS, empty_counts):
             if null_count > 0:
                 print(f"✗ Found {null_count} empty {field} values")
                 return False
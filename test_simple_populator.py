@@ -61,16 +61,13 @@ def test_consistency():
     """Test that statistics are consistent"""
     print("\nTesting statistical consistency...")
     
-    # Set seeds for reproducibility
-    random.seed(42)
-    Faker.seed(42)
+    # Private seeded generator: reproducible without touching the global random/Faker state
+    rng = random.Random(42)
+    uniform = rng.uniform
     
     # Generate test data
-    rates = []
-    for i in range(100):
-        base_rate = 23.1
-        rate = round(random.uniform(base_rate - 2, base_rate + 2), 2)
-        rates.append(rate)
+    base_rate = 23.1
+    rates = [round(uniform(base_rate - 2, base_rate + 2), 2) for _ in range(100)]
     
     avg_rate = sum(rates) / len(rates)
     print(f"Average rate from 100 samples: {avg_rate:.2f}%")
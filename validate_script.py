@@ -7,6 +7,11 @@ Tests data generation and validates that all columns are properly filled.
 import sys
 import os
 import random
+import re
+import io
+import traceback
+from contextlib import nullcontext, redirect_stdout
+from operator import itemgetter
 from decimal import Decimal
 
 # Add the current directory to Python path
@@ -15,6 +20,11 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from database_populator import DatabasePopulator, IndianDataProvider
 from faker import Faker
 
+INSERT_TABLE_RE = re.compile(r"insert\s+into\s+(\w+)", re.IGNORECASE)
+
+# Per-test output is only shown for failures unless POPULATOR_TEST_VERBOSE=1
+VERBOSE = os.environ.get("POPULATOR_TEST_VERBOSE") == "1"
+
 
 class MockCursor:
     """Mock cursor for testing SQL generation without database"""
@@ -29,6 +39,8 @@ class MockCursor:
             'employee_quishing_sim': [],
             'red_team_assessment': []
         }
+        # Bound list.extend per table so executemany is one dict lookup and one C-level call
+        self._extend = {table: rows.extend for table, rows in self.tables.items()}
     
     def execute(self, sql, params=None):
         self.executed_sqls.append(sql)
@@ -41,25 +53,21 @@ class MockCursor:
         self.executed_sqls.append(sql)
         table_name = self._extract_table_name(sql)
         if table_name:
-            self.tables[table_name].extend(data_list)
+            self._extend[table_name](data_list)
         return True
     
     def fetchone(self):
-        # Return mock data for count queries
-        return {'count': len(self.tables.get('employee_master', []))}
+        # Return mock data for count queries, shaped like a plain DB-API row
+        return (len(self.tables.get('employee_master', [])),)
     
     def fetchall(self):
-        # Return mock employee IDs
-        return [{'employee_id': f'FISST{i+1:04d}'} for i in range(len(self.tables.get('employee_master', [])))]
+        # Return mock employee IDs as one-element tuples
+        return [(f'FISST{i+1:04d}',) for i in range(len(self.tables.get('employee_master', [])))]
     
     def _extract_table_name(self, sql):
         """Extract table name from INSERT SQL"""
-        sql_lower = sql.lower()
-        if 'insert into' in sql_lower:
-            start = sql_lower.find('insert into') + len('insert into')
-            end = sql_lower.find('(', start)
-            return sql_lower[start:end].strip()
-        return None
+        match = INSERT_TABLE_RE.search(sql)
+        return match.group(1).lower() if match else None
     
     def close(self):
         pass
@@ -141,13 +149,10 @@ def validate_table_sql():
     return True
 
 
-def validate_data_generation():
-    """Validate that data generation works for all tables"""
+def validate_data_generation(populator, num_employees=5):
+    """Validate that data generation works for all tables, leaving the data on populator for later checks"""
     print("\n=== Validating Data Generation ===")
     
-    populator = ValidationPopulator()
-    num_employees = 5
-    
     # Test employee generation
     if not populator.generate_employees(num_employees):
         print("✗ Employee generation failed")
@@ -198,21 +203,10 @@ def validate_data_generation():
     return True
 
 
-def validate_data_completeness():
-    """Validate that all required fields are filled"""
+def validate_data_completeness(populator):
+    """Validate that all required fields are filled in the data generated on populator"""
     print("\n=== Validating Data Completeness ===")
     
-    populator = ValidationPopulator()
-    num_employees = 3
-    
-    # Generate data
-    populator.generate_employees(num_employees)
-    employee_ids = [f'FISST{i+1:04d}' for i in range(num_employees)]
-    populator.generate_phish_smish_simulations(employee_ids)
-    populator.generate_vishing_simulations(employee_ids)
-    populator.generate_quishing_simulations(employee_ids)
-    populator.generate_red_team_assessments(employee_ids)
-    
     # Check employee_master data completeness
     employee_data = populator.cursor.tables['employee_master']
     
@@ -231,22 +225,28 @@ def validate_data_completeness():
         'designation': 14
     }
     
+    # itemgetter pulls all required fields of a record in one C-level call
+    required_values = itemgetter(*required_fields_positions.values())
+    last_required_position = max(required_fields_positions.values())
+    
     for employee_record in employee_data:
-        for field_name, position in required_fields_positions.items():
-            if position >= len(employee_record) or not employee_record[position]:
-                print(f"✗ Missing or empty {field_name} in employee record")
-                return False
+        if len(employee_record) <= last_required_position or not all(required_values(employee_record)):
+            field_name = next(
+                name for name, position in required_fields_positions.items()
+                if position >= len(employee_record) or not employee_record[position]
+            )
+            print(f"✗ Missing or empty {field_name} in employee record")
+            return False
     
     print(f"✓ All {len(employee_data)} employee records have complete required fields")
     
     # Check that optional fields are also filled (no None values)
     all_fields_filled = True
     for employee_record in employee_data:
-        for i, value in enumerate(employee_record):
-            if value is None:
-                print(f"✗ Field at position {i} is None in employee record")
-                all_fields_filled = False
-                break
+        # Tuple containment scans in C; the position is only looked up for a failing record
+        if None in employee_record:
+            print(f"✗ Field at position {employee_record.index(None)} is None in employee record")
+            all_fields_filled = False
     
     if all_fields_filled:
         print("✓ All employee fields are properly filled (no None values)")
@@ -270,57 +270,52 @@ def validate_data_completeness():
     return all_fields_filled
 
 
-def validate_data_types_and_ranges():
-    """Validate that data types and value ranges are appropriate"""
+def validate_data_types_and_ranges(populator):
+    """Validate that data types and value ranges of the data generated on populator are appropriate"""
     print("\n=== Validating Data Types and Ranges ===")
     
-    populator = ValidationPopulator()
-    num_employees = 3
-    
-    # Generate data
-    populator.generate_employees(num_employees)
     employee_data = populator.cursor.tables['employee_master']
     
     if not employee_data:
         print("✗ No employee data to validate")
         return False
     
-    # Check specific data type constraints
-    for i, employee_record in enumerate(employee_data):
-        # Check employee_id format (should be FISST####)
-        employee_id = employee_record[0]
-        if not (employee_id.startswith('FISST') and len(employee_id) == 9):
-            print(f"✗ Employee {i}: Invalid employee_id format: {employee_id}")
-            return False
-        
-        # Check age is reasonable (should be between 22 and 65)
-        age = employee_record[5]
-        if not (22 <= age <= 65):
-            print(f"✗ Employee {i}: Invalid age: {age}")
-            return False
-        
-        # Check salary is reasonable (should be positive)
-        salary = employee_record[16]
-        if salary <= 0:
-            print(f"✗ Employee {i}: Invalid salary: {salary}")
-            return False
-        
-        # Check email format (should contain @)
-        email = employee_record[8]
-        if '@' not in email:
-            print(f"✗ Employee {i}: Invalid email format: {email}")
-            return False
+    # Check specific data type constraints one column at a time
+    columns = list(zip(*employee_data))
+    employee_ids, ages, emails, salaries = columns[0], columns[5], columns[8], columns[16]
+    
+    # Check employee_id format (should be FISST####)
+    if not all(employee_id.startswith('FISST') and len(employee_id) == 9 for employee_id in employee_ids):
+        invalid = next(employee_id for employee_id in employee_ids
+                       if not (employee_id.startswith('FISST') and len(employee_id) == 9))
+        print(f"✗ Invalid employee_id format: {invalid}")
+        return False
+    
+    # Check age is reasonable (should be between 22 and 65)
+    if not (22 <= min(ages) and max(ages) <= 65):
+        print(f"✗ Invalid age range: {min(ages)}-{max(ages)}")
+        return False
+    
+    # Check salary is reasonable (should be positive)
+    if min(salaries) <= 0:
+        print(f"✗ Invalid salary: {min(salaries)}")
+        return False
+    
+    # Check email format (should contain @)
+    if not all('@' in email for email in emails):
+        invalid = next(email for email in emails if '@' not in email)
+        print(f"✗ Invalid email format: {invalid}")
+        return False
     
     print("✓ All data types and ranges are valid")
     
     # Check rate ranges for simulations
     phish_data = populator.cursor.tables['employee_phish_smish_sim']
     if phish_data:
-        for record in phish_data:
-            click_rate = record[4]  # click_response_rate position
-            if not (0 <= click_rate <= 100):
-                print(f"✗ Invalid click response rate: {click_rate}")
-                return False
+        click_rates = [record[4] for record in phish_data]  # click_response_rate position
+        if not (0 <= min(click_rates) and max(click_rates) <= 100):
+            print(f"✗ Invalid click response rate range: {min(click_rates)}-{max(click_rates)}")
+            return False
         print("✓ Phishing simulation rates are in valid range (0-100%)")
     
     return True
@@ -331,26 +326,34 @@ def main():
     print("Database Populator Validation Suite")
     print("=" * 50)
     
+    # Generated once by validate_data_generation, then inspected by the later checks
+    populator = ValidationPopulator()
     tests = [
-        validate_table_sql,
-        validate_data_generation,
-        validate_data_completeness,
-        validate_data_types_and_ranges
+        (validate_table_sql, ()),
+        (validate_data_generation, (populator,)),
+        (validate_data_completeness, (populator,)),
+        (validate_data_types_and_ranges, (populator,))
     ]
     
     passed = 0
     total = len(tests)
     
-    for test in tests:
+    for test, args in tests:
+        buffer = io.StringIO()
         try:
-            if test():
-                passed += 1
-            else:
-                print(f"✗ Test {test.__name__} failed")
+            with nullcontext() if VERBOSE else redirect_stdout(buffer):
+                result = test(*args)
         except Exception as e:
+            sys.stdout.write(buffer.getvalue())
             print(f"✗ Test {test.__name__} failed with exception: {e}")
-            import traceback
             traceback.print_exc()
+            continue
+        
+        if result:
+            passed += 1
+        else:
+            sys.stdout.write(buffer.getvalue())
+            print(f"✗ Test {test.__name__} failed")
     
     print(f"\n=== Validation Summary ===")
     print(f"Passed: {passed}/{total}")